@@ -14,6 +14,7 @@ from airbyte_cdk.sources.concurrent_source.stream_thread_exception import Stream
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -91,7 +92,7 @@ class ConcurrentReadProcessor:
         This method is called when a partition is generated.
         1. Add the partition to the set of partitions for the stream
         2. Log the slice if necessary
-        3. Submit the partition to the thread pool manager
+        3. Submit the partition to the thread pool manager along with the cursor of the stream
         """
         stream_name = partition.stream_name()
         self._streams_to_running_partitions[stream_name].add(partition)
@@ -99,14 +100,18 @@ class ConcurrentReadProcessor:
             self._message_repository.emit_message(
                 self._slice_logger.create_slice_log_message(partition.to_slice())
             )
-        self._thread_pool_manager.submit(self._partition_reader.process_partition, partition)
+        self._thread_pool_manager.submit(
+            self._partition_reader.process_partition,
+            partition,
+            self._stream_name_to_instance[stream_name].cursor,
+        )
 
     def on_partition_complete_sentinel(
         self, sentinel: PartitionCompleteSentinel
     ) -> Iterable[AirbyteMessage]:
         """
         This method is called when a partition is completed.
-        1. Close the partition
+        1. Ensures the cursor knows the most recent record of the partition has been emitted and close the partition
         2. If the stream is done, mark it as such and return a stream status message
         3. Emit messages that were added to the message repository
         """
@@ -115,6 +120,8 @@ class ConcurrentReadProcessor:
         try:
             if sentinel.is_successful:
                 stream = self._stream_name_to_instance[partition.stream_name()]
+                if sentinel.most_recent_record:
+                    stream.cursor.observe(sentinel.most_recent_record)
                 stream.cursor.close_partition(partition)
         except Exception as exception:
             self._flag_exception(partition.stream_name(), exception)
@@ -139,9 +146,11 @@ class ConcurrentReadProcessor:
         1. Convert the record to an AirbyteMessage
         2. If this is the first record for the stream, mark the stream as RUNNING
         3. Increment the record counter for the stream
-        4. Ensures the cursor knows the record has been successfully emitted
-        5. Emit the message
-        6. Emit messages that were added to the message repository
+        4. Emit the message
+        5. Emit messages that were added to the message repository
+
+        Cursors extracting cursor values observe the most recent record of the partition once the partition is completed.
+        The other ones observe every record as it is emitted.
         """
         # Do not pass a transformer or a schema
         # AbstractStreams are expected to return data as they are expected.
@@ -150,6 +159,7 @@ class ConcurrentReadProcessor:
             stream_name=record.stream_name,
             data_or_message=record.data,
             file_reference=record.file_reference,
+            owned=record.owned,
         )
         stream = self._stream_name_to_instance[record.stream_name]
 
@@ -160,7 +170,8 @@ class ConcurrentReadProcessor:
                     stream.as_airbyte_stream(), AirbyteStreamStatus.RUNNING
                 )
             self._record_counter[stream.name] += 1
-            stream.cursor.observe(record)
+            if not _extracts_cursor_values(stream.cursor):
+                stream.cursor.observe(record)
         yield message
         yield from self._message_repository.consume_queue()
 
@@ -253,3 +264,8 @@ class ConcurrentReadProcessor:
             else AirbyteStreamStatus.COMPLETE
         )
         yield stream_status_as_airbyte_message(stream.as_airbyte_stream(), stream_status)
+
+
+def _extracts_cursor_values(cursor: Cursor) -> bool:
+    # cursors implemented before `extract_cursor_value` was added only rely on `observe`
+    return getattr(type(cursor), "extract_cursor_value", None) is not Cursor.extract_cursor_value
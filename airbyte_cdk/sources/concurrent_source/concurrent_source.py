@@ -3,11 +3,13 @@
 #
 import concurrent
 import logging
+import time
 from queue import Queue
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator, List, Optional
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import MemoryBoundedQueue
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
 )
@@ -22,6 +24,10 @@ from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
 )
+from airbyte_cdk.sources.streams.concurrent.process_partition_reader import (
+    ProcessPartitionFactory,
+    ProcessPartitionReader,
+)
 from airbyte_cdk.sources.types import Record
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
 
@@ -35,6 +41,8 @@ class ConcurrentSource:
     """
 
     DEFAULT_TIMEOUT_SECONDS = 900
+    DEFAULT_MAX_QUEUE_SIZE = 10_000
+    QUEUE_METRICS_INTERVAL_SECONDS = 60
 
     @staticmethod
     def create(
@@ -44,6 +52,9 @@ class ConcurrentSource:
         slice_logger: SliceLogger,
         message_repository: MessageRepository,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size_in_bytes: Optional[int] = None,
+        record_batch_size: int = 1,
+        process_partition_factory: Optional[ProcessPartitionFactory] = None,
     ) -> "ConcurrentSource":
         is_single_threaded = initial_number_of_partitions_to_generate == 1 and num_workers == 1
         too_many_generator = (
@@ -65,6 +76,10 @@ class ConcurrentSource:
             message_repository,
             initial_number_of_partitions_to_generate,
             timeout_seconds,
+            max_queue_size_in_bytes,
+            record_batch_size,
+            process_partition_factory,
+            num_workers,
         )
 
     def __init__(
@@ -75,6 +90,10 @@ class ConcurrentSource:
         message_repository: MessageRepository = InMemoryMessageRepository(),
         initial_number_partitions_to_generate: int = 1,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
+        max_queue_size_in_bytes: Optional[int] = None,
+        record_batch_size: int = 1,
+        process_partition_factory: Optional[ProcessPartitionFactory] = None,
+        max_worker_processes: int = 1,
     ) -> None:
         """
         :param threadpool: The threadpool to submit tasks to
@@ -83,6 +102,10 @@ class ConcurrentSource:
         :param message_repository: The repository to emit messages to
         :param initial_number_partitions_to_generate: The initial number of concurrent partition generation tasks. Limiting this number ensures will limit the latency of the first records emitted. While the latency is not critical, emitting the records early allows the platform and the destination to process them as early as possible.
         :param timeout_seconds: The maximum number of seconds to wait for a record to be read from the queue. If no record is read within this time, the source will stop reading and return.
+        :param max_queue_size_in_bytes: If provided, the queue between the workers and the main thread is bounded by the estimated size of the records it holds instead of the number of items
+        :param record_batch_size: The number of records the workers put in the queue as a single item. Batching reduces the contention on the queue when there are many workers
+        :param process_partition_factory: If provided, the partitions are read in a pool of worker processes creating them with this factory to avoid being limited by the GIL for CPU-bound streams. See ProcessPartitionReader for the limitations
+        :param max_worker_processes: The number of worker processes reading partitions when a process_partition_factory is provided
         """
         self._threadpool = threadpool
         self._logger = logger
@@ -90,6 +113,10 @@ class ConcurrentSource:
         self._message_repository = message_repository
         self._initial_number_partitions_to_generate = initial_number_partitions_to_generate
         self._timeout_seconds = timeout_seconds
+        self._max_queue_size_in_bytes = max_queue_size_in_bytes
+        self._record_batch_size = record_batch_size
+        self._process_partition_factory = process_partition_factory
+        self._max_worker_processes = max_worker_processes
 
     def read(
         self,
@@ -97,11 +124,8 @@ class ConcurrentSource:
     ) -> Iterator[AirbyteMessage]:
         self._logger.info("Starting syncing")
 
-        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
-        # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
-        # partitions which would fill the queue. This number is arbitrarily set to 10_000 but will probably need to be changed given more
-        # information and might even need to be configurable depending on the source
-        queue: Queue[QueueItem] = Queue(maxsize=10_000)
+        queue = self._create_queue()
+        partition_reader = self._create_partition_reader(queue)
         concurrent_stream_processor = ConcurrentReadProcessor(
             streams,
             PartitionEnqueuer(queue, self._threadpool),
@@ -109,20 +133,47 @@ class ConcurrentSource:
             self._logger,
             self._slice_logger,
             self._message_repository,
-            PartitionReader(queue),
+            partition_reader,
         )
 
-        # Enqueue initial partition generation tasks
-        yield from self._submit_initial_partition_generators(concurrent_stream_processor)
+        try:
+            # Enqueue initial partition generation tasks
+            yield from self._submit_initial_partition_generators(concurrent_stream_processor)
 
-        # Read from the queue until all partitions were generated and read
-        yield from self._consume_from_queue(
-            queue,
-            concurrent_stream_processor,
-        )
-        self._threadpool.check_for_errors_and_shutdown()
+            # Read from the queue until all partitions were generated and read
+            yield from self._consume_from_queue(
+                queue,
+                concurrent_stream_processor,
+            )
+            self._threadpool.check_for_errors_and_shutdown()
+        finally:
+            if isinstance(partition_reader, ProcessPartitionReader):
+                partition_reader.shutdown()
+        self._log_queue_metrics(queue)
         self._logger.info("Finished syncing")
 
+    def _create_queue(self) -> Queue[QueueItem]:
+        # We set a maxsize to for the main thread to process record items when the queue size grows. This assumes that there are less
+        # threads generating partitions that than are max number of workers. If it weren't the case, we could have threads only generating
+        # partitions which would fill the queue. By default, this number is arbitrarily set to 10_000 items. As the memory held by 10_000
+        # items depends on how wide the records are, sources can instead bound the queue by the estimated size of the records in flight.
+        if self._max_queue_size_in_bytes:
+            return MemoryBoundedQueue(max_size_in_bytes=self._max_queue_size_in_bytes)
+        return Queue(maxsize=self.DEFAULT_MAX_QUEUE_SIZE)
+
+    def _create_partition_reader(self, queue: Queue[QueueItem]) -> PartitionReader:
+        if self._process_partition_factory:
+            return ProcessPartitionReader(
+                queue,
+                self._message_repository,
+                self._process_partition_factory,
+                self._max_worker_processes,
+                batch_size=self._record_batch_size
+                if self._record_batch_size > 1
+                else ProcessPartitionReader.DEFAULT_BATCH_SIZE,
+            )
+        return PartitionReader(queue, batch_size=self._record_batch_size)
+
     def _submit_initial_partition_generators(
         self, concurrent_stream_processor: ConcurrentReadProcessor
     ) -> Iterable[AirbyteMessage]:
@@ -136,15 +187,24 @@ class ConcurrentSource:
         queue: Queue[QueueItem],
         concurrent_stream_processor: ConcurrentReadProcessor,
     ) -> Iterable[AirbyteMessage]:
+        next_queue_metrics_time = time.monotonic() + self.QUEUE_METRICS_INTERVAL_SECONDS
         while airbyte_message_or_record_or_exception := queue.get():
             yield from self._handle_item(
                 airbyte_message_or_record_or_exception,
                 concurrent_stream_processor,
             )
+            now = time.monotonic()
+            if now >= next_queue_metrics_time:
+                self._log_queue_metrics(queue)
+                next_queue_metrics_time = now + self.QUEUE_METRICS_INTERVAL_SECONDS
             if concurrent_stream_processor.is_done() and queue.empty():
                 # all partitions were generated and processed. we're done here
                 break
 
+    def _log_queue_metrics(self, queue: Queue[QueueItem]) -> None:
+        if isinstance(queue, MemoryBoundedQueue):
+            self._logger.info(f"Record queue metrics: {queue.metrics()}")
+
     def _handle_item(
         self,
         queue_item: QueueItem,
@@ -161,5 +221,8 @@ class ConcurrentSource:
             yield from concurrent_stream_processor.on_partition_complete_sentinel(queue_item)
         elif isinstance(queue_item, Record):
             yield from concurrent_stream_processor.on_record(queue_item)
+        elif isinstance(queue_item, list):
+            for record in queue_item:
+                yield from concurrent_stream_processor.on_record(record)
         else:
             raise ValueError(f"Unknown queue item type: {type(queue_item)}")
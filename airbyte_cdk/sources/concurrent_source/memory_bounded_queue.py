@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import sys
+import time
+from collections import deque
+from queue import Full, Queue
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem
+from airbyte_cdk.sources.types import Record
+
+
+def estimate_size_in_bytes(value: Any) -> int:
+    """
+    Cheap approximation of the memory held by a JSON-like value. Containers are traversed iteratively and every element
+    is counted with `sys.getsizeof`. Shared references are counted every time they are seen which is fine for records as
+    they come out of JSON decoding.
+    """
+    size = 0
+    to_visit = [value]
+    while to_visit:
+        current = to_visit.pop()
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            to_visit.extend(current.keys())
+            to_visit.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            to_visit.extend(current)
+    return size
+
+
+class MemoryBoundedQueue(Queue[QueueItem]):
+    """
+    Queue bounded by the estimated amount of memory held by the records it contains rather than by the number of items.
+
+    Only records are weighed: sentinels, partitions and exceptions are small and need to reach the main thread for the
+    read to make progress so they are only subject to `maxsize`. A record is always accepted when the queue holds no
+    record bytes so that a single record bigger than `max_size_in_bytes` can't block the sync.
+
+    The queue keeps track of its depth so that the consumer can report how much data was in flight during the sync.
+    """
+
+    def __init__(self, max_size_in_bytes: int, maxsize: int = 0) -> None:
+        if max_size_in_bytes <= 0:
+            raise ValueError(
+                f"MemoryBoundedQueue expects max_size_in_bytes to be positive but got {max_size_in_bytes}"
+            )
+        super().__init__(maxsize)
+        self._max_size_in_bytes = max_size_in_bytes
+        self._size_in_bytes = 0
+        self._max_observed_size_in_bytes = 0
+        self._max_observed_number_of_items = 0
+        self._number_of_blocked_puts = 0
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        item_size = self._estimate_item_size(item)
+        with self.not_full:
+            if self._must_wait(item_size):
+                self._number_of_blocked_puts += 1
+                if not block:
+                    raise Full
+                elif timeout is None:
+                    while self._must_wait(item_size):
+                        self.not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    endtime = time.monotonic() + timeout
+                    while self._must_wait(item_size):
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            raise Full
+                        self.not_full.wait(remaining)
+            self.queue.append((item, item_size))
+            self._size_in_bytes += item_size
+            self._max_observed_size_in_bytes = max(
+                self._max_observed_size_in_bytes, self._size_in_bytes
+            )
+            self._max_observed_number_of_items = max(
+                self._max_observed_number_of_items, len(self.queue)
+            )
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def _init(self, maxsize: int) -> None:
+        self.queue: Deque[Tuple[QueueItem, int]] = deque()  # type: ignore[assignment]  # items are stored with their size
+
+    def _get(self) -> QueueItem:
+        item, item_size = self.queue.popleft()
+        self._size_in_bytes -= item_size
+        return item
+
+    def _must_wait(self, item_size: int) -> bool:
+        if 0 < self.maxsize <= self._qsize():
+            return True
+        return (
+            item_size > 0
+            and self._size_in_bytes > 0
+            and self._size_in_bytes + item_size > self._max_size_in_bytes
+        )
+
+    @staticmethod
+    def _estimate_item_size(item: QueueItem) -> int:
+        if isinstance(item, Record):
+            return estimate_size_in_bytes(item.data)
+        if isinstance(item, list):
+            return sum(estimate_size_in_bytes(record.data) for record in item)
+        return 0
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Snapshot of the queue depth. The values are read without the lock as they are only meant for reporting.
+        """
+        return {
+            "number_of_items": self._qsize(),
+            "size_in_bytes": self._size_in_bytes,
+            "max_number_of_items": self._max_observed_number_of_items,
+            "max_size_in_bytes": self._max_observed_size_in_bytes,
+            "number_of_blocked_puts": self._number_of_blocked_puts,
+        }
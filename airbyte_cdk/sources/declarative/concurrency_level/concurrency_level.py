@@ -17,12 +17,18 @@ class ConcurrencyLevel:
     Attributes:
         default_concurrency (Union[int, str]): The hardcoded integer or interpolation of how many worker threads to use during a sync
         max_concurrency (Optional[int]): The maximum number of worker threads to use when the default_concurrency is exceeded
+        max_queue_size_in_bytes (Optional[Union[int, str]]): The hardcoded integer or interpolation of the estimated size of the records that can be queued between the worker threads and the main thread
+        record_batch_size (int): The number of records the worker threads put in the queue as a single item
+        read_partitions_in_processes (bool): Whether the partitions are read by worker processes instead of worker threads
     """
 
     default_concurrency: Union[int, str]
     max_concurrency: Optional[int]
     config: Config
     parameters: InitVar[Mapping[str, Any]]
+    max_queue_size_in_bytes: Optional[Union[int, str]] = None
+    record_batch_size: int = 1
+    read_partitions_in_processes: bool = False
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         if isinstance(self.default_concurrency, int):
@@ -36,6 +42,18 @@ class ConcurrencyLevel:
                 self.default_concurrency, parameters=parameters
             )
 
+        if isinstance(self.max_queue_size_in_bytes, str):
+            evaluated_max_queue_size_in_bytes = InterpolatedString.create(
+                self.max_queue_size_in_bytes, parameters=parameters
+            ).eval(config=self.config)
+            if evaluated_max_queue_size_in_bytes is not None and not isinstance(
+                evaluated_max_queue_size_in_bytes, int
+            ):
+                raise ValueError("max_queue_size_in_bytes did not evaluate to an integer")
+            self._max_queue_size_in_bytes: Optional[int] = evaluated_max_queue_size_in_bytes
+        else:
+            self._max_queue_size_in_bytes = self.max_queue_size_in_bytes
+
     def get_concurrency_level(self) -> int:
         if isinstance(self._default_concurrency, InterpolatedString):
             evaluated_default_concurrency = self._default_concurrency.eval(config=self.config)
@@ -48,3 +66,6 @@ class ConcurrencyLevel:
             )
         else:
             return self._default_concurrency
+
+    def get_max_queue_size_in_bytes(self) -> Optional[int]:
+        return self._max_queue_size_in_bytes
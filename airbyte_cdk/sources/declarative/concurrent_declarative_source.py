@@ -3,7 +3,7 @@
 #
 
 import logging
-from typing import Any, Generic, Iterator, List, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Generic, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 from airbyte_cdk.models import (
     AirbyteCatalog,
@@ -48,6 +48,7 @@ from airbyte_cdk.sources.declarative.stream_slicers.declarative_partition_genera
     StreamSlicerPartitionGenerator,
 )
 from airbyte_cdk.sources.declarative.types import ConnectionDefinition
+from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.source import TState
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
@@ -58,6 +59,10 @@ from airbyte_cdk.sources.streams.concurrent.availability_strategy import (
 from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, FinalStateCursor
 from airbyte_cdk.sources.streams.concurrent.default_stream import DefaultStream
 from airbyte_cdk.sources.streams.concurrent.helpers import get_primary_key_from_stream
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.process_partition_reader import (
+    ProcessPartitionFactory,
+)
 
 
 class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
@@ -80,6 +85,8 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
         #  no longer needs to store the original incoming state. But maybe there's an edge case?
         self._connector_state_manager = ConnectorStateManager(state=state)  # type: ignore  # state is always in the form of List[AirbyteStateMessage]. The ConnectorStateManager should use generics, but this can be done later
 
+        has_custom_component_factory = component_factory is not None
+
         # To reduce the complexity of the concurrent framework, we are not enabling RFR with synthetic
         # cursors. We do this by no longer automatically instantiating RFR cursors when converting
         # the declarative models into runtime components. Concurrent sources will continue to checkpoint
@@ -114,9 +121,26 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             initial_number_of_partitions_to_generate = max(
                 concurrency_level // 2, 1
             )  # Partition_generation iterates using range based on this value. If this is floored to zero we end up in a dead lock during start up
+            max_queue_size_in_bytes = concurrency_level_component.get_max_queue_size_in_bytes()
+            record_batch_size = concurrency_level_component.record_batch_size
+            read_partitions_in_processes = concurrency_level_component.read_partitions_in_processes
         else:
             concurrency_level = self._LOWEST_SAFE_CONCURRENCY_LEVEL
             initial_number_of_partitions_to_generate = self._LOWEST_SAFE_CONCURRENCY_LEVEL // 2
+            max_queue_size_in_bytes = None
+            record_batch_size = 1
+            read_partitions_in_processes = False
+
+        # The worker processes build a ConcurrentDeclarativeSource from the manifest so neither a custom component factory
+        # (e.g. the limits of the connector builder) nor the overrides of a subclass would apply to them
+        process_partition_factory = (
+            DeclarativeProcessPartitionFactory(source_config, config or {}, catalog, state)
+            if read_partitions_in_processes
+            and not emit_connector_builder_messages
+            and not has_custom_component_factory
+            and type(self) is ConcurrentDeclarativeSource
+            else None
+        )
 
         self._concurrent_source = ConcurrentSource.create(
             num_workers=concurrency_level,
@@ -124,6 +148,9 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
             logger=self.logger,
             slice_logger=self._slice_logger,
             message_repository=self.message_repository,
+            max_queue_size_in_bytes=max_queue_size_in_bytes,
+            record_batch_size=record_batch_size,
+            process_partition_factory=process_partition_factory,
         )
 
     # TODO: Remove this. This property is necessary to safely migrate Stripe during the transition state.
@@ -530,3 +557,55 @@ class ConcurrentDeclarativeSource(ManifestDeclarativeSource, Generic[TState]):
                 stream_state = dict(state_migration.migrate(stream_state))
 
         return stream_state
+
+
+class DeclarativeProcessPartitionFactory(ProcessPartitionFactory):
+    """
+    Creates the partitions of the concurrent streams of a declarative source in a worker process. The source is built from
+    the manifest, config, catalog and state once per worker process, the first time a partition is created.
+    """
+
+    def __init__(
+        self,
+        source_config: ConnectionDefinition,
+        config: Mapping[str, Any],
+        catalog: Optional[ConfiguredAirbyteCatalog],
+        state: Any,
+    ) -> None:
+        self._source_config = source_config
+        self._config = config
+        self._catalog = catalog
+        self._state = state
+        self._source: Optional[ConcurrentDeclarativeSource[Any]] = None
+        self._partition_factories: Dict[str, DeclarativePartitionFactory] = {}
+
+    @property
+    def message_repository(self) -> MessageRepository:
+        return self._get_source().message_repository
+
+    def create(self, stream_name: str, stream_slice: Optional[Mapping[str, Any]]) -> Partition:
+        self._get_source()
+        if stream_name not in self._partition_factories:
+            raise ValueError(f"Stream {stream_name} can't be read in a worker process")
+        return self._partition_factories[stream_name].create(stream_slice)  # type: ignore[arg-type]  # declarative slices are StreamSlices
+
+    def _get_source(self) -> "ConcurrentDeclarativeSource[Any]":
+        if self._source is None:
+            self._source = ConcurrentDeclarativeSource(
+                catalog=self._catalog,
+                config=self._config,
+                state=self._state,
+                source_config=self._source_config,
+            )
+            concurrent_streams, _ = self._source._group_streams(config=self._config)
+            for stream in concurrent_streams:
+                if isinstance(stream, DefaultStream) and isinstance(
+                    stream.partition_generator, StreamSlicerPartitionGenerator
+                ):
+                    self._partition_factories[stream.name] = (
+                        stream.partition_generator.partition_factory
+                    )
+            # the main process already emitted the messages of building the source
+            for _ in self._source.message_repository.consume_queue():
+                pass
+        return self._source
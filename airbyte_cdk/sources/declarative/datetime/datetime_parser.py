@@ -3,7 +3,98 @@
 #
 
 import datetime
-from typing import Union
+import functools
+import re
+from typing import Optional, Union
+
+# Same patterns as the ones `datetime.strptime` uses for these directives so that the same strings are accepted.
+# Formats with other directives are parsed with `datetime.strptime`.
+_DIRECTIVE_PATTERNS = {
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+    "S": r"(?P<S>6[0-1]|[0-5]\d|\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "z": r"(?P<z>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|(?-i:Z))",
+    "%": "%",
+}
+_FORMAT_TOKEN = re.compile(r"%(.?)|(\s+)|([^%\s]+)", re.DOTALL)
+
+
+class _CompiledFormat:
+    """
+    Parses the values of a format with the regular expression `datetime.strptime` would build for it and creates the
+    datetime directly, skipping the generic `_strptime` machinery that dominates the cost of parsing a value.
+    """
+
+    def __init__(self, pattern: str, format: str) -> None:
+        self._regex = re.compile(pattern, re.IGNORECASE)
+        self._format = format
+
+    def parse(self, date: str) -> datetime.datetime:
+        match = self._regex.match(date)
+        if match is None:
+            raise ValueError(f"time data {date!r} does not match format {self._format!r}")
+        if match.end() != len(date):
+            raise ValueError(f"unconverted data remains: {date[match.end() :]}")
+        values = match.groupdict()
+        fraction = values.get("f")
+        offset = values.get("z")
+        return datetime.datetime(
+            int(values.get("Y") or 1900),
+            int(values.get("m") or 1),
+            int(values.get("d") or 1),
+            int(values.get("H") or 0),
+            int(values.get("M") or 0),
+            int(values.get("S") or 0),
+            int(fraction + "0" * (6 - len(fraction))) if fraction else 0,
+            _to_timezone(offset) if offset else None,
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_format(format: str) -> Optional[_CompiledFormat]:
+    pattern = []
+    directives = set()
+    for token in _FORMAT_TOKEN.finditer(format):
+        directive, whitespace, literal = token.groups()
+        if directive is not None:
+            if directive not in _DIRECTIVE_PATTERNS or directive in directives:
+                return None
+            if directive != "%":
+                directives.add(directive)
+            pattern.append(_DIRECTIVE_PATTERNS[directive])
+        elif whitespace is not None:
+            pattern.append(r"\s+")
+        else:
+            pattern.append(re.escape(literal))
+    return _CompiledFormat("".join(pattern), format)
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_timezone(offset: str) -> datetime.timezone:
+    # Follows the interpretation of %z by `datetime.strptime`
+    if offset == "Z":
+        return datetime.timezone(datetime.timedelta(0))
+    compact_offset = offset
+    if compact_offset[3] == ":":
+        compact_offset = compact_offset[:3] + compact_offset[4:]
+        if len(compact_offset) > 5:
+            if compact_offset[5] != ":":
+                raise ValueError(f"Inconsistent use of : in {offset}")
+            compact_offset = compact_offset[:5] + compact_offset[6:]
+    seconds = (
+        int(compact_offset[1:3]) * 3600
+        + int(compact_offset[3:5]) * 60
+        + int(compact_offset[5:7] or 0)
+    )
+    fraction = compact_offset[8:]
+    microseconds = int(fraction + "0" * (6 - len(fraction)))
+    if offset.startswith("-"):
+        seconds, microseconds = -seconds, -microseconds
+    return datetime.timezone(datetime.timedelta(seconds=seconds, microseconds=microseconds))
 
 
 class DatetimeParser:
@@ -14,6 +105,9 @@ class DatetimeParser:
 
     %s is part of the list of format codes required by  the 1989 C standard, but it is unreliable because it always return a datetime in the system's timezone.
     Instead of using the directive directly, we can use datetime.fromtimestamp and dt.timestamp()
+
+    Formats only made of the %Y, %m, %d, %H, %M, %S, %f and %z directives are compiled once and parsed without going
+    through datetime.strptime. They accept and reject the same values as datetime.strptime.
     """
 
     _UNIX_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
@@ -35,7 +129,11 @@ class DatetimeParser:
             return self._UNIX_EPOCH + datetime.timedelta(milliseconds=int(date))
         elif "%_ms" in format:
             format = format.replace("%_ms", "%f")
-        parsed_datetime = datetime.datetime.strptime(str(date), format)
+        compiled_format = _compile_format(format)
+        if compiled_format is None:
+            parsed_datetime = datetime.datetime.strptime(str(date), format)
+        else:
+            parsed_datetime = compiled_format.parse(str(date))
         if self._is_naive(parsed_datetime):
             return parsed_datetime.replace(tzinfo=datetime.timezone.utc)
         return parsed_datetime
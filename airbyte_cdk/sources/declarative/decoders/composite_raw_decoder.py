@@ -2,19 +2,22 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
 import gzip
 import io
 import json
 import logging
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from io import BufferedIOBase, TextIOWrapper
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import orjson
 import requests
 
 from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.declarative.decoders.decoded_response_cache import decode_once
 from airbyte_cdk.sources.declarative.decoders.decoder import DECODER_OUTPUT_TYPE, Decoder
 from airbyte_cdk.sources.declarative.decoders.decoder_parser import (
     PARSER_OUTPUT_TYPE,
@@ -48,27 +51,114 @@ class GzipParser(Parser):
 
 @dataclass
 class JsonParser(Parser):
+    """
+    Parse a JSON document. If the document is an array, each element is returned as a record.
+
+    When `streaming` is enabled, the data is read incrementally and the elements of the array located at `records_path`
+    (the root of the document by default) are returned as soon as they are read. Only the element being read is kept in
+    memory which allows to parse documents much larger than the available memory. If the value at `records_path` is not
+    an array, it is returned as a single record and if there is no value at `records_path`, no records are returned.
+    """
+
     encoding: str = "utf-8"
+    streaming: bool = False
+    records_path: List[str] = field(default_factory=list)
 
     def parse(self, data: BufferedIOBase) -> PARSER_OUTPUT_TYPE:
         """
         Attempts to deserialize data using orjson library. As an extra layer of safety we fallback on the json library to deserialize the data.
         """
+        if self.streaming and _is_ascii_compatible(self.encoding):
+            yield from self._parse_incrementally(data)
+            return
+
         raw_data = data.read()
         body_json = self._parse_orjson(raw_data) or self._parse_json(raw_data)
 
         if body_json is None:
-            raise AirbyteTracedException(
-                message="Response JSON data failed to be parsed. See logs for more information.",
-                internal_message=f"Response JSON data failed to be parsed.",
-                failure_type=FailureType.system_error,
-            )
+            raise self._parsing_error()
 
         if isinstance(body_json, list):
             yield from body_json
         else:
             yield from [body_json]
 
+    def _parse_incrementally(self, data: BufferedIOBase) -> PARSER_OUTPUT_TYPE:
+        reader = _IncrementalJsonReader(data)
+        try:
+            if reader.peek() is None:
+                raise self._parsing_error()
+            for key in self.records_path:
+                if not self._move_to_key(reader, key):
+                    return
+
+            if reader.peek() != _ARRAY_START:
+                yield self._parse_value(reader.read_value())
+                return
+
+            reader.advance()
+            while True:
+                next_byte = reader.peek()
+                if next_byte == _ARRAY_END:
+                    return
+                elif next_byte == _COMMA:
+                    reader.advance()
+                elif next_byte is None:
+                    raise _TruncatedJsonError()
+                else:
+                    yield self._parse_value(reader.read_value())
+        except _TruncatedJsonError:
+            logger.error("Failed to parse JSON data: the data ended before the end of the document")
+            raise self._parsing_error()
+
+    def _move_to_key(self, reader: "_IncrementalJsonReader", key: str) -> bool:
+        """
+        Position the reader on the value of `key` in the object the reader is on. Values of the other keys are skipped
+        without being kept in memory.
+        """
+        if reader.peek() != _OBJECT_START:
+            return False
+        reader.advance()
+        while True:
+            next_byte = reader.peek()
+            if next_byte == _OBJECT_END:
+                return False
+            elif next_byte == _COMMA:
+                reader.advance()
+            elif next_byte is None:
+                raise _TruncatedJsonError()
+            else:
+                current_key = self._parse_value(reader.read_value())
+                if reader.peek() != _COLON:
+                    raise self._parsing_error()
+                reader.advance()
+                if current_key == key:
+                    return True
+                reader.read_value(keep=False)
+
+    def _parse_value(self, raw_data: bytes) -> Any:
+        try:
+            # orjson parses UTF-8 bytes directly which saves decoding every record
+            is_utf8 = codecs.lookup(self.encoding).name == "utf-8"
+            return orjson.loads(raw_data if is_utf8 else raw_data.decode(self.encoding))
+        except Exception as exc:
+            logger.debug(
+                f"Failed to parse JSON data using orjson library. Falling back to json library. {exc}"
+            )
+        try:
+            return json.loads(raw_data.decode(self.encoding))
+        except Exception as exc:
+            logger.error(f"Failed to parse JSON data using json library. {exc}")
+            raise self._parsing_error()
+
+    @staticmethod
+    def _parsing_error() -> AirbyteTracedException:
+        return AirbyteTracedException(
+            message="Response JSON data failed to be parsed. See logs for more information.",
+            internal_message=f"Response JSON data failed to be parsed.",
+            failure_type=FailureType.system_error,
+        )
+
     def _parse_orjson(self, raw_data: bytes) -> Optional[Any]:
         try:
             return orjson.loads(raw_data.decode(self.encoding))
@@ -86,16 +176,190 @@ class JsonParser(Parser):
             return None
 
 
+_ARRAY_START, _ARRAY_END, _OBJECT_START, _OBJECT_END, _COMMA, _COLON, _QUOTE = b'[]{},:"'
+# Skip anything up to the next bracket outside of a string. If there is a quote in the group, the string it starts
+# is not complete in the buffer.
+_NEXT_BRACKET = re.compile(
+    rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}"])', re.DOTALL
+)
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+_NON_WHITESPACE = re.compile(rb"\S")
+_JSON_STRUCTURAL_CHARACTERS = '[]{}",: \t\r\n'
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    try:
+        return _JSON_STRUCTURAL_CHARACTERS.encode(encoding) == _JSON_STRUCTURAL_CHARACTERS.encode()
+    except LookupError:
+        return False
+
+
+class _TruncatedJsonError(Exception):
+    pass
+
+
+class _IncrementalJsonReader:
+    """
+    Read raw JSON values from a byte stream without parsing them. Values are delimited by tracking the nesting of
+    brackets outside of strings so that only the bytes of the value being read need to be in memory. The values are
+    not validated: this is left to the JSON library parsing them.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, data: BufferedIOBase) -> None:
+        self._data = data
+        self._buffer = bytearray()
+        self._position = 0
+
+    def peek(self) -> Optional[int]:
+        """
+        Skip whitespaces and return the next byte without consuming it or None if the data is exhausted.
+        """
+        while True:
+            match = _NON_WHITESPACE.search(self._buffer, self._position)
+            if match:
+                self._position = match.start()
+                return self._buffer[self._position]
+            self._position = len(self._buffer)
+            if not self._read_more():
+                return None
+
+    def advance(self) -> None:
+        self._position += 1
+
+    def read_value(self, keep: bool = True) -> bytes:
+        """
+        Consume the value starting at the next non-whitespace byte and return its raw bytes. If `keep` is False, the
+        value is skipped and the bytes read are released as the value is being read.
+        """
+        first_byte = self.peek()
+        if first_byte is None:
+            raise _TruncatedJsonError()
+        if first_byte in (_ARRAY_START, _OBJECT_START):
+            end = self._find_container_end(keep)
+        elif first_byte == _QUOTE:
+            end = self._find_end(_STRING.match, lambda match: match.end())
+        else:
+            end = self._find_end(_SCALAR_END.search, lambda match: match.start(), at_eof=True)
+        value = bytes(self._buffer[self._position : end]) if keep else b""
+        self._position = end
+        return value
+
+    def _find_container_end(self, keep: bool) -> int:
+        buffer, position, depth = self._buffer, self._position, 0
+        while True:
+            match = _NEXT_BRACKET.match(buffer, position)
+            bracket = buffer[match.start(1)] if match else _QUOTE
+            if bracket == _QUOTE:
+                # the rest of the buffer doesn't contain a bracket: the scan is resumed once more data is read
+                resume_at = match.start(1) if match else len(buffer)
+                if not keep:
+                    self._position = resume_at
+                # the buffer is compacted when more data is read so the scan position is kept relative to the value
+                offset = resume_at - self._position
+                if not self._read_more():
+                    raise _TruncatedJsonError()
+                buffer, position = self._buffer, self._position + offset
+                continue
+            position = match.end()  # type: ignore[union-attr]  # the bracket is only found in a match
+            if bracket == _ARRAY_START or bracket == _OBJECT_START:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return position
+
+    def _find_end(self, find: Any, end_of: Any, at_eof: bool = False) -> int:
+        while True:
+            match = find(self._buffer, self._position)
+            if match:
+                return end_of(match)  # type: ignore[no-any-return]
+            if not self._read_more():
+                if at_eof:
+                    return len(self._buffer)
+                raise _TruncatedJsonError()
+
+    def _read_more(self) -> bool:
+        chunk = self._data.read(self.CHUNK_SIZE)
+        if not chunk:
+            return False
+        del self._buffer[: self._position]
+        self._position = 0
+        self._buffer += chunk
+        return True
+
+
+_INVALID_LINE = object()
+# orjson parses integers that don't fit in 64 bits as floats so lines with long numbers are parsed by the json library.
+# Mapping all the digits to 0 before looking for a run of 19 of them is much faster than a regex.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_NUMBER = b"0" * 19
+
+
+def _has_long_number(data: bytes) -> bool:
+    return data.translate(_DIGITS_TO_ZERO).find(_LONG_NUMBER) != -1
+
+
 @dataclass
 class JsonLineParser(Parser):
+    """
+    Parse one JSON record per line. The data is read in large chunks that are split on line breaks and each line is
+    given to orjson as bytes. The json library is only used for the lines orjson can't parse exactly (for example NaN or
+    integers that don't fit in 64 bits).
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
     encoding: Optional[str] = "utf-8"
 
     def parse(self, data: BufferedIOBase) -> PARSER_OUTPUT_TYPE:
-        for line in data:
+        encoding = self.encoding or "utf-8"
+        # orjson parses UTF-8 bytes directly which saves decoding every line
+        is_utf8 = codecs.lookup(encoding).name == "utf-8"
+        incomplete_line: List[bytes] = []
+        while True:
+            chunk = data.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = chunk.split(b"\n")
+            if len(lines) == 1:
+                incomplete_line.append(chunk)
+                continue
+            if incomplete_line:
+                incomplete_line.append(lines[0])
+                lines[0] = b"".join(incomplete_line)
+            last_line = lines.pop()
+            incomplete_line = [last_line] if last_line else []
+
+            # the first line can start in a previous chunk so it is always checked for long numbers
+            has_long_numbers = _has_long_number(chunk)
+            for index, line in enumerate(lines):
+                record = self._parse_line(
+                    line, encoding, is_utf8, check_long_numbers=has_long_numbers or index == 0
+                )
+                if record is not _INVALID_LINE:
+                    yield record
+        if incomplete_line:
+            record = self._parse_line(
+                b"".join(incomplete_line), encoding, is_utf8, check_long_numbers=True
+            )
+            if record is not _INVALID_LINE:
+                yield record
+
+    @staticmethod
+    def _parse_line(line: bytes, encoding: str, is_utf8: bool, check_long_numbers: bool) -> Any:
+        if not (check_long_numbers and _has_long_number(line)):
             try:
-                yield json.loads(line.decode(encoding=self.encoding or "utf-8"))
-            except json.JSONDecodeError as e:
-                logger.warning(f"Cannot decode/parse line {line!r} as JSON, error: {e}")
+                return orjson.loads(line if is_utf8 else line.decode(encoding))
+            except orjson.JSONDecodeError:
+                pass
+        try:
+            return json.loads(line.decode(encoding))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Cannot decode/parse line {line!r} as JSON, error: {e}")
+            return _INVALID_LINE
 
 
 @dataclass
@@ -192,6 +456,11 @@ class CompositeRawDecoder(Decoder):
                 data=response.raw,  # type: ignore[arg-type]
             )
             response.raw.close()
+        elif isinstance(parser, JsonParser) and not parser.streaming:
+            # the whole document is loaded in memory anyway so it is kept for the other components reading the response
+            yield from decode_once(
+                response, self, lambda: list(parser.parse(data=io.BytesIO(response.content)))
+            )
         else:
             yield from parser.parse(data=io.BytesIO(response.content))
 
@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+_DECODED_BODIES_ATTRIBUTE = "_airbyte_decoded_bodies"
+
+
+def decode_once(response: requests.Response, decoder: object, decode: Callable[[], T]) -> T:
+    """
+    Return what `decode` returns for the response, calling it only the first time the response is decoded by `decoder`.
+
+    For one page, the record extractor, the paginator and the error handler each read the response body. The decoded
+    body is kept on the response so that it is parsed once whichever component reads it first. The value is shared by
+    all the readers so they must not modify it. A component handing out parts of the body to code that might modify
+    them must call `invalidate_decoded_bodies` so that the components reading the response afterward decode it again.
+
+    Only responses whose content is loaded in memory (i.e. not streamed) can be decoded this way.
+
+    :param response: The response being decoded
+    :param decoder: The object decoding the response. Values are only shared between calls with the same decoder.
+    :param decode: Decodes the response. Nothing is cached if it raises.
+    """
+    decoded_bodies: Dict[int, Tuple[object, bytes, Any]] = response.__dict__.setdefault(
+        _DECODED_BODIES_ATTRIBUTE, {}
+    )
+    content = response.content
+    cached = decoded_bodies.get(id(decoder))
+    if cached is not None and cached[0] is decoder and cached[1] is content:
+        return cached[2]  # type: ignore[no-any-return]  # the value was returned by `decode`
+    decoded_body = decode()
+    decoded_bodies[id(decoder)] = (decoder, content, decoded_body)
+    return decoded_body
+
+
+def invalidate_decoded_bodies(response: requests.Response) -> None:
+    """
+    Forget the bodies decoded for the response so that the next components reading it decode it again.
+    """
+    response.__dict__.pop(_DECODED_BODIES_ATTRIBUTE, None)
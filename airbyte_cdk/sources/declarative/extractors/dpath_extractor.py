@@ -3,15 +3,30 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
-import dpath
 import requests
+from jinja2 import Environment, TemplateSyntaxError, meta
 
 from airbyte_cdk.sources.declarative.decoders import Decoder, JsonDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.types import Config
+from airbyte_cdk.utils.dpath_accessor import DpathAccessor
+
+_CONSTANT_INTERPOLATION_VARIABLES = {"config", "parameters"}
+
+
+def _is_constant(path: InterpolatedString) -> bool:
+    """
+    A path element that only depends on the config and the parameters always evaluates to the same value for a given
+    extractor. Anything else (macros, variables passed at evaluation time) needs to be evaluated on every call.
+    """
+    try:
+        variables = meta.find_undeclared_variables(Environment().parse(path.string))
+    except TemplateSyntaxError:
+        return False
+    return variables <= _CONSTANT_INTERPOLATION_VARIABLES
 
 
 @dataclass
@@ -67,20 +82,31 @@ class DpathExtractor(RecordExtractor):
                 self._field_path[path_index] = InterpolatedString.create(
                     self.field_path[path_index], parameters=parameters
                 )
+        self._is_field_path_constant = all(_is_constant(path) for path in self._field_path)
+        self._compiled_field_path: Optional[Tuple[bool, DpathAccessor]] = None
 
     def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[Any, Any]]:
         for body in self.decoder.decode(response):
             if len(self._field_path) == 0:
                 extracted = body
             else:
-                path = [path.eval(self.config) for path in self._field_path]
-                if "*" in path:
-                    extracted = dpath.values(body, path)
+                has_wildcard, field_path = self._get_compiled_field_path()
+                if has_wildcard:
+                    extracted = field_path.values(body)  # type: ignore # extracted will be a list of records
                 else:
-                    extracted = dpath.get(body, path, default=[])  # type: ignore # extracted will be a MutableMapping, given input data structure
+                    extracted = field_path.get(body, default=[])
             if isinstance(extracted, list):
                 yield from extracted
             elif extracted:
                 yield extracted
             else:
                 yield from []
+
+    def _get_compiled_field_path(self) -> Tuple[bool, DpathAccessor]:
+        if self._compiled_field_path is not None:
+            return self._compiled_field_path
+        path = [path.eval(self.config) for path in self._field_path]
+        compiled_field_path = ("*" in path, DpathAccessor(path))
+        if self._is_field_path_constant:
+            self._compiled_field_path = compiled_field_path
+        return compiled_field_path
@@ -7,6 +7,9 @@ from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import requests
 
+from airbyte_cdk.sources.declarative.decoders.decoded_response_cache import (
+    invalidate_decoded_bodies,
+)
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
@@ -18,7 +21,7 @@ from airbyte_cdk.sources.declarative.models import SchemaNormalization
 from airbyte_cdk.sources.declarative.retrievers.file_uploader import DefaultFileUploader
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
-from airbyte_cdk.sources.utils.transform import TypeTransformer
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
 @dataclass
@@ -87,9 +90,21 @@ class RecordSelector(HttpSelector):
         :return: List of Records selected from the response
         """
         all_data: Iterable[Mapping[str, Any]] = self.extractor.extract_records(response)
-        yield from self.filter_and_transform(
-            all_data, stream_state, records_schema, stream_slice, next_page_token
-        )
+        if not self._may_modify_records(records_schema):
+            yield from self.filter_and_transform(
+                all_data, stream_state, records_schema, stream_slice, next_page_token
+            )
+            return
+
+        try:
+            # As the decoded body is invalidated, nothing else reads the extracted records so they can be modified in place
+            yield from self.filter_and_transform(
+                all_data, stream_state, records_schema, stream_slice, next_page_token, owned=True
+            )
+        finally:
+            # The records are parts of the decoded body which is shared with the components reading the response after
+            # the records (e.g. the paginator). As they may have been modified, these components need to decode it again.
+            invalidate_decoded_bodies(response)
 
     def filter_and_transform(
         self,
@@ -98,6 +113,7 @@ class RecordSelector(HttpSelector):
         records_schema: Mapping[str, Any],
         stream_slice: Optional[StreamSlice] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
+        owned: bool = False,
     ) -> Iterable[Record]:
         """
         There is an issue with the selector as of 2024-08-30: it does technology-agnostic processing like filtering, transformation and
@@ -106,6 +122,9 @@ class RecordSelector(HttpSelector):
 
         Until we decide to move this logic away from the selector, we made this method public so that users like AsyncJobRetriever could
         share the logic of doing transformations on a set of records.
+
+        If `owned` is True, nothing else references `all_data` so records are normalized in place and emitted as owned records
+        instead of being copied. Otherwise, records are only copied if they are normalized.
         """
         if self.transform_before_filtering:
             transformed_data = self._transform(all_data, stream_state, stream_slice)
@@ -115,22 +134,47 @@ class RecordSelector(HttpSelector):
         else:
             filtered_data = self._filter(all_data, stream_state, stream_slice, next_page_token)
             transformed_filtered_data = self._transform(filtered_data, stream_state, stream_slice)
+        normalizes_records = self._normalizes_records(records_schema)
         normalized_data = self._normalize_by_schema(
-            transformed_filtered_data, schema=records_schema
+            transformed_filtered_data,
+            schema=records_schema if normalizes_records else None,
+            owned=owned,
         )
         for data in normalized_data:
-            record = Record(data=data, stream_name=self.name, associated_slice=stream_slice)
+            record = Record(
+                data=data,
+                stream_name=self.name,
+                associated_slice=stream_slice,
+                # normalized records are copies unless they were already owned
+                owned=owned or normalizes_records,
+            )
             if self.file_uploader:
                 self.file_uploader.upload(record)
             yield record
 
+    def _may_modify_records(self, records_schema: Mapping[str, Any]) -> bool:
+        return (
+            bool(self.transformations)
+            or bool(self.file_uploader)
+            or self._normalizes_records(records_schema)
+        )
+
+    def _normalizes_records(self, records_schema: Mapping[str, Any]) -> bool:
+        return bool(records_schema) and not (
+            isinstance(self.schema_normalization, TypeTransformer)
+            and self.schema_normalization.config == TransformConfig.NoTransform
+        )
+
     def _normalize_by_schema(
-        self, records: Iterable[Mapping[str, Any]], schema: Optional[Mapping[str, Any]]
+        self,
+        records: Iterable[Mapping[str, Any]],
+        schema: Optional[Mapping[str, Any]],
+        owned: bool = False,
     ) -> Iterable[Mapping[str, Any]]:
         if schema:
-            # record has type Mapping[str, Any], but dict[str, Any] expected
             for record in records:
-                normalized_record = dict(record)
+                # record has type Mapping[str, Any], but dict[str, Any] expected
+                normalized_record = record if owned and isinstance(record, dict) else dict(record)
                 self.schema_normalization.transform(normalized_record, schema)
                 yield normalized_record
         else:
@@ -19,7 +19,8 @@ from airbyte_cdk.sources.declarative.incremental.global_substream_cursor import
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.checkpoint.per_partition_key_serializer import (
-    PerPartitionKeySerializer,
+    InternedPartitionKeySerializer,
+    PartitionKey,
 )
 from airbyte_cdk.sources.streams.concurrent.cursor import ConcurrentCursor, Cursor, CursorField
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -95,13 +96,25 @@ class ConcurrentPerPartitionCursor(Cursor):
 
         # The dict is ordered to ensure that once the maximum number of partitions is reached,
         # the oldest partitions can be efficiently removed, maintaining the most recent partitions.
-        self._cursor_per_partition: OrderedDict[str, ConcurrentCursor] = OrderedDict()
-        self._semaphore_per_partition: OrderedDict[str, threading.Semaphore] = OrderedDict()
+        self._cursor_per_partition: OrderedDict[PartitionKey, ConcurrentCursor] = OrderedDict()
+        self._semaphore_per_partition: OrderedDict[PartitionKey, threading.Semaphore] = (
+            OrderedDict()
+        )
+        # Completion index: each tracked semaphore gets a sequence number in creation order and the watermark is the
+        # sequence of the first partition that is not fully finished, so it only moves forward over finished partitions
+        self._sequence_per_partition: dict[PartitionKey, int] = {}
+        self._partition_per_sequence: dict[int, PartitionKey] = {}
+        self._next_sequence: int = 0
+        self._first_unfinished_sequence: int = 0
 
         # Parent-state tracking: store each partition’s parent state in creation order
-        self._partition_parent_state_map: OrderedDict[str, Mapping[str, Any]] = OrderedDict()
+        self._partition_parent_state_map: OrderedDict[PartitionKey, Mapping[str, Any]] = (
+            OrderedDict()
+        )
 
-        self._finished_partitions: set[str] = set()
+        self._finished_partitions: set[PartitionKey] = set()
+        # Per-partition entries of the state, computed again only when the partition is closed
+        self._state_per_partition: dict[PartitionKey, Optional[Mapping[str, Any]]] = {}
         self._lock = threading.Lock()
         self._timer = Timer()
         self._new_global_cursor: Optional[StreamState] = None
@@ -109,7 +122,7 @@ class ConcurrentPerPartitionCursor(Cursor):
         self._parent_state: Optional[StreamState] = None
         self._number_of_partitions: int = 0
         self._use_global_cursor: bool = use_global_cursor
-        self._partition_serializer = PerPartitionKeySerializer()
+        self._partition_serializer = InternedPartitionKeySerializer()
         # Track the last time a state message was emitted
         self._last_emission_time: float = 0.0
 
@@ -124,14 +137,10 @@ class ConcurrentPerPartitionCursor(Cursor):
         state: dict[str, Any] = {"use_global_cursor": self._use_global_cursor}
         if not self._use_global_cursor:
             states = []
-            for partition_tuple, cursor in self._cursor_per_partition.items():
-                if cursor.state:
-                    states.append(
-                        {
-                            "partition": self._to_dict(partition_tuple),
-                            "cursor": copy.deepcopy(cursor.state),
-                        }
-                    )
+            for partition_key in self._cursor_per_partition:
+                partition_state = self._get_partition_state(partition_key)
+                if partition_state:
+                    states.append(partition_state)
             state[self._PERPARTITION_STATE_KEY] = states
 
         if self._global_cursor:
@@ -142,6 +151,24 @@ class ConcurrentPerPartitionCursor(Cursor):
             state["parent_state"] = self._parent_state
         return state
 
+    def _get_partition_state(self, partition_key: PartitionKey) -> Optional[Mapping[str, Any]]:
+        """
+        Return the entry of the partition in the per-partition state, or None if its cursor has no state. Entries are
+        cached so that emitting the state does not copy the state of every partition: the state of a partition cursor
+        only changes when one of its slices is closed which invalidates the entry.
+        """
+        if partition_key not in self._state_per_partition:
+            cursor_state = self._cursor_per_partition[partition_key].state
+            self._state_per_partition[partition_key] = (
+                {
+                    "partition": self._to_dict(partition_key),
+                    "cursor": copy.deepcopy(cursor_state),
+                }
+                if cursor_state
+                else None
+            )
+        return self._state_per_partition[partition_key]
+
     def close_partition(self, partition: Partition) -> None:
         # Attempt to retrieve the stream slice
         stream_slice: Optional[StreamSlice] = partition.to_slice()  # type: ignore[assignment]
@@ -155,6 +182,7 @@ class ConcurrentPerPartitionCursor(Cursor):
             self._semaphore_per_partition[partition_key].acquire()
             if not self._use_global_cursor:
                 self._cursor_per_partition[partition_key].close_partition(partition=partition)
+                self._state_per_partition.pop(partition_key, None)
                 cursor = self._cursor_per_partition[partition_key]
                 if (
                     partition_key in self._finished_partitions
@@ -173,47 +201,52 @@ class ConcurrentPerPartitionCursor(Cursor):
         are fully finished (i.e. in _finished_partitions and semaphore._value == 0).
         Additionally, delete finished semaphores with a value of 0 to free up memory,
         as they are only needed to track errors and completion status.
+
+        Partitions are not scanned from the left on every call: the watermark only moves forward over the partitions
+        that are fully finished so each partition is checked once in amortized time.
         """
-        last_closed_state = None
+        self._advance_first_unfinished_sequence()
 
+        last_closed_state = None
         while self._partition_parent_state_map:
             # Look at the earliest partition key in creation order
             earliest_key = next(iter(self._partition_parent_state_map))
-
-            # Verify ALL partitions from the left up to earliest_key are finished
-            all_left_finished = True
-            for p_key, sem in list(
-                self._semaphore_per_partition.items()
-            ):  # Use list to allow modification during iteration
-                # If any earlier partition is still not finished, we must stop
-                if p_key not in self._finished_partitions or sem._value != 0:
-                    all_left_finished = False
-                    break
-                # Once we've reached earliest_key in the semaphore order, we can stop checking
-                if p_key == earliest_key:
-                    break
+            # A partition that is no longer tracked requires all the tracked partitions to be finished
+            earliest_sequence = self._sequence_per_partition.get(
+                earliest_key, self._next_sequence - 1
+            )
 
             # If the partitions up to earliest_key are not all finished, break the while-loop
-            if not all_left_finished:
+            if earliest_sequence >= self._first_unfinished_sequence:
                 break
 
             # Pop the leftmost entry from parent-state map
             _, closed_parent_state = self._partition_parent_state_map.popitem(last=False)
             last_closed_state = closed_parent_state
 
-            # Clean up finished semaphores with value 0 up to and including earliest_key
-            for p_key in list(self._semaphore_per_partition.keys()):
-                sem = self._semaphore_per_partition[p_key]
-                if p_key in self._finished_partitions and sem._value == 0:
-                    del self._semaphore_per_partition[p_key]
-                    logger.debug(f"Deleted finished semaphore for partition {p_key} with value 0")
-                if p_key == earliest_key:
+            # Clean up finished semaphores up to and including earliest_key
+            while self._semaphore_per_partition:
+                p_key = next(iter(self._semaphore_per_partition))
+                if self._sequence_per_partition[p_key] > earliest_sequence:
                     break
+                del self._semaphore_per_partition[p_key]
+                del self._partition_per_sequence[self._sequence_per_partition.pop(p_key)]
+                logger.debug(f"Deleted finished semaphore for partition {p_key} with value 0")
 
         # Update _parent_state if we popped at least one partition
         if last_closed_state is not None:
             self._parent_state = last_closed_state
 
+    def _advance_first_unfinished_sequence(self) -> None:
+        while self._first_unfinished_sequence < self._next_sequence:
+            p_key = self._partition_per_sequence[self._first_unfinished_sequence]
+            if (
+                p_key not in self._finished_partitions
+                or self._semaphore_per_partition[p_key]._value != 0
+            ):
+                break
+            self._first_unfinished_sequence += 1
+
     def ensure_at_least_one_state_emitted(self) -> None:
         """
         The platform expects at least one state message on successful syncs. Hence, whatever happens, we expect this method to be
@@ -281,14 +314,21 @@ class ConcurrentPerPartitionCursor(Cursor):
                 self._number_of_partitions += 1
                 self._cursor_per_partition[partition_key] = cursor
 
-        if partition_key in self._semaphore_per_partition:
-            if not self._IS_PARTITION_DUPLICATION_LOGGED:
-                logger.warning(f"Partition duplication detected for stream {self._stream_name}")
-                self._IS_PARTITION_DUPLICATION_LOGGED = True
-        else:
-            self._semaphore_per_partition[partition_key] = threading.Semaphore(0)
-
         with self._lock:
+            if partition_key in self._semaphore_per_partition:
+                if not self._IS_PARTITION_DUPLICATION_LOGGED:
+                    logger.warning(f"Partition duplication detected for stream {self._stream_name}")
+                    self._IS_PARTITION_DUPLICATION_LOGGED = True
+                # the partition gets new slices so it is not finished anymore
+                self._first_unfinished_sequence = min(
+                    self._first_unfinished_sequence, self._sequence_per_partition[partition_key]
+                )
+            else:
+                self._semaphore_per_partition[partition_key] = threading.Semaphore(0)
+                self._sequence_per_partition[partition_key] = self._next_sequence
+                self._partition_per_sequence[self._next_sequence] = partition_key
+                self._next_sequence += 1
+
             if (
                 len(self._partition_parent_state_map) == 0
                 or self._partition_parent_state_map[
@@ -333,23 +373,28 @@ class ConcurrentPerPartitionCursor(Cursor):
         with self._lock:
             while len(self._cursor_per_partition) > self.DEFAULT_MAX_PARTITIONS_NUMBER - 1:
                 # Try removing finished partitions first
-                for partition_key in list(self._cursor_per_partition.keys()):
+                for partition_key in self._cursor_per_partition:
                     if partition_key in self._finished_partitions and (
                         partition_key not in self._semaphore_per_partition
                         or self._semaphore_per_partition[partition_key]._value == 0
                     ):
+                        # the iteration stops right after the dict is modified
                         oldest_partition = self._cursor_per_partition.pop(
                             partition_key
                         )  # Remove the oldest partition
+                        self._state_per_partition.pop(partition_key, None)
+                        self._partition_serializer.release(partition_key)
                         logger.warning(
                             f"The maximum number of partitions has been reached. Dropping the oldest finished partition: {oldest_partition}. Over limit: {self._number_of_partitions - self.DEFAULT_MAX_PARTITIONS_NUMBER}."
                         )
                         break
                 else:
                     # If no finished partitions can be removed, fall back to removing the oldest partition
-                    oldest_partition = self._cursor_per_partition.popitem(last=False)[
-                        1
-                    ]  # Remove the oldest partition
+                    oldest_partition_key, oldest_partition = self._cursor_per_partition.popitem(
+                        last=False
+                    )  # Remove the oldest partition
+                    self._state_per_partition.pop(oldest_partition_key, None)
+                    self._partition_serializer.release(oldest_partition_key)
                     logger.warning(
                         f"The maximum number of partitions has been reached. Dropping the oldest partition: {oldest_partition}. Over limit: {self._number_of_partitions - self.DEFAULT_MAX_PARTITIONS_NUMBER}."
                     )
@@ -463,6 +508,9 @@ class ConcurrentPerPartitionCursor(Cursor):
                 self._to_partition_key(record.associated_slice.partition)
             ].observe(record)
 
+    def extract_cursor_value(self, record: Record) -> Optional[Any]:
+        return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
+
     def _update_global_cursor(self, value: Any) -> None:
         if (
             self._new_global_cursor is None
@@ -470,10 +518,10 @@ class ConcurrentPerPartitionCursor(Cursor):
         ):
             self._new_global_cursor = {self.cursor_field.cursor_field_key: copy.deepcopy(value)}
 
-    def _to_partition_key(self, partition: Mapping[str, Any]) -> str:
+    def _to_partition_key(self, partition: Mapping[str, Any]) -> PartitionKey:
         return self._partition_serializer.to_partition_key(partition)
 
-    def _to_dict(self, partition_key: str) -> Mapping[str, Any]:
+    def _to_dict(self, partition_key: PartitionKey) -> Mapping[str, Any]:
         return self._partition_serializer.to_partition(partition_key)
 
     def _create_cursor(
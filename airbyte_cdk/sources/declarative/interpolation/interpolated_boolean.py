@@ -41,6 +41,12 @@ class InterpolatedBoolean:
         self._default = "False"
         self._interpolation = JinjaInterpolation()
         self._parameters = parameters
+        # conditions are usually evaluated for every record so the common expressions are compiled once
+        self._compiled_condition = (
+            None
+            if isinstance(self.condition, bool)
+            else self._interpolation.compile_expression(self.condition, self._default)
+        )
 
     def eval(self, config: Config, **additional_parameters: Any) -> bool:
         """
@@ -52,6 +58,10 @@ class InterpolatedBoolean:
         """
         if isinstance(self.condition, bool):
             return self.condition
+        elif self._compiled_condition:
+            evaluated = self._compiled_condition(
+                config, parameters=self._parameters, **additional_parameters
+            )
         else:
             evaluated = self._interpolation.eval(
                 self.condition,
@@ -60,7 +70,7 @@ class InterpolatedBoolean:
                 parameters=self._parameters,
                 **additional_parameters,
             )
-            if evaluated in FALSE_VALUES:
-                return False
-            # The presence of a value is generally regarded as truthy, so we treat it as such
-            return True
+        if evaluated in FALSE_VALUES:
+            return False
+        # The presence of a value is generally regarded as truthy, so we treat it as such
+        return True
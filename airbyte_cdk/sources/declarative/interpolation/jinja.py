@@ -3,10 +3,11 @@
 #
 
 import ast
+import operator
 from functools import cache
-from typing import Any, Mapping, Optional, Set, Tuple, Type
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, cast
 
-from jinja2 import meta
+from jinja2 import meta, nodes
 from jinja2.environment import Template
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import SandboxedEnvironment
@@ -90,16 +91,7 @@ class JinjaInterpolation(Interpolation):
         valid_types: Optional[Tuple[Type[Any]]] = None,
         **additional_parameters: Any,
     ) -> Any:
-        context = {"config": config, **additional_parameters}
-
-        for alias, equivalent in _ALIASES.items():
-            if alias in context:
-                # This is unexpected. We could ignore or log a warning, but failing loudly should result in fewer surprises
-                raise ValueError(
-                    f"Found reserved keyword {alias} in interpolation context. This is unexpected and indicative of a bug in the CDK."
-                )
-            elif equivalent in context:
-                context[alias] = context[equivalent]
+        context = self._create_context(config, additional_parameters)
 
         for variable_name in _UNSUPPORTED_INTERPOLATION_VARIABLES:
             if variable_name in input_str:
@@ -122,6 +114,55 @@ class JinjaInterpolation(Interpolation):
         # If result is empty or resulted in an undefined error, evaluate and return the default string
         return self._literal_eval(self._eval(default, context), valid_types)
 
+    def compile_expression(
+        self, input_str: str, default: Optional[str] = None
+    ) -> Optional[Callable[..., Any]]:
+        """
+        Compile a template made of a single `{{ expression }}` into a Python callable returning the same value as
+        `eval(input_str, config, default, **additional_parameters)` when called with `(config, **additional_parameters)`.
+
+        Evaluating the compiled expression skips the template rendering and the checks `eval` does on every call, which
+        matters for templates evaluated once per record. Only a subset of expressions is supported: constants, variables
+        from the context, item and attribute access, comparisons, `and`/`or`/`not` and the `defined`, `undefined` and
+        `none` tests. Item and attribute access go through the sandboxed environment like in templates.
+
+        :return: the compiled expression or None if the template can't be compiled, in which case `eval` should be used
+        """
+        if not isinstance(input_str, str) or any(
+            variable_name in input_str for variable_name in _UNSUPPORTED_INTERPOLATION_VARIABLES
+        ):
+            return None
+        try:
+            template = _ENVIRONMENT.parse(input_str)
+            variables = self._find_undeclared_variables(input_str)
+        except Exception:
+            return None
+        if len(template.body) != 1 or not isinstance(template.body[0], nodes.Output):
+            return None
+        output = template.body[0].nodes
+        if len(output) != 1 or isinstance(output[0], nodes.TemplateData):
+            return None
+        try:
+            evaluate = _compile_node(output[0], variables)
+        except _UnsupportedExpressionError:
+            return None
+        return _CompiledExpression(self, input_str, default, variables, evaluate).eval
+
+    def _create_context(
+        self, config: Config, additional_parameters: Mapping[str, Any]
+    ) -> Dict[str, Any]:
+        context = {"config": config, **additional_parameters}
+
+        for alias, equivalent in _ALIASES.items():
+            if alias in context:
+                # This is unexpected. We could ignore or log a warning, but failing loudly should result in fewer surprises
+                raise ValueError(
+                    f"Found reserved keyword {alias} in interpolation context. This is unexpected and indicative of a bug in the CDK."
+                )
+            elif equivalent in context:
+                context[alias] = context[equivalent]
+        return context
+
     def _literal_eval(self, result: Optional[str], valid_types: Optional[Tuple[Type[Any]]]) -> Any:
         try:
             evaluated = ast.literal_eval(result)  # type: ignore # literal_eval is able to handle None
@@ -159,3 +200,150 @@ class JinjaInterpolation(Interpolation):
         We must cache the Jinja Template ourselves because we're using `from_string` instead of a template loader
         """
         return _ENVIRONMENT.from_string(s)
+
+
+class _UnsupportedExpressionError(Exception):
+    pass
+
+
+_Evaluate = Callable[[Mapping[str, Any]], Any]
+
+# Operators as generated by jinja2.compiler for `nodes.Compare`
+_COMPARISON_OPERATORS: Mapping[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda left, right: left in right,
+    "notin": lambda left, right: left not in right,
+}
+_SUPPORTED_TESTS = ("defined", "undefined", "none")
+
+
+def _compile_node(node: nodes.Node, variables: Set[str]) -> _Evaluate:
+    """
+    Compile a Jinja expression node into a function of the context mirroring the code jinja2.compiler generates for it.
+    Names that are not part of the variables expected in the context (e.g. macros) are not supported.
+    """
+    if isinstance(node, nodes.Const):
+        value = node.value
+        return lambda context: value
+    if isinstance(node, nodes.Name) and node.ctx == "load" and node.name in variables:
+        name = node.name
+        return lambda context: context[name]
+    if isinstance(node, (nodes.List, nodes.Tuple)) and getattr(node, "ctx", "load") == "load":
+        items = [_compile_node(item, variables) for item in node.items]
+        if isinstance(node, nodes.Tuple):
+            return lambda context: tuple(item(context) for item in items)
+        return lambda context: [item(context) for item in items]
+    if (
+        isinstance(node, nodes.Getitem)
+        and node.ctx == "load"
+        and not isinstance(node.arg, nodes.Slice)
+    ):
+        getitem = _ENVIRONMENT.getitem
+        item_container = _compile_node(node.node, variables)
+        item_key = _compile_node(node.arg, variables)
+        return lambda context: getitem(item_container(context), item_key(context))
+    if isinstance(node, nodes.Getattr) and node.ctx == "load":
+        getattr_ = _ENVIRONMENT.getattr
+        attribute_owner = _compile_node(node.node, variables)
+        attribute = node.attr
+        return lambda context: getattr_(attribute_owner(context), attribute)
+    if isinstance(node, nodes.Compare):
+        return _compile_comparison(node, variables)
+    if isinstance(node, nodes.And):
+        left, right = _compile_node(node.left, variables), _compile_node(node.right, variables)
+        return lambda context: left(context) and right(context)
+    if isinstance(node, nodes.Or):
+        left, right = _compile_node(node.left, variables), _compile_node(node.right, variables)
+        return lambda context: left(context) or right(context)
+    if isinstance(node, nodes.Not):
+        operand = _compile_node(node.node, variables)
+        return lambda context: not operand(context)
+    if (
+        isinstance(node, nodes.Test)
+        and node.name in _SUPPORTED_TESTS
+        and not node.args
+        and not node.kwargs
+        and node.dyn_args is None
+        and node.dyn_kwargs is None
+    ):
+        test = cast(Callable[[Any], bool], _ENVIRONMENT.tests[node.name])
+        tested = _compile_node(node.node, variables)
+        return lambda context: test(tested(context))
+    raise _UnsupportedExpressionError()
+
+
+def _compile_comparison(node: nodes.Compare, variables: Set[str]) -> _Evaluate:
+    first = _compile_node(node.expr, variables)
+    operands: List[Tuple[Callable[[Any, Any], Any], _Evaluate]] = []
+    for operand in node.ops:
+        if operand.op not in _COMPARISON_OPERATORS:
+            raise _UnsupportedExpressionError()
+        operands.append((_COMPARISON_OPERATORS[operand.op], _compile_node(operand.expr, variables)))
+
+    if len(operands) == 1:
+        compare, second = operands[0]
+        return lambda context: compare(first(context), second(context))
+
+    def compare_chain(context: Mapping[str, Any]) -> Any:
+        # same semantic as Python's chained comparisons
+        left = first(context)
+        result: Any = True
+        for compare, evaluate_right in operands:
+            right = evaluate_right(context)
+            result = compare(left, right)
+            if not result:
+                return result
+            left = right
+        return result
+
+    return compare_chain
+
+
+class _CompiledExpression:
+    def __init__(
+        self,
+        interpolation: JinjaInterpolation,
+        input_str: str,
+        default: Optional[str],
+        variables: Set[str],
+        evaluate: _Evaluate,
+    ) -> None:
+        self._interpolation = interpolation
+        self._input_str = input_str
+        self._default = default
+        self._variables = variables
+        self._evaluate = evaluate
+
+    def eval(self, config: Config, **additional_parameters: Any) -> Any:
+        context = self._interpolation._create_context(config, additional_parameters)
+        if not self._variables.issubset(context):
+            # let the template evaluation report the missing variables
+            return self._interpolation.eval(
+                self._input_str, config, self._default, **additional_parameters
+            )
+        try:
+            value = self._evaluate(context)
+            if value is True or value is False:
+                return value
+            # the template would output the value as a string and `eval` would parse it back
+            rendered = str(value)
+        except UndefinedError:
+            return self._interpolation._literal_eval(
+                self._interpolation._eval(self._default, context), None
+            )
+        except Exception:
+            # errors are handled in specific ways by the template evaluation so we let it handle them
+            return self._interpolation.eval(
+                self._input_str, config, self._default, **additional_parameters
+            )
+
+        if rendered:
+            return self._interpolation._literal_eval(rendered, None)
+        return self._interpolation._literal_eval(
+            self._interpolation._eval(self._default, context), None
+        )
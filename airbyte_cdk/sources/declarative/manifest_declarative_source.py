@@ -270,6 +270,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if api_budget_model:
             self._constructor.set_api_budget(api_budget_model, config)
 
+        self._constructor.reset_parent_record_cache()
         source_streams = [
             self._constructor.create_component(
                 (
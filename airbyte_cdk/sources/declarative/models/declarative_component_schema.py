@@ -86,6 +86,23 @@ class ConcurrencyLevel(BaseModel):
         examples=[20, 100],
         title="Max Concurrency",
     )
+    max_queue_size_in_bytes: Union[int, str, None] = Field(
+        None,
+        description="When set, the queue holding the records read by the worker threads is bounded by the estimated size of the records it contains instead of a fixed number of items. This limits the memory used by syncs of wide records without slowing down syncs of small records.",
+        examples=[104857600, "{{ config['max_queue_size_in_bytes'] or 104857600 }}"],
+        title="Max Queue Size In Bytes",
+    )
+    record_batch_size: Optional[int] = Field(
+        1,
+        description="The number of records the worker threads put in the queue as a single item. Batching records reduces the contention on the queue when many partitions are read at the same time.",
+        examples=[1, 100],
+        title="Record Batch Size",
+    )
+    read_partitions_in_processes: Optional[bool] = Field(
+        False,
+        description="When enabled, the partitions are read by a pool of worker processes, one per unit of concurrency, instead of worker threads so that CPU-bound streams (e.g. heavy decoding or transformations) are not limited to a single core. Each worker process builds its own components from the manifest so state shared between components, such as call rate budgets, is not shared between processes.",
+        title="Read Partitions In Processes",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -858,6 +875,17 @@ class JsonFileSchemaLoader(BaseModel):
 
 class JsonDecoder(BaseModel):
     type: Literal["JsonDecoder"]
+    streaming: Optional[bool] = Field(
+        False,
+        description="Parse the response as it is received and emit the records one by one instead of loading the whole response in memory. The records need to be the elements of a JSON array located at the root of the response or at `records_path`. As the response is consumed while being parsed, the response body can't be used for pagination.",
+        title="Streaming",
+    )
+    records_path: Optional[List[str]] = Field(
+        None,
+        description="Path to the array of records in the response when `streaming` is enabled. Leave empty if the response is an array of records. As records are extracted by the decoder, the field path of the record extractor should be left empty.",
+        examples=[["data"], ["response", "items"]],
+        title="Records Path",
+    )
 
 
 class JsonlDecoder(BaseModel):
@@ -1250,6 +1278,11 @@ class PropertyChunking(BaseModel):
         description="Dictates how to records that require multiple requests to get all properties should be emitted to the destination",
         title="Record Merge Strategy",
     )
+    max_concurrent_requests: Optional[int] = Field(
+        1,
+        description="The maximum number of property chunks of a page that are requested at the same time. The responses are merged in the order of the chunks so records are the same as when the chunks are requested one after the other. Each request is still subject to the API budget.",
+        title="Maximum Concurrent Requests",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
@@ -1839,6 +1872,11 @@ class DefaultPaginator(BaseModel):
     page_token_option: Optional[Union[RequestOption, RequestPath]] = Field(
         None, title="Inject Page Token Into Outgoing HTTP Request"
     )
+    prefetch_pages: Optional[int] = Field(
+        0,
+        description="The number of pages requested ahead while the current page is read. Only the PageIncrement and OffsetIncrement strategies can predict the next pages, assuming every page is full. Pages are still emitted in order and the pages requested beyond the last page are discarded, including their errors. Speculative requests count against the API budget.",
+        title="Prefetched Pages",
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias="$parameters")
 
 
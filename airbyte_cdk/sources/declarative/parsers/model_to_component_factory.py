@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import importlib
 import inspect
 import re
@@ -428,6 +429,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
 from airbyte_cdk.sources.declarative.partition_routers.async_job_partition_router import (
     AsyncJobPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
 )
@@ -586,6 +590,7 @@ class ModelToComponentFactory:
         message_repository: Optional[MessageRepository] = None,
         connector_state_manager: Optional[ConnectorStateManager] = None,
         max_concurrent_async_job_count: Optional[int] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -600,6 +605,9 @@ class ModelToComponentFactory:
         self._connector_state_manager = connector_state_manager or ConnectorStateManager()
         self._api_budget: Optional[Union[APIBudget, HttpAPIBudget]] = None
         self._job_tracker: JobTracker = JobTracker(max_concurrent_async_job_count or 1)
+        self._parent_record_cache: Optional[ParentRecordCache] = (
+            None if disable_cache else parent_record_cache or ParentRecordCache()
+        )
         # placeholder for deprecation warnings
         self._collected_deprecation_logs: List[ConnectorBuilderLogMessage] = []
 
@@ -1096,6 +1104,9 @@ class ModelToComponentFactory:
             max_concurrency=model.max_concurrency,
             config=config,
             parameters={},
+            max_queue_size_in_bytes=model.max_queue_size_in_bytes,
+            record_batch_size=model.record_batch_size or 1,
+            read_partitions_in_processes=bool(model.read_partitions_in_processes),
         )
 
     @staticmethod
@@ -2158,6 +2169,7 @@ class ModelToComponentFactory:
             url_base=url_base,
             config=config,
             parameters=model.parameters or {},
+            prefetch_pages=model.prefetch_pages or 0,
         )
         if self._limit_pages_fetched_per_slice:
             return PaginatorTestReadDecorator(paginator, self._limit_pages_fetched_per_slice)
@@ -2395,8 +2407,14 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
-    @staticmethod
-    def create_json_decoder(model: JsonDecoderModel, config: Config, **kwargs: Any) -> Decoder:
+    def create_json_decoder(
+        self, model: JsonDecoderModel, config: Config, **kwargs: Any
+    ) -> Decoder:
+        if model.streaming:
+            return CompositeRawDecoder(
+                parser=ModelToComponentFactory._get_parser(model, config),
+                stream_response=False if self._emit_connector_builder_messages else True,
+            )
         return JsonDecoder(parameters={})
 
     def create_csv_decoder(self, model: CsvDecoderModel, config: Config, **kwargs: Any) -> Decoder:
@@ -2476,7 +2494,9 @@ class ModelToComponentFactory:
     def _get_parser(model: BaseModel, config: Config) -> Parser:
         if isinstance(model, JsonDecoderModel):
             # Note that the logic is a bit different from the JsonDecoder as there is some legacy that is maintained to return {} on error cases
-            return JsonParser()
+            return JsonParser(
+                streaming=bool(model.streaming), records_path=model.records_path or []
+            )
         elif isinstance(model, JsonlDecoderModel):
             return JsonLineParser()
         elif isinstance(model, CsvDecoderModel):
@@ -2737,6 +2757,11 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
             extra_fields=model.extra_fields,
             lazy_read_pointer=model_lazy_read_pointer,
+            record_cache=self._parent_record_cache,
+            # parent streams share their records only if they are defined the same way
+            record_cache_key=hashlib.sha256(model.stream.json(sort_keys=True).encode()).hexdigest()
+            if self._parent_record_cache
+            else None,
         )
 
     def create_properties_from_endpoint(
@@ -2784,6 +2809,10 @@ class ModelToComponentFactory:
             record_merge_strategy=record_merge_strategy,
             config=config,
             parameters=model.parameters or {},
+            # requests are sent one after the other in the connector builder so that the logged requests keep their order
+            max_concurrent_requests=1
+            if self._emit_connector_builder_messages
+            else model.max_concurrent_requests or 1,
         )
 
     def create_query_properties(
@@ -3486,6 +3515,7 @@ class ModelToComponentFactory:
             emit_connector_builder_messages=self._emit_connector_builder_messages,
             disable_retries=self._disable_retries,
             disable_cache=self._disable_cache,
+            parent_record_cache=self._parent_record_cache,
             message_repository=LogAppenderMessageRepositoryDecorator(
                 {"airbyte_cdk": {"stream": {"is_substream": True}}, "http": {"is_auxiliary": True}},
                 self._message_repository,
@@ -3532,6 +3562,14 @@ class ModelToComponentFactory:
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def reset_parent_record_cache(self) -> None:
+        """
+        Use a new parent record cache for the components created from now on so that streams created again, for example for
+        another read, do not replay the records read by the previous ones.
+        """
+        if self._parent_record_cache is not None:
+            self._parent_record_cache = ParentRecordCache()
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
 
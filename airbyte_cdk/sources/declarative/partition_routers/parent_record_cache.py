@@ -0,0 +1,238 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import math
+import os
+import tempfile
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+import orjson
+
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+logger = logging.getLogger("airbyte")
+
+# A parent record and the partition of the parent slice it was read from
+ParentRecord = Tuple[Mapping[str, Any], Optional[Mapping[str, Any]]]
+
+# Values orjson would silently convert (datetimes, dataclasses, subclasses of builtins) make the serialization fail instead
+# so that the cached records are the same as the ones read from the parent stream.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ParentRecordCacheStats:
+    hits: int
+    misses: int
+    cached_reads: int
+    cached_records: int
+    memory_bytes: int
+    spilled_bytes: int
+
+
+class _CachedRead:
+    """
+    Serialized records of a complete parent read. Records are kept in memory until the cache runs out of memory budget,
+    then the read is spilled to a file. Once the read is published in the cache, it is never modified.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[bytes] = []
+        self.spill_path: Optional[str] = None
+        self.spill_file: Optional[Any] = None
+        self.size = 0
+        self.record_count = 0
+
+    def records(self) -> Iterator[ParentRecord]:
+        if self.spill_path is None:
+            for line in self.lines:
+                yield _deserialize(line)
+            return
+
+        with open(self.spill_path, "rb", buffering=_READ_BUFFER_SIZE) as spill_file:
+            for line in spill_file:
+                yield _deserialize(line)
+
+
+def _deserialize(line: bytes) -> ParentRecord:
+    data, partition = orjson.loads(line)
+    return data, partition
+
+
+def _is_kept_by_json(value: Any) -> bool:
+    """
+    Return False for the values orjson serializes but does not read back as they were: non-finite floats become `null`
+    and tuples become lists.
+    """
+    if isinstance(value, dict):
+        return all(_is_kept_by_json(item) for item in value.values())
+    if isinstance(value, list):
+        return all(_is_kept_by_json(item) for item in value)
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return not isinstance(value, tuple)
+
+
+def _remove_files(paths: Set[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    paths.clear()
+
+
+class ParentRecordCache:
+    """
+    Caches the records read from parent streams so that child streams sharing the same parent do not read it again: the
+    records of a parent read are stored as they are yielded and replayed to the following readers without going through
+    the requests, the decoding or the record selection.
+
+    A read is only cached once it completes, so readers that stop early or fail do not leave partial reads behind. Records
+    are stored serialized and accounted against `max_memory_bytes`. Reads that do not fit in memory are spilled to files in
+    the REQUEST_CACHE_PATH directory, or in the temporary directory if it is not set. Records that cannot be serialized as
+    JSON without being altered are not cached.
+    """
+
+    DEFAULT_MAX_MEMORY_BYTES = 128 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        spill_directory: Optional[str] = None,
+    ) -> None:
+        self._max_memory_bytes = max_memory_bytes
+        self._spill_directory = spill_directory
+        self._lock = threading.Lock()
+        self._reads: Dict[str, _CachedRead] = {}
+        self._memory_bytes = 0
+        self._spilled_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._spill_paths: Set[str] = set()
+        # spilled files are removed once the cache is not used anymore
+        weakref.finalize(self, _remove_files, self._spill_paths)
+
+    @property
+    def stats(self) -> ParentRecordCacheStats:
+        with self._lock:
+            return ParentRecordCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                cached_reads=len(self._reads),
+                cached_records=sum(read.record_count for read in self._reads.values()),
+                memory_bytes=self._memory_bytes,
+                spilled_bytes=self._spilled_bytes,
+            )
+
+    def read(
+        self, key: str, read_records: Callable[[], Iterable[ParentRecord]]
+    ) -> Iterable[ParentRecord]:
+        """
+        Yield the records cached for `key`, or the records of `read_records` which are cached if they are all read.
+        """
+        with self._lock:
+            cached_read = self._reads.get(key)
+            if cached_read is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if cached_read is not None:
+            yield from cached_read.records()
+            return
+
+        pending_read: Optional[_CachedRead] = _CachedRead()
+        try:
+            for record in read_records():
+                if pending_read is not None and not self._add(pending_read, record):
+                    self._discard(pending_read)
+                    pending_read = None
+                yield record
+        except BaseException:
+            # includes GeneratorExit when the reader stops early
+            if pending_read is not None:
+                self._discard(pending_read)
+            raise
+
+        if pending_read is not None:
+            self._publish(key, pending_read)
+
+    def _add(self, pending_read: _CachedRead, record: ParentRecord) -> bool:
+        try:
+            line = orjson.dumps(record, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            logger.debug("Parent records that can't be serialized as JSON are not cached")
+            return False
+        if not all(_is_kept_by_json(value) for value in record):
+            logger.debug("Parent records that JSON would alter are not cached")
+            return False
+
+        with self._lock:
+            fits_in_memory = (
+                pending_read.spill_path is None
+                and self._memory_bytes + len(line) <= self._max_memory_bytes
+            )
+            if fits_in_memory:
+                self._memory_bytes += len(line)
+            else:
+                self._spilled_bytes += len(line)
+        if fits_in_memory:
+            pending_read.lines.append(line)
+        else:
+            if pending_read.spill_file is None:
+                self._spill(pending_read)
+            pending_read.spill_file.write(line)  # type: ignore[union-attr]  # the read was just spilled
+        pending_read.size += len(line)
+        pending_read.record_count += 1
+        return True
+
+    def _spill(self, pending_read: _CachedRead) -> None:
+        spill_directory = self._spill_directory or os.getenv(ENV_REQUEST_CACHE_PATH)
+        file_descriptor, spill_path = tempfile.mkstemp(
+            prefix="parent_records_", suffix=".jsonl", dir=spill_directory
+        )
+        in_memory_bytes = sum(len(line) for line in pending_read.lines)
+        with self._lock:
+            self._spill_paths.add(spill_path)
+            self._memory_bytes -= in_memory_bytes
+            self._spilled_bytes += in_memory_bytes
+        pending_read.spill_path = spill_path
+        pending_read.spill_file = os.fdopen(file_descriptor, "wb")
+        pending_read.spill_file.writelines(pending_read.lines)
+        pending_read.lines = []
+
+    def _discard(self, pending_read: _CachedRead) -> None:
+        in_memory_bytes = sum(len(line) for line in pending_read.lines)
+        pending_read.lines = []
+        if pending_read.spill_file is not None:
+            pending_read.spill_file.close()
+        with self._lock:
+            self._memory_bytes -= in_memory_bytes
+            if pending_read.spill_path is not None:
+                self._spilled_bytes -= pending_read.size
+                self._spill_paths.discard(pending_read.spill_path)
+        if pending_read.spill_path is not None:
+            _remove_files({pending_read.spill_path})
+
+    def _publish(self, key: str, pending_read: _CachedRead) -> None:
+        if pending_read.spill_file is not None:
+            pending_read.spill_file.close()
+            pending_read.spill_file = None
+        with self._lock:
+            already_cached = key in self._reads
+            if not already_cached:
+                self._reads[key] = pending_read
+        if already_cached:
+            # another reader of the same parent completed first
+            self._discard(pending_read)
@@ -9,12 +9,15 @@ import logging
 from dataclasses import InitVar, dataclass
 from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
-import dpath
 import requests
 
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecord,
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.partition_router import PartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import (
     RequestOption,
@@ -22,6 +25,7 @@ from airbyte_cdk.sources.declarative.requesters.request_option import (
 )
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.utils import AirbyteTracedException
+from airbyte_cdk.utils.dpath_accessor import DpathAccessor
 
 if TYPE_CHECKING:
     from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
@@ -38,6 +42,8 @@ class ParentStreamConfig:
     extra_fields: Additional field paths to include in the stream slice
     request_option: How to inject the slice value on an outgoing HTTP request
     incremental_dependency (bool): Indicates if the parent stream should be read incrementally.
+    record_cache: Cache shared by the parent streams with the same definition, keyed by `record_cache_key`. It is only used
+        for parent streams that are not read incrementally as the records of those do not depend on the parent state.
     """
 
     stream: "DeclarativeStream"  # Parent streams must be DeclarativeStream because we can't know which part of the stream slice is a partition for regular Stream
@@ -51,6 +57,8 @@ class ParentStreamConfig:
     request_option: Optional[RequestOption] = None
     incremental_dependency: bool = False
     lazy_read_pointer: Optional[List[Union[InterpolatedString, str]]] = None
+    record_cache: Optional[ParentRecordCache] = None
+    record_cache_key: Optional[str] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self.parent_key = InterpolatedString.create(self.parent_key, parameters=parameters)
@@ -167,56 +175,40 @@ class SubstreamPartitionRouter(PartitionRouter):
         else:
             for parent_stream_config in self.parent_stream_configs:
                 parent_stream = parent_stream_config.stream
-                parent_field = parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+                parent_field = DpathAccessor(
+                    parent_stream_config.parent_key.eval(self.config)  # type: ignore # parent_key is always casted to an interpolated string
+                )
                 partition_field = parent_stream_config.partition_field.eval(self.config)  # type: ignore # partition_field is always casted to an interpolated string
                 extra_fields = None
                 if parent_stream_config.extra_fields:
                     extra_fields = [
-                        [field_path_part.eval(self.config) for field_path_part in field_path]  # type: ignore [union-attr]
+                        DpathAccessor(
+                            [field_path_part.eval(self.config) for field_path_part in field_path]  # type: ignore [union-attr]
+                        )
                         for field_path in parent_stream_config.extra_fields
                     ]
+                lazy_read_pointer = None
+                if parent_stream_config.lazy_read_pointer:
+                    lazy_read_pointer = DpathAccessor(
+                        [path.eval(self.config) for path in parent_stream_config.lazy_read_pointer]  # type: ignore[union-attr]  # lazy_read_pointer type handeled in __post_init__ of parent_stream_config
+                    )
 
-                # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
-                # not support either substreams or RFR, but something that needs to be considered once we do
-                for parent_record in parent_stream.read_only_records():
-                    parent_partition = None
-                    # Skip non-records (eg AirbyteLogMessage)
-                    if isinstance(parent_record, AirbyteMessage):
-                        self.logger.warning(
-                            f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
-                        )
-                        if parent_record.type == MessageType.RECORD:
-                            parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
-                        else:
-                            continue
-                    elif isinstance(parent_record, Record):
-                        parent_partition = (
-                            parent_record.associated_slice.partition
-                            if parent_record.associated_slice
-                            else {}
-                        )
-                        parent_record = parent_record.data
-                    elif not isinstance(parent_record, Mapping):
-                        # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
-                        raise AirbyteTracedException(
-                            message=f"Parent stream returned records as invalid type {type(parent_record)}"
-                        )
+                for parent_record, parent_partition in self._read_parent_records(
+                    parent_stream_config
+                ):
                     try:
-                        partition_value = dpath.get(
-                            parent_record,  # type: ignore [arg-type]
-                            parent_field,
-                        )
+                        partition_value = parent_field.get(parent_record)
                     except KeyError:
                         continue
 
                     # Add extra fields
                     extracted_extra_fields = self._extract_extra_fields(parent_record, extra_fields)
 
-                    if parent_stream_config.lazy_read_pointer:
+                    if lazy_read_pointer:
                         extracted_extra_fields = {
                             "child_response": self._extract_child_response(
                                 parent_record,
-                                parent_stream_config.lazy_read_pointer,  # type: ignore[arg-type]  # lazy_read_pointer type handeled in __post_init__ of parent_stream_config
+                                lazy_read_pointer,
                             ),
                             **extracted_extra_fields,
                         }
@@ -230,8 +222,51 @@ class SubstreamPartitionRouter(PartitionRouter):
                         extra_fields=extracted_extra_fields,
                     )
 
+    def _read_parent_records(
+        self, parent_stream_config: ParentStreamConfig
+    ) -> Iterable[ParentRecord]:
+        record_cache = parent_stream_config.record_cache
+        if (
+            record_cache is None
+            or parent_stream_config.record_cache_key is None
+            or parent_stream_config.incremental_dependency
+        ):
+            return self._read_parent_stream(parent_stream_config.stream)
+        return record_cache.read(
+            parent_stream_config.record_cache_key,
+            lambda: self._read_parent_stream(parent_stream_config.stream),
+        )
+
+    def _read_parent_stream(self, parent_stream: "DeclarativeStream") -> Iterable[ParentRecord]:
+        # read_stateless() assumes the parent is not concurrent. This is currently okay since the concurrent CDK does
+        # not support either substreams or RFR, but something that needs to be considered once we do
+        for parent_record in parent_stream.read_only_records():
+            parent_partition = None
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                self.logger.warning(
+                    f"Parent stream {parent_stream.name} returns records of type AirbyteMessage. This SubstreamPartitionRouter is not able to checkpoint incremental parent state."
+                )
+                if parent_record.type == MessageType.RECORD:
+                    parent_record = parent_record.record.data  # type: ignore[union-attr, assignment]  # record is always a Record
+                else:
+                    continue
+            elif isinstance(parent_record, Record):
+                parent_partition = (
+                    parent_record.associated_slice.partition
+                    if parent_record.associated_slice
+                    else {}
+                )
+                parent_record = parent_record.data
+            elif not isinstance(parent_record, Mapping):
+                # The parent_record should only take the form of a Record, AirbyteMessage, or Mapping. Anything else is invalid
+                raise AirbyteTracedException(
+                    message=f"Parent stream returned records as invalid type {type(parent_record)}"
+                )
+            yield parent_record, parent_partition
+
     def _extract_child_response(
-        self, parent_record: Mapping[str, Any] | AirbyteMessage, pointer: List[InterpolatedString]
+        self, parent_record: Mapping[str, Any] | AirbyteMessage, pointer: DpathAccessor
     ) -> requests.Response:
         """Extract child records from a parent record based on lazy pointers."""
 
@@ -242,20 +277,19 @@ class SubstreamPartitionRouter(PartitionRouter):
             response.status_code = 200
             return response
 
-        path = [path.eval(self.config) for path in pointer]
-        return _create_response(dpath.get(parent_record, path, default=[]))  # type: ignore # argunet will be a MutableMapping, given input data structure
+        return _create_response(pointer.get(parent_record, default=[]))
 
     def _extract_extra_fields(
         self,
         parent_record: Mapping[str, Any] | AirbyteMessage,
-        extra_fields: Optional[List[List[str]]] = None,
+        extra_fields: Optional[List[DpathAccessor]] = None,
     ) -> Mapping[str, Any]:
         """
         Extracts additional fields specified by their paths from the parent record.
 
         Args:
             parent_record (Mapping[str, Any]): The record from the parent stream to extract fields from.
-            extra_fields (Optional[List[List[str]]]): A list of field paths (as lists of strings) to extract from the parent record.
+            extra_fields (Optional[List[DpathAccessor]]): A list of field paths to extract from the parent record.
 
         Returns:
             Mapping[str, Any]: A dictionary containing the extracted fields.
@@ -263,12 +297,10 @@ class SubstreamPartitionRouter(PartitionRouter):
         """
         extracted_extra_fields = {}
         if extra_fields:
-            for extra_field_path in extra_fields:
+            for extra_field in extra_fields:
+                extra_field_path = extra_field.path
                 try:
-                    extra_field_value = dpath.get(
-                        parent_record,  # type: ignore [arg-type]
-                        extra_field_path,
-                    )
+                    extra_field_value = extra_field.get(parent_record)
                     self.logger.debug(
                         f"Extracted extra_field_path: {extra_field_path} with value: {extra_field_value}"
                     )
@@ -8,6 +8,7 @@ from typing import Any, Mapping, Optional, Set, Union
 import requests
 
 from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.declarative.decoders.decoded_response_cache import decode_once
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
 from airbyte_cdk.sources.streams.http.error_handlers import JsonErrorMessageParser
@@ -140,10 +141,8 @@ class HttpResponseFilter:
 
     @staticmethod
     def _safe_response_json(response: requests.Response) -> dict[str, Any]:
-        try:
-            return response.json()  # type: ignore # Response.json() returns a dictionary even if the signature does not
-        except requests.exceptions.JSONDecodeError:
-            return {}
+        # the predicate and the error message of every filter are evaluated on the same body
+        return decode_once(response, HttpResponseFilter, lambda: _response_json(response))
 
     def _create_error_message(self, response: requests.Response) -> Optional[str]:
         """
@@ -177,3 +176,10 @@ class HttpResponseFilter:
                 response=response
             )
             return bool(error_message and self.error_message_contains in error_message)
+
+
+def _response_json(response: requests.Response) -> dict[str, Any]:
+    try:
+        return response.json()  # type: ignore # Response.json() returns a dictionary even if the signature does not
+    except requests.exceptions.JSONDecodeError:
+        return {}
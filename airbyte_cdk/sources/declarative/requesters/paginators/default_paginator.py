@@ -3,7 +3,7 @@
 #
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Mapping, MutableMapping, Optional, Union
+from typing import Any, List, Mapping, MutableMapping, Optional, Union
 
 import requests
 
@@ -97,6 +97,7 @@ class DefaultPaginator(Paginator):
         config (Config): connection config
         url_base (Union[InterpolatedString, str]): endpoint's base url
         decoder (Decoder): decoder to decode the response
+        prefetch_pages (int): the number of pages requested ahead if the pagination strategy can predict the next page tokens
     """
 
     pagination_strategy: PaginationStrategy
@@ -108,8 +109,13 @@ class DefaultPaginator(Paginator):
     )
     page_size_option: Optional[RequestOption] = None
     page_token_option: Optional[Union[RequestPath, RequestOption]] = None
+    prefetch_pages: int = 0
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.prefetch_pages < 0:
+            raise ValueError(
+                f"The number of prefetched pages cannot be negative. Got {self.prefetch_pages}"
+            )
         if self.page_size_option and not self.pagination_strategy.get_page_size():
             raise ValueError(
                 "page_size_option cannot be set if the pagination strategy does not have a page_size"
@@ -151,6 +157,19 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    def predict_next_page_tokens(
+        self, next_page_token: Optional[Mapping[str, Any]]
+    ) -> List[Mapping[str, Any]]:
+        predicted_tokens: List[Mapping[str, Any]] = []
+        token_value = next_page_token.get("next_page_token") if next_page_token else None
+        for _ in range(self.prefetch_pages):
+            token_value = self.pagination_strategy.predict_next_page_token(token_value)
+            # as for `next_page_token`, a falsy token means that there are no more pages
+            if not token_value:
+                break
+            predicted_tokens.append({"next_page_token": token_value})
+        return predicted_tokens
+
     def path(
         self,
         next_page_token: Optional[Mapping[str, Any]],
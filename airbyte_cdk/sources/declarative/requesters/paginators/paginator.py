@@ -4,7 +4,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from typing import Any, List, Mapping, Optional
 
 import requests
 
@@ -48,6 +48,18 @@ class Paginator(ABC, RequestOptionsProvider):
         """
         pass
 
+    def predict_next_page_tokens(
+        self, next_page_token: Optional[Mapping[str, Any]]
+    ) -> List[Mapping[str, Any]]:
+        """
+        Returns the tokens of the pages following the one requested with `next_page_token` that can be requested before
+        its response is received. The predictions are checked against `next_page_token` once the responses are received.
+
+        :param next_page_token: the token used to request the page being read
+        :return: The predicted tokens of the next pages in order. Returning an empty list means pages are not requested ahead.
+        """
+        return []
+
     @abstractmethod
     def path(
         self,
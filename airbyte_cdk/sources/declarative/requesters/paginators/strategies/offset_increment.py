@@ -102,6 +102,20 @@ class OffsetIncrement(PaginationStrategy):
         else:
             return last_page_token_value + last_page_size
 
+    def predict_next_page_token(self, last_page_token_value: Optional[Any]) -> Optional[Any]:
+        if not self._page_size or not (
+            last_page_token_value is None or isinstance(last_page_token_value, int)
+        ):
+            return None
+        try:
+            page_size = self.get_page_size()
+        except Exception:
+            # the page size can depend on the response which is not available yet
+            return None
+        if not page_size or page_size < 0:
+            return None
+        return (last_page_token_value or 0) + page_size
+
     def get_page_size(self) -> Optional[int]:
         if self._page_size:
             page_size = self._page_size.eval(self.config)
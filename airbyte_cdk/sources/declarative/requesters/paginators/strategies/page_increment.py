@@ -67,5 +67,12 @@ class PageIncrement(PaginationStrategy):
         else:
             return last_page_token_value + 1
 
+    def predict_next_page_token(self, last_page_token_value: Optional[Any]) -> Optional[Any]:
+        if last_page_token_value is None:
+            return self.start_from_page + 1
+        elif not isinstance(last_page_token_value, int):
+            return None
+        return last_page_token_value + 1
+
     def get_page_size(self) -> Optional[int]:
         return self._page_size
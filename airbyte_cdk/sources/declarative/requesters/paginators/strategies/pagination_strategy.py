@@ -41,6 +41,17 @@ class PaginationStrategy:
         """
         pass
 
+    def predict_next_page_token(self, last_page_token_value: Optional[Any]) -> Optional[Any]:
+        """
+        Predict the token of the page following the one requested with `last_page_token_value` before its response is
+        received, assuming that the page is full. The prediction is only used to request pages ahead: the token returned
+        by `next_page_token` once the response is received is the one that is trusted.
+
+        :param last_page_token_value: The value of the page token used to request the page
+        :return: the predicted token of the next page. Returns None if it can't be predicted without the response
+        """
+        return None
+
     @abstractmethod
     def get_page_size(self) -> Optional[int]:
         """
@@ -58,6 +58,9 @@ class StopConditionPaginationStrategyDecorator(PaginationStrategy):
             response, last_page_size, last_record, last_page_token_value
         )
 
+    def predict_next_page_token(self, last_page_token_value: Optional[Any]) -> Optional[Any]:
+        return self._delegate.predict_next_page_token(last_page_token_value)
+
     def get_page_size(self) -> Optional[int]:
         return self._delegate.get_page_size()
 
@@ -25,7 +25,8 @@ class PropertyLimitType(Enum):
 class PropertyChunking:
     """
     Defines the behavior for how the complete list of properties to query for are broken down into smaller groups
-    that will be used for multiple requests to the target API.
+    that will be used for multiple requests to the target API. Up to `max_concurrent_requests` chunks of the same
+    page are requested at the same time.
     """
 
     property_limit_type: PropertyLimitType
@@ -33,8 +34,13 @@ class PropertyChunking:
     record_merge_strategy: Optional[RecordMergeStrategy]
     parameters: InitVar[Mapping[str, Any]]
     config: Config
+    max_concurrent_requests: int = 1
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.max_concurrent_requests < 1:
+            raise ValueError(
+                f"The maximum number of concurrent requests for property chunks needs to be strictly positive. Got {self.max_concurrent_requests}"
+            )
         self._record_merge_strategy = self.record_merge_strategy or GroupByKey(
             key="id", config=self.config, parameters=parameters
         )
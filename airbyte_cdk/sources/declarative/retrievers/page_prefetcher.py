@@ -0,0 +1,84 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Mapping, Optional, Tuple
+
+import requests
+
+from airbyte_cdk.sources.declarative.requesters.paginators.paginator import Paginator
+
+
+class PagePrefetcher:
+    """
+    Fetches pages while requesting ahead the pages the paginator predicts will follow.
+
+    Each call to `fetch` returns the response for the requested token. If that token was predicted earlier, the response
+    that was requested ahead is used. Otherwise, the pages requested ahead are discarded: since predictions are chained,
+    a wrong prediction invalidates all the following ones. Errors raised while requesting a page are only surfaced if
+    the page is fetched, so that pages requested beyond the last one do not fail the read.
+
+    Pages are requested through `fetch_page` which is expected to go through the requester, so the API budget and the
+    error handler apply to every request, including the discarded ones.
+    """
+
+    def __init__(
+        self,
+        paginator: Paginator,
+        fetch_page: Callable[[Optional[Mapping[str, Any]]], Optional[requests.Response]],
+        thread_name_prefix: str,
+    ) -> None:
+        self._paginator = paginator
+        self._fetch_page = fetch_page
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched: Deque[Tuple[Mapping[str, Any], Future[Optional[requests.Response]]]] = (
+            deque()
+        )
+
+    def fetch(self, next_page_token: Optional[Mapping[str, Any]]) -> Optional[requests.Response]:
+        """
+        Return the response for `next_page_token` and request the next predicted pages ahead.
+        """
+        predicted_tokens = self._paginator.predict_next_page_tokens(next_page_token)
+
+        response: Optional[Future[Optional[requests.Response]]] = None
+        if self._prefetched and self._prefetched[0][0] == next_page_token:
+            response = self._prefetched.popleft()[1]
+        if [token for token, _ in self._prefetched] != predicted_tokens[: len(self._prefetched)]:
+            self._discard_prefetched_pages()
+
+        if predicted_tokens:
+            executor = self._get_executor(len(predicted_tokens) + 1)
+            if response is None:
+                response = executor.submit(self._fetch_page, next_page_token)
+            for token in predicted_tokens[len(self._prefetched) :]:
+                self._prefetched.append((token, executor.submit(self._fetch_page, token)))
+
+        if response is None:
+            return self._fetch_page(next_page_token)
+        return response.result()
+
+    def close(self) -> None:
+        """
+        Discard the pages requested ahead. Requests already sent are not awaited.
+        """
+        self._discard_prefetched_pages()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _discard_prefetched_pages(self) -> None:
+        for _, response in self._prefetched:
+            response.cancel()
+        self._prefetched.clear()
+
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        # the number of predicted pages is only known once the first page is fetched
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=self._thread_name_prefix
+            )
+        return self._executor
@@ -3,13 +3,15 @@
 #
 
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from functools import partial
 from itertools import islice
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -40,6 +42,7 @@ from airbyte_cdk.sources.declarative.requesters.request_options import (
     RequestOptionsProvider,
 )
 from airbyte_cdk.sources.declarative.requesters.requester import Requester
+from airbyte_cdk.sources.declarative.retrievers.page_prefetcher import PagePrefetcher
 from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.http_logger import format_http_message
@@ -367,85 +370,179 @@ class SimpleRetriever(Retriever):
         next_page_token: Optional[Mapping[str, Any]] = (
             {"next_page_token": initial_token} if initial_token is not None else None
         )
-        while not pagination_complete:
-            property_chunks: List[List[str]] = (
-                list(
-                    self.additional_query_properties.get_request_property_chunks(
-                        stream_slice=stream_slice
+        # Pages are only requested ahead when each page is fetched with a single request
+        page_prefetcher = (
+            PagePrefetcher(
+                paginator=self._paginator,
+                fetch_page=partial(self._fetch_next_page, stream_state, stream_slice),
+                thread_name_prefix=f"{self.name}_pages",
+            )
+            if not self.additional_query_properties
+            else None
+        )
+        # The property chunks of every page are requested from the same pool
+        max_concurrent_requests = self._max_concurrent_property_chunk_requests()
+        property_chunk_executor = (
+            ThreadPoolExecutor(
+                max_workers=max_concurrent_requests,
+                thread_name_prefix=f"{self.name}_property_chunks",
+            )
+            if max_concurrent_requests > 1
+            else None
+        )
+        try:
+            while not pagination_complete:
+                property_chunks: List[List[str]] = (
+                    list(
+                        self.additional_query_properties.get_request_property_chunks(
+                            stream_slice=stream_slice
+                        )
                     )
+                    if self.additional_query_properties
+                    else [
+                        []
+                    ]  # A single empty property chunk represents the case where property chunking is not configured
                 )
-                if self.additional_query_properties
-                else [
-                    []
-                ]  # A single empty property chunk represents the case where property chunking is not configured
-            )
 
-            merged_records: MutableMapping[str, Any] = defaultdict(dict)
-            last_page_size = 0
-            last_record: Optional[Record] = None
-            response: Optional[requests.Response] = None
-            for properties in property_chunks:
-                if len(properties) > 0:
-                    stream_slice = StreamSlice(
-                        partition=stream_slice.partition or {},
-                        cursor_slice=stream_slice.cursor_slice or {},
-                        extra_fields={"query_properties": properties},
+                merged_records: MutableMapping[str, Any] = defaultdict(dict)
+                last_page_size = 0
+                last_record: Optional[Record] = None
+                response: Optional[requests.Response] = None
+                for stream_slice, response in (
+                    [(stream_slice, page_prefetcher.fetch(next_page_token))]
+                    if page_prefetcher
+                    else self._fetch_property_chunks(
+                        property_chunks,
+                        stream_state,
+                        stream_slice,
+                        next_page_token,
+                        property_chunk_executor,
                     )
-
-                response = self._fetch_next_page(stream_state, stream_slice, next_page_token)
-                for current_record in records_generator_fn(response):
-                    if (
-                        current_record
-                        and self.additional_query_properties
-                        and self.additional_query_properties.property_chunking
-                    ):
-                        merge_key = (
-                            self.additional_query_properties.property_chunking.get_merge_key(
-                                current_record
+                ):
+                    for current_record in records_generator_fn(response):
+                        if (
+                            current_record
+                            and self.additional_query_properties
+                            and self.additional_query_properties.property_chunking
+                        ):
+                            merge_key = (
+                                self.additional_query_properties.property_chunking.get_merge_key(
+                                    current_record
+                                )
                             )
-                        )
-                        if merge_key:
-                            _deep_merge(merged_records[merge_key], current_record)
+                            if merge_key:
+                                _deep_merge(merged_records[merge_key], current_record)
+                            else:
+                                # We should still emit records even if the record did not have a merge key
+                                last_page_size += 1
+                                last_record = current_record
+                                yield current_record
                         else:
-                            # We should still emit records even if the record did not have a merge key
                             last_page_size += 1
                             last_record = current_record
                             yield current_record
-                    else:
+
+                if (
+                    self.additional_query_properties
+                    and self.additional_query_properties.property_chunking
+                ):
+                    for merged_record in merged_records.values():
+                        record = Record(
+                            data=merged_record,
+                            stream_name=self.name,
+                            associated_slice=stream_slice,
+                            owned=True,
+                        )
                         last_page_size += 1
-                        last_record = current_record
-                        yield current_record
-
-            if (
-                self.additional_query_properties
-                and self.additional_query_properties.property_chunking
-            ):
-                for merged_record in merged_records.values():
-                    record = Record(
-                        data=merged_record, stream_name=self.name, associated_slice=stream_slice
-                    )
-                    last_page_size += 1
-                    last_record = record
-                    yield record
+                        last_record = record
+                        yield record
 
-            if not response:
-                pagination_complete = True
-            else:
-                last_page_token_value = (
-                    next_page_token.get("next_page_token") if next_page_token else None
-                )
-                next_page_token = self._next_page_token(
-                    response=response,
-                    last_page_size=last_page_size,
-                    last_record=last_record,
-                    last_page_token_value=last_page_token_value,
-                )
-                if not next_page_token:
+                if not response:
                     pagination_complete = True
+                else:
+                    last_page_token_value = (
+                        next_page_token.get("next_page_token") if next_page_token else None
+                    )
+                    next_page_token = self._next_page_token(
+                        response=response,
+                        last_page_size=last_page_size,
+                        last_record=last_record,
+                        last_page_token_value=last_page_token_value,
+                    )
+                    if not next_page_token:
+                        pagination_complete = True
+        finally:
+            if page_prefetcher:
+                page_prefetcher.close()
+            if property_chunk_executor:
+                property_chunk_executor.shutdown(cancel_futures=True)
 
         # Always return an empty generator just in case no records were ever yielded
         yield from []
 
+    def _fetch_property_chunks(
+        self,
+        property_chunks: List[List[str]],
+        stream_state: Mapping[str, Any],
+        stream_slice: StreamSlice,
+        next_page_token: Optional[Mapping[str, Any]],
+        executor: Optional[ThreadPoolExecutor],
+    ) -> Iterable[Tuple[StreamSlice, Optional[requests.Response]]]:
+        """
+        Fetch the same page for every property chunk and yield the slice used for each chunk along with its response, in
+        the order of the chunks.
+
+        When an executor is provided, the next chunks are requested while the response of the current one is consumed. At
+        most `max_concurrent_requests` responses are in flight or waiting to be consumed at a time. This does not bound
+        the records merged from the responses: as when the chunks are requested sequentially, the merged records of the
+        page are held until the last chunk is consumed. Requests are sent through the requester, so they remain subject to
+        its API budget.
+        """
+        chunk_slices = [
+            StreamSlice(
+                partition=stream_slice.partition or {},
+                cursor_slice=stream_slice.cursor_slice or {},
+                extra_fields={"query_properties": properties},
+            )
+            if len(properties) > 0
+            else stream_slice
+            for properties in property_chunks
+        ]
+        max_concurrent_requests = min(
+            self._max_concurrent_property_chunk_requests(), len(chunk_slices)
+        )
+        if not executor or max_concurrent_requests <= 1:
+            for chunk_slice in chunk_slices:
+                yield chunk_slice, self._fetch_next_page(stream_state, chunk_slice, next_page_token)
+            return
+
+        in_flight: Deque[Tuple[StreamSlice, Future[Optional[requests.Response]]]] = deque()
+        try:
+            for chunk_slice in chunk_slices:
+                if len(in_flight) >= max_concurrent_requests:
+                    oldest_slice, oldest_response = in_flight.popleft()
+                    yield oldest_slice, oldest_response.result()
+                in_flight.append(
+                    (
+                        chunk_slice,
+                        executor.submit(
+                            self._fetch_next_page, stream_state, chunk_slice, next_page_token
+                        ),
+                    )
+                )
+            while in_flight:
+                oldest_slice, oldest_response = in_flight.popleft()
+                yield oldest_slice, oldest_response.result()
+        finally:
+            # the remaining chunks are not needed if a request failed or if the caller stopped reading
+            for _, response_future in in_flight:
+                response_future.cancel()
+
+    def _max_concurrent_property_chunk_requests(self) -> int:
+        if self.additional_query_properties and self.additional_query_properties.property_chunking:
+            return self.additional_query_properties.property_chunking.max_concurrent_requests
+        return 1
+
     def _read_single_page(
         self,
         records_generator_fn: Callable[[Optional[requests.Response]], Iterable[Record]],
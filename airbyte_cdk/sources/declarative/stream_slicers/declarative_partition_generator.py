@@ -88,6 +88,10 @@ class StreamSlicerPartitionGenerator(PartitionGenerator):
         self._partition_factory = partition_factory
         self._stream_slicer = stream_slicer
 
+    @property
+    def partition_factory(self) -> DeclarativePartitionFactory:
+        return self._partition_factory
+
     def generate(self) -> Iterable[Partition]:
         for stream_slice in self._stream_slicer.stream_slices():
             yield self._partition_factory.create(stream_slice)
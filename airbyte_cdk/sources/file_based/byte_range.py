@@ -0,0 +1,179 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from airbyte_cdk.models import AirbyteRecordMessageFileReference
+from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.file_based_stream_reader import (
+    AbstractFileBasedStreamReader,
+    FileReadMode,
+)
+from airbyte_cdk.sources.file_based.file_record_data import FileRecordData
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+# Files with these extensions are decompressed by the stream readers, so their byte offsets can't be used to read ranges
+_COMPRESSED_FILE_EXTENSIONS = (
+    ".br",
+    ".bz2",
+    ".deflate",
+    ".gz",
+    ".gzip",
+    ".lz4",
+    ".snappy",
+    ".xz",
+    ".zip",
+    ".zst",
+    ".zstd",
+)
+_READ_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """
+    A range of bytes of a file which starts and ends on record boundaries.
+
+    Ranges other than the first one are read after the first `prefix_end` bytes of the file, which contain what parsers
+    need to read before the records (e.g. the header of a CSV file).
+    """
+
+    start: int
+    end: int
+    prefix_end: int = 0
+
+
+def is_splittable(file: RemoteFile) -> bool:
+    """
+    Return whether the bytes of the file are the bytes parsers read, which is not the case for compressed files.
+    """
+    return not file.uri.lower().endswith(_COMPRESSED_FILE_EXTENSIONS)
+
+
+def to_byte_ranges(boundaries: List[int], size: int, prefix_end: int = 0) -> List[ByteRange]:
+    """
+    Return the ranges of a file of `size` bytes split at the record boundaries.
+    """
+    starts = [0] + boundaries
+    ends = boundaries + [size]
+    return [
+        ByteRange(start=start, end=end, prefix_end=0 if start == 0 else prefix_end)
+        for start, end in zip(starts, ends)
+    ]
+
+
+class _ByteRangeFile(io.RawIOBase):
+    """
+    Read-only file containing the given segments of a binary file, one after the other.
+    """
+
+    def __init__(self, exit_stack: ExitStack, fp: Any, segments: Iterable[Tuple[int, int]]):
+        self._exit_stack = exit_stack
+        self._fp = fp
+        self._fp_position: Optional[int] = None
+        self._segments = [(start, end) for start, end in segments if end > start]
+        self._size = sum(end - start for start, end in self._segments)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer: Any) -> int:
+        segment_position = 0
+        for start, end in self._segments:
+            length = end - start
+            if self._position < segment_position + length:
+                file_position = start + self._position - segment_position
+                # seeking can be expensive for remote files, e.g. a new request
+                if self._fp_position != file_position:
+                    self._fp.seek(file_position)
+                data = self._fp.read(min(len(buffer), end - file_position))
+                buffer[: len(data)] = data
+                self._fp_position = file_position + len(data)
+                self._position += len(data)
+                return len(data)
+            segment_position += length
+        return 0
+
+    def close(self) -> None:
+        if not self.closed:
+            self._exit_stack.close()
+        super().close()
+
+
+class ByteRangeStreamReader(AbstractFileBasedStreamReader):
+    """
+    Opens files as if they only contained a byte range: the prefix of the file followed by the bytes of the range.
+    Everything else is delegated to the wrapped stream reader.
+    """
+
+    def __init__(self, stream_reader: AbstractFileBasedStreamReader, byte_range: ByteRange):
+        super().__init__()
+        self._stream_reader = stream_reader
+        self._byte_range = byte_range
+
+    @property
+    def config(self) -> Optional[AbstractFileBasedSpec]:
+        return self._stream_reader.config
+
+    @config.setter
+    def config(self, value: AbstractFileBasedSpec) -> None:
+        self._stream_reader.config = value
+
+    def open_file(
+        self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger
+    ) -> io.IOBase:
+        exit_stack = ExitStack()
+        fp = exit_stack.enter_context(
+            self._stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger)
+        )
+        raw = _ByteRangeFile(
+            exit_stack,
+            fp,
+            [
+                (0, self._byte_range.prefix_end),
+                (self._byte_range.start, self._byte_range.end),
+            ],
+        )
+        buffered = io.BufferedReader(raw, buffer_size=_READ_BUFFER_SIZE)
+        if mode == FileReadMode.READ_BINARY:
+            return buffered
+        return io.TextIOWrapper(buffered, encoding=encoding)
+
+    def get_matching_files(
+        self, globs: List[str], prefix: Optional[str], logger: logging.Logger
+    ) -> Iterable[RemoteFile]:
+        return self._stream_reader.get_matching_files(globs, prefix, logger)
+
+    def file_size(self, file: RemoteFile) -> int:
+        return self._stream_reader.file_size(file)
+
+    def upload(
+        self, file: RemoteFile, local_directory: str, logger: logging.Logger
+    ) -> Tuple[FileRecordData, AirbyteRecordMessageFileReference]:
+        return self._stream_reader.upload(file, local_directory, logger)
@@ -86,6 +86,8 @@ IDENTITIES_STREAM = "identities"
 class FileBasedSource(ConcurrentSourceAdapter, ABC):
     # We make each source override the concurrency level to give control over when they are upgraded.
     _concurrency_level = None
+    # Sources can opt into reading large CSV and JSONL files in partitions of about this many bytes with concurrent syncs.
+    _byte_range_partition_size: Optional[int] = None
 
     def __init__(
         self,
@@ -274,6 +276,7 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
                         logger=self.logger,
                         state=stream_state,
                         cursor=cursor,
+                        byte_range_partition_size=self._byte_range_partition_size,
                     )
 
                 elif (
@@ -305,6 +308,10 @@ class FileBasedSource(ConcurrentSourceAdapter, ABC):
                         logger=self.logger,
                         state=stream_state,
                         cursor=cursor,
+                        # other cursors may not wait for all the byte ranges of a file to be read
+                        byte_range_partition_size=self._byte_range_partition_size
+                        if isinstance(cursor, FileBasedConcurrentCursor)
+                        else None,
                     )
                 else:
                     cursor = self.cursor_cls(stream_config)
@@ -3,7 +3,7 @@
 #
 
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, Mapping, Optional, Set, Tuple, cast
 
 import fastavro
 
@@ -183,7 +183,18 @@ class AvroParser(FileTypeParser):
         try:
             with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
                 avro_reader = fastavro.reader(fp)  # type: ignore [arg-type]
-                schema = avro_reader.writer_schema
+                reader_schema = self._to_reader_schema(
+                    avro_reader.writer_schema,
+                    self.get_selected_columns(config, discovered_schema),
+                )
+                if reader_schema is not None and fp.seekable():
+                    # fastavro skips the fields of the file which are not in the reader schema instead of decoding them.
+                    # The reader schema can only be given when the file is opened, so it is read again from the start.
+                    fp.seek(0)
+                    avro_reader = fastavro.reader(fp, reader_schema=reader_schema)  # type: ignore [arg-type]
+                else:
+                    reader_schema = None
+                schema = avro_reader.writer_schema if reader_schema is None else reader_schema
                 schema_field_name_to_type = {
                     field["name"]: cast(dict[str, Any], field["type"])  # type: ignore [index]
                     for field in schema["fields"]  # type: ignore [index, call-overload]  # If schema is not dict, it is not subscriptable by strings
@@ -207,6 +218,27 @@ class AvroParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_reader_schema(
+        writer_schema: Any, selected_columns: Optional[Set[str]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the writer schema restricted to the selected columns, or None if all the fields of the file are read.
+        """
+        if selected_columns is None or not isinstance(writer_schema, Mapping):
+            return None
+        fields = writer_schema.get("fields", [])
+        selected_fields = [field for field in fields if field["name"] in selected_columns]
+        if len(selected_fields) == len(fields):
+            return None
+        reader_schema = {**writer_schema, "fields": selected_fields}
+        try:
+            fastavro.parse_schema(reader_schema)
+        except Exception:
+            # a selected field can refer to a type named in a field which is not selected
+            return None
+        return reader_schema
+
     @staticmethod
     def _to_output_value(
         avro_format: AvroFormat, record_type: Mapping[str, Any], record_value: Any
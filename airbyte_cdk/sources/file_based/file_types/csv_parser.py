@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -15,6 +17,7 @@ from uuid import uuid4
 import orjson
 
 from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.file_based.byte_range import ByteRange, is_splittable, to_byte_ranges
 from airbyte_cdk.sources.file_based.config.csv_format import (
     CsvFormat,
     CsvHeaderAutogenerated,
@@ -33,6 +36,7 @@ from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, S
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 DIALECT_NAME = "_config_dialect"
+_ASCII_COMPATIBLE_ENCODINGS = {"ascii", "cp1252", "iso8859-1", "iso8859-15", "utf-8", "utf-8-sig"}
 
 
 class _CsvReader:
@@ -44,6 +48,25 @@ class _CsvReader:
         logger: logging.Logger,
         file_read_mode: FileReadMode,
     ) -> Generator[Dict[str, Any], None, None]:
+        rows = self.read_rows(config, file, stream_reader, logger, file_read_mode)
+        try:
+            for headers, values in rows:
+                yield _to_dict(headers, values)
+        finally:
+            rows.close()
+
+    def read_rows(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        file_read_mode: FileReadMode,
+    ) -> Generator[Tuple[List[str], List[str]], None, None]:
+        """
+        Yield the headers of the file along with the values of each row. Contrary to `read_data`, rows are not converted to
+        dictionaries.
+        """
         config_format = _extract_format(config)
         lineno = 0
 
@@ -77,14 +100,16 @@ class _CsvReader:
             self._skip_rows(fp, rows_to_skip)
             lineno += rows_to_skip
 
-            reader = csv.DictReader(fp, dialect=dialect_name, fieldnames=headers)  # type: ignore
+            reader = csv.reader(fp, dialect=dialect_name)  # type: ignore
             try:
                 for row in reader:
+                    # empty lines are skipped as `csv.DictReader` does
+                    if not row:
+                        continue
                     lineno += 1
 
-                    # The row was not properly parsed if any of the values are None. This will most likely occur if there are more columns
-                    # than headers or more headers dans columns
-                    if None in row:
+                    # The row was not properly parsed if there are more columns than headers or more headers than columns
+                    if len(row) > len(headers):
                         if config_format.ignore_errors_on_fields_mismatch:
                             logger.error(
                                 f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with missing column."
@@ -95,7 +120,7 @@ class _CsvReader:
                                 filename=file.uri,
                                 lineno=lineno,
                             )
-                    if None in row.values():
+                    elif len(row) < len(headers):
                         if config_format.ignore_errors_on_fields_mismatch:
                             logger.error(
                                 f"Skipping record in line {lineno} of file {file.uri}; invalid CSV row with extra column."
@@ -106,11 +131,97 @@ class _CsvReader:
                                 filename=file.uri,
                                 lineno=lineno,
                             )
-                    yield row
+                    yield headers, row
             finally:
                 # due to RecordParseError or GeneratorExit
                 csv.unregister_dialect(dialect_name)
 
+    def get_byte_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        partition_size: int,
+    ) -> Optional[List[ByteRange]]:
+        """
+        Split the file after the rows `read_rows` reads, at the end of the first record ending after each `partition_size`
+        bytes. Every range is read after the rows preceding the records so that the headers are the same for all of them.
+
+        Lines without a quote character are complete records. The other lines are parsed to know where quoted values span
+        several lines. The whole file is scanned because the lines around a split point alone can't tell whether it is in
+        a quoted value longer than them. Files which can't be split safely this way (escape characters, autogenerated headers which depend
+        on the first record, encodings in which a newline byte can be part of another character, carriage returns used as
+        line endings before the records) are not split.
+        """
+        config_format = _extract_format(config)
+        if (
+            not is_splittable(file)
+            or config_format.escape_char
+            or isinstance(config_format.header_definition, CsvHeaderAutogenerated)
+            or not _is_ascii_compatible(config_format.encoding)
+        ):
+            return None
+        encoding = config_format.encoding
+        rows_to_skip = (
+            config_format.skip_rows_before_header
+            + (1 if config_format.header_definition.has_header_row() else 0)
+            + config_format.skip_rows_after_header
+        )
+
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            if not fp.seekable():
+                return None
+            size = fp.seek(0, io.SEEK_END)
+            if size <= partition_size:
+                return None
+            fp.seek(0)
+
+            prefix = b"".join(fp.readline() for _ in range(rows_to_skip))
+            # text files are read with universal newlines so a carriage return alone would also end a skipped row
+            if prefix.count(b"\r") != prefix.count(b"\r\n"):
+                return None
+            quote = config_format.quote_char.encode(encoding)  # type: ignore[arg-type]  # checked by _is_ascii_compatible
+            position = len(prefix)
+            pending_line: Optional[bytes] = None
+
+            def lines() -> Iterable[str]:
+                nonlocal position, pending_line
+                while True:
+                    if pending_line is not None:
+                        line, pending_line = pending_line, None
+                    else:
+                        line = fp.readline()
+                        if not line:
+                            return
+                    position += len(line)
+                    yield line.decode(encoding)  # type: ignore[arg-type]  # checked by _is_ascii_compatible
+
+            reader = csv.reader(
+                lines(),
+                delimiter=config_format.delimiter,
+                quotechar=config_format.quote_char,
+                doublequote=config_format.double_quote,
+                quoting=csv.QUOTE_MINIMAL,
+            )
+            boundaries: List[int] = []
+            next_boundary = position + partition_size
+            for line in iter(fp.readline, b""):
+                if quote in line:
+                    pending_line = line
+                    try:
+                        next(reader)
+                    except (csv.Error, StopIteration, UnicodeError):
+                        # the records after this line can't be delimited
+                        break
+                else:
+                    position += len(line)
+                if next_boundary <= position < size:
+                    boundaries.append(position)
+                    next_boundary = position + partition_size
+
+        return to_byte_ranges(boundaries, size, prefix_end=len(prefix)) if boundaries else None
+
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
         """
         Assumes the fp is pointing to the beginning of the files and will reset it as such
@@ -182,11 +293,13 @@ class CsvParser(FileTypeParser):
         #  sources will likely require one. Rather than modify the interface now we can wait until the real use case
         config_format = _extract_format(config)
         type_inferrer_by_field: Dict[str, _TypeInferrer] = defaultdict(
-            lambda: _JsonTypeInferrer(
-                config_format.true_values, config_format.false_values, config_format.null_values
+            lambda: (
+                _JsonTypeInferrer(
+                    config_format.true_values, config_format.false_values, config_format.null_values
+                )
+                if config_format.inference_type != InferenceType.NONE
+                else _DisabledTypeInferrer()
             )
-            if config_format.inference_type != InferenceType.NONE
-            else _DisabledTypeInferrer()
         )
         data_generator = self._csv_reader.read_data(
             config, file, stream_reader, logger, self.file_read_mode
@@ -233,20 +346,17 @@ class CsvParser(FileTypeParser):
                 deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
             else:
                 deduped_property_types = {}
-            cast_fn = CsvParser._get_cast_function(
-                deduped_property_types, config_format, logger, config.schemaless
-            )
-            data_generator = self._csv_reader.read_data(
+            data_generator = self._csv_reader.read_rows(
                 config, file, stream_reader, logger, self.file_read_mode
             )
-            for row in data_generator:
+            row_caster: Optional[_RowCaster] = None
+            for headers, values in data_generator:
                 line_no += 1
-                yield CsvParser._to_nullable(
-                    cast_fn(row),
-                    deduped_property_types,
-                    config_format.null_values,
-                    config_format.strings_can_be_null,
-                )
+                if row_caster is None:
+                    row_caster = _RowCaster(
+                        headers, deduped_property_types, config_format, logger, config.schemaless
+                    )
+                yield row_caster.cast(values)
         except RecordParseError as parse_err:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line_no
@@ -254,6 +364,16 @@ class CsvParser(FileTypeParser):
         finally:
             data_generator.close()
 
+    def get_byte_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        partition_size: int,
+    ) -> Optional[List[ByteRange]]:
+        return self._csv_reader.get_byte_ranges(config, file, stream_reader, logger, partition_size)
+
     @property
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
@@ -399,6 +519,119 @@ class CsvParser(FileTypeParser):
         return result
 
 
+class _RowCaster:
+    """
+    Casts the values of the rows of a file and sets null values as `CsvParser._cast_types` followed by
+    `CsvParser._to_nullable` would on the rows as dictionaries. The conversion of each column is selected once for the file
+    rather than for every value, and the values are cast and nulled in a single pass.
+    """
+
+    def __init__(
+        self,
+        headers: List[str],
+        deduped_property_types: Mapping[str, str],
+        config_format: CsvFormat,
+        logger: logging.Logger,
+        schemaless: bool,
+    ) -> None:
+        self._headers = headers
+        self._deduped_property_types = deduped_property_types
+        self._null_values = config_format.null_values
+        self._strings_can_be_null = config_format.strings_can_be_null
+        self._logger = logger
+        self._cast_fn = CsvParser._get_cast_function(
+            deduped_property_types, config_format, logger, schemaless
+        )
+        self._casts_values = self._cast_fn is not _no_cast
+
+        # As for dictionaries, the value of a duplicated header is the last one while its position is the first one
+        index_by_header: Dict[str, int] = {}
+        for index, header in enumerate(headers):
+            index_by_header[header] = index
+
+        # (column, index, type, converter) for each column kept by `_cast_types`. Strings have no converter
+        self._casts: List[Tuple[str, int, str, Optional[Callable[[str], Any]]]] = []
+        # (column, index, whether the column can be null) for each column if values are not cast
+        self._columns: List[Tuple[str, int, bool]] = []
+        for header, index in index_by_header.items():
+            prop_type = deduped_property_types.get(header)
+            self._columns.append(
+                (
+                    header,
+                    index,
+                    self._strings_can_be_null or prop_type != "string",
+                )
+            )
+            if prop_type in TYPE_PYTHON_MAPPING and prop_type is not None:
+                self._casts.append(
+                    (header, index, prop_type, _get_converter(prop_type, config_format))
+                )
+
+    def cast(self, values: List[str]) -> Dict[str, Any]:
+        if len(values) != len(self._headers):
+            # rows with missing or extra columns are only emitted when mismatches are ignored
+            return CsvParser._to_nullable(
+                self._cast_fn(_to_dict(self._headers, values)),
+                self._deduped_property_types,
+                self._null_values,
+                self._strings_can_be_null,
+            )
+
+        null_values = self._null_values
+        if not self._casts_values:
+            return {
+                column: None if can_be_null and values[index] in null_values else values[index]
+                for column, index, can_be_null in self._columns
+            }
+
+        record: Dict[str, Any] = {}
+        warnings = []
+        for column, index, prop_type, converter in self._casts:
+            value = values[index]
+            if converter is None:
+                record[column] = (
+                    None if self._strings_can_be_null and value in null_values else value
+                )
+                continue
+            try:
+                record[column] = converter(value)
+            except ValueError:
+                warnings.append(_format_warning(column, value, prop_type))
+                # values which could not be cast are strings, which can be null for other types than strings
+                record[column] = None if value in null_values else value
+
+        if warnings:
+            self._logger.warning(
+                f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join([w for w in warnings])}",
+            )
+        return record
+
+
+def _get_converter(prop_type: str, config_format: CsvFormat) -> Optional[Callable[[str], Any]]:
+    """
+    Return the function casting values to `prop_type` as `CsvParser._cast_types` does, raising ValueError if the value
+    can't be cast. Strings are not converted.
+    """
+    _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+    if python_type is None:
+        return _value_to_null
+    if python_type is bool:
+        return partial(
+            _value_to_bool,
+            true_values=config_format.true_values,
+            false_values=config_format.false_values,
+        )
+    if python_type is dict:
+        # orjson.JSONDecodeError is a ValueError
+        return orjson.loads
+    if python_type is list:
+        # json.JSONDecodeError is a ValueError
+        return _value_to_list
+    if python_type is str:
+        return None
+    return python_type
+
+
 class _TypeInferrer(ABC):
     @abstractmethod
     def add_value(self, value: Any) -> None:
@@ -501,6 +734,12 @@ def _value_to_bool(value: str, true_values: Set[str], false_values: Set[str]) ->
     raise ValueError(f"Value {value} is not a valid boolean value")
 
 
+def _value_to_null(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
 def _value_to_list(value: str) -> List[Any]:
     parsed_value = json.loads(value)
     if isinstance(parsed_value, list):
@@ -516,10 +755,37 @@ def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
 
+def _to_dict(headers: List[str], values: List[str]) -> Dict[Any, Any]:
+    """
+    Map the values of a row to the headers as `csv.DictReader` does: extra values are listed under the None key and
+    missing values are None.
+    """
+    row: Dict[Any, Any] = dict(zip(headers, values))
+    if len(values) > len(headers):
+        row[None] = values[len(headers) :]
+    elif len(values) < len(headers):
+        for header in headers[len(values) :]:
+            row[header] = None
+    return row
+
+
 def _no_cast(row: Mapping[str, str]) -> Mapping[str, str]:
     return row
 
 
+def _is_ascii_compatible(encoding: Optional[str]) -> bool:
+    """
+    Return whether ASCII characters, among which the newline and the quote characters, are encoded as single bytes which
+    are not part of the encoding of other characters.
+    """
+    if encoding is None:
+        return False
+    try:
+        return codecs.lookup(encoding).name in _ASCII_COMPATIBLE_ENCODINGS
+    except LookupError:
+        return False
+
+
 def _extract_format(config: FileBasedStreamConfig) -> CsvFormat:
     config_format = config.format
     if not isinstance(config_format, CsvFormat):
@@ -4,9 +4,13 @@
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.byte_range import ByteRange
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
+    FileBasedStreamConfig,
+    ValidationPolicy,
+)
 from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
@@ -77,6 +81,42 @@ class FileTypeParser(ABC):
         """
         ...
 
+    @staticmethod
+    def get_selected_columns(
+        config: FileBasedStreamConfig, discovered_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[Set[str]]:
+        """
+        Return the columns records need to have for the sync, or None if they need all the columns of the file. Parsers of
+        columnar formats can use it to only read the columns selected in the configured catalog.
+
+        Records are only projected when the validation policy emits them regardless of their columns, as the other
+        policies check that records have no column outside of the schema.
+        """
+        if (
+            discovered_schema is None
+            or config.schemaless
+            or config.validation_policy != ValidationPolicy.emit_record
+        ):
+            return None
+        properties = discovered_schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return None
+        return set(properties)
+
+    def get_byte_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        partition_size: int,
+    ) -> Optional[List[ByteRange]]:
+        """
+        Split the file in ranges of about `partition_size` bytes starting and ending on record boundaries, so that they can
+        be parsed independently. Return None if the file can't be split, in which case it is parsed as a whole.
+        """
+        return None
+
     @property
     @abstractmethod
     def file_read_mode(self) -> FileReadMode:
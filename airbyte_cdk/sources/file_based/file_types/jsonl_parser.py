@@ -2,12 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-import json
+import io
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+import re
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import orjson
 
+from airbyte_cdk.sources.file_based.byte_range import ByteRange, is_splittable, to_byte_ranges
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import (
@@ -22,10 +24,17 @@ from airbyte_cdk.sources.file_based.schema_helpers import (
     merge_schemas,
 )
 
+# complete strings, which can contain brackets, or structural characters
+_STR_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+_BYTES_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}"]')
+_OPENING_BRACKETS = {"[", "{", b"[", b"{"}
+_CLOSING_BRACKETS = {"]", "}", b"]", b"}"}
+
 
 class JsonlParser(FileTypeParser):
     MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
     ENCODING = "utf8"
+    MAX_LINES_TO_FIND_RECORD_BOUNDARY = 1000
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -62,9 +71,9 @@ class JsonlParser(FileTypeParser):
     ) -> Iterable[Dict[str, Any]]:
         """
         This code supports parsing json objects over multiple lines even though this does not align with the JSONL format. This is for
-        backward compatibility reasons i.e. the previous source-s3 parser did support this. The drawback is:
-        * performance as the way we support json over multiple lines is very brute forced
-        * given that we don't have `newlines_in_values` config to scope the possible inputs, we might parse the whole file before knowing if
+        backward compatibility reasons i.e. the previous source-s3 parser did support this. JSON values spanning multiple lines are only
+        parsed once their brackets are balanced and values concatenated on the same lines are split. The drawback is:
+        * given that we don't have `newlines_in_values` config to scope the possible inputs, we might read the whole file before knowing if
           the input is improperly formatted or if the json is over multiple lines
 
         The goal is to run the V4 of source-s3 in production, track the warning log emitted when there are multiline json objects and
@@ -72,6 +81,63 @@ class JsonlParser(FileTypeParser):
         """
         yield from self._parse_jsonl_entries(file, stream_reader, logger)
 
+    def get_byte_ranges(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        partition_size: int,
+    ) -> Optional[List[ByteRange]]:
+        """
+        Split the file at the first record boundary after each `partition_size` bytes. As records can span multiple lines,
+        a boundary is a newline between two lines which are complete JSON objects on their own.
+        """
+        if not is_splittable(file):
+            return None
+
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            if not fp.seekable():
+                return None
+            size = fp.seek(0, io.SEEK_END)
+            boundaries: List[int] = []
+            target = partition_size
+            while target < size:
+                boundary = self._find_record_boundary(fp, target)  # type: ignore[arg-type]  # binary files are IO[bytes]
+                if boundary is None or boundary >= size:
+                    break
+                boundaries.append(boundary)
+                target = boundary + partition_size
+
+        return to_byte_ranges(boundaries, size) if boundaries else None
+
+    def _find_record_boundary(self, fp: IO[bytes], target: int) -> Optional[int]:
+        """
+        Return the first record boundary after `target`, or None if there is none in the next lines.
+        """
+        fp.seek(target)
+        # the line `target` falls in is incomplete
+        fp.readline()
+        position = fp.tell()
+        previous_line_is_object = False
+        for _ in range(self.MAX_LINES_TO_FIND_RECORD_BOUNDARY):
+            line = fp.readline()
+            if not line:
+                return None
+            line_is_object = self._is_json_object(line)
+            if previous_line_is_object and line_is_object:
+                return position
+            previous_line_is_object = line_is_object
+            position += len(line)
+        return None
+
+    @staticmethod
+    def _is_json_object(line: bytes) -> bool:
+        try:
+            return isinstance(orjson.loads(line), dict)
+        except orjson.JSONDecodeError:
+            return False
+
     @classmethod
     def _infer_schema_for_record(cls, record: Dict[str, Any]) -> Dict[str, Any]:
         record_schema = {}
@@ -101,25 +167,30 @@ class JsonlParser(FileTypeParser):
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
+            accumulator = _JsonAccumulator()
             for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
                 read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = orjson.loads(accumulator)
+                if accumulator.is_empty:
+                    try:
+                        records: Optional[List[Any]] = [orjson.loads(line)]
+                    except orjson.JSONDecodeError:
+                        accumulator.add(line)
+                        records = accumulator.parse()
+                else:
+                    accumulator.add(line)
+                    records = accumulator.parse()
+
+                if records is None:
+                    had_json_parsing_error = True
+                else:
                     if had_json_parsing_error and not has_warned_for_multiline_json_object:
                         logger.warning(
                             f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced"
                         )
                         has_warned_for_multiline_json_object = True
 
-                    yield record
+                    yield from records
                     yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except orjson.JSONDecodeError:
-                    had_json_parsing_error = True
 
                 if (
                     read_limit
@@ -137,9 +208,97 @@ class JsonlParser(FileTypeParser):
                     FileBasedSourceError.ERROR_PARSING_RECORD, filename=file.uri, lineno=line
                 )
 
-    @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
-        if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
+
+class _JsonAccumulator:
+    """
+    Lines of JSON values spanning several lines. The brackets and strings of the lines are tracked as they are added so
+    that the lines are only parsed once they can form complete JSON values, which keeps parsing linear in the size of the
+    values instead of parsing the accumulated lines again after each line.
+
+    Once the accumulated lines can't become valid JSON anymore (e.g. a string spanning several lines or an unbalanced
+    bracket), nothing is parsed anymore as adding more lines would not make them valid.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[Union[bytes, str]] = []
+        self._size = 0
+        self._depth = 0
+        # offsets of the ends of the top-level arrays and objects, which are the boundaries of concatenated values
+        self._value_ends: List[int] = []
+        self._is_invalid = False
+
+    def _reset(self) -> None:
+        self._lines = []
+        self._size = 0
+        self._depth = 0
+        self._value_ends = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._lines and not self._is_invalid
+
+    def add(self, line: Union[bytes, str]) -> None:
+        if self._is_invalid:
+            return
+        token_pattern = _BYTES_TOKEN if isinstance(line, bytes) else _STR_TOKEN
+        for match in token_pattern.finditer(line):  # type: ignore[arg-type]  # the pattern has the type of the line
+            token = match.group()
+            if len(token) > 1:
+                # complete string
+                continue
+            if token in _OPENING_BRACKETS:
+                self._depth += 1
+            elif token in _CLOSING_BRACKETS:
+                self._depth -= 1
+                if self._depth < 0:
+                    self._invalidate()
+                    return
+                if self._depth == 0:
+                    self._value_ends.append(self._size + match.end())
+            else:
+                # strings can't contain newlines
+                self._invalidate()
+                return
+        self._lines.append(line)
+        self._size += len(line)
+
+    def parse(self) -> Optional[List[Any]]:
+        """
+        Return the values of the accumulated lines and empty the accumulator, or None if the lines are not complete JSON
+        values yet.
+        """
+        if self._is_invalid or self._depth != 0:
+            return None
+        content: Union[bytes, str]
+        if isinstance(self._lines[0], bytes):
+            content = b"".join(self._lines)  # type: ignore[arg-type]  # all the lines have the same type
+            newline: Union[bytes, str] = b"\n"
+        else:
+            content = "".join(self._lines)  # type: ignore[arg-type]  # all the lines have the same type
+            newline = "\n"
+        try:
+            values: Optional[List[Any]] = [orjson.loads(content)]
+        except orjson.JSONDecodeError:
+            values = self._parse_concatenated_values(content)
+            if values is None:
+                # complete lines which are not valid JSON can't become valid with more lines
+                if content.strip() and content.endswith(newline):  # type: ignore[arg-type]  # same type as the content
+                    self._invalidate()
+                return None
+        self._reset()
+        return values
+
+    def _parse_concatenated_values(self, content: Union[bytes, str]) -> Optional[List[Any]]:
+        if not self._value_ends or content[self._value_ends[-1] :].strip():
+            return None
+        try:
+            return [
+                orjson.loads(content[start:end])
+                for start, end in zip([0] + self._value_ends[:-1], self._value_ends)
+            ]
+        except orjson.JSONDecodeError:
+            return None
+
+    def _invalidate(self) -> None:
+        self._reset()
+        self._is_invalid = True
@@ -5,7 +5,7 @@
 import json
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote
 
 import pyarrow as pa
@@ -32,6 +32,7 @@ from airbyte_cdk.sources.file_based.schema_helpers import SchemaType
 
 class ParquetParser(FileTypeParser):
     ENCODING = None
+    BATCH_SIZE = 10_000
 
     def check_config(self, config: FileBasedStreamConfig) -> Tuple[bool, Optional[str]]:
         """
@@ -88,19 +89,34 @@ class ParquetParser(FileTypeParser):
                 partition_columns = {
                     x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)
                 }
+                selected_columns = self.get_selected_columns(config, discovered_schema)
+                columns_to_read = (
+                    None
+                    if selected_columns is None
+                    else [
+                        column for column in reader.schema_arrow.names if column in selected_columns
+                    ]
+                )
                 for row_group in range(reader.num_row_groups):
-                    batch = reader.read_row_group(row_group)
-                    for row in range(batch.num_rows):
-                        line_no += 1
-                        yield {
-                            **{
-                                column: ParquetParser._to_output_value(
-                                    batch.column(column)[row], parquet_format
-                                )
-                                for column in batch.column_names
-                            },
-                            **partition_columns,
-                        }
+                    # Row groups are read in batches so that a whole row group is never held in memory, and each batch is
+                    # converted column by column rather than value by value
+                    for batch in reader.iter_batches(
+                        batch_size=self.BATCH_SIZE,
+                        row_groups=[row_group],
+                        columns=columns_to_read,
+                    ):
+                        column_names = batch.schema.names
+                        columns = [
+                            ParquetParser._to_output_values(column, parquet_format)
+                            for column in batch.columns
+                        ]
+                        # without any column to read, records only have the partition columns
+                        rows = zip(*columns) if columns else ([] for _ in range(batch.num_rows))
+                        for values in rows:
+                            line_no += 1
+                            record = dict(zip(column_names, values))
+                            record.update(partition_columns)
+                            yield record
         except Exception as exc:
             raise RecordParseError(
                 FileBasedSourceError.ERROR_PARSING_RECORD,
@@ -128,58 +144,182 @@ class ParquetParser(FileTypeParser):
         else:
             return ParquetParser._scalar_to_python_value(parquet_value, parquet_format)
 
+    @staticmethod
+    def _to_output_values(parquet_values: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a column of a record batch to values that can be output by the source. This is the columnar equivalent of
+        `_scalar_to_python_value`: the column is converted to Python values at once and the conversion depending on its type
+        is selected once for the whole column.
+        """
+        values = ParquetParser._to_python_values(parquet_values)
+        converter = ParquetParser._python_value_converter(parquet_values.type, parquet_format)
+        if converter is None:
+            return values
+        return [None if value is None else converter(value) for value in values]
+
+    @staticmethod
+    def _to_python_values(parquet_values: pa.Array) -> List[Any]:
+        """
+        Equivalent to `parquet_values.to_pylist()`. `to_pylist` creates a pyarrow scalar for every value so the types for
+        which numpy creates the same Python objects are converted through numpy instead, including when they are nested in
+        lists, maps and structs.
+        """
+        parquet_type = parquet_values.type
+        if pa.types.is_dictionary(parquet_type):
+            return ParquetParser._to_python_values(parquet_values.dictionary_decode())
+        if pa.types.is_map(parquet_type):
+            return ParquetParser._map_to_python_values(parquet_values)
+        if pa.types.is_list(parquet_type) or pa.types.is_large_list(parquet_type):
+            return ParquetParser._list_to_python_values(parquet_values)
+        if pa.types.is_struct(parquet_type):
+            return ParquetParser._struct_to_python_values(parquet_values)
+        if not ParquetParser._is_numpy_convertible(parquet_type):
+            return parquet_values.to_pylist()  # type: ignore[no-any-return]
+
+        if pa.types.is_integer(parquet_type) or pa.types.is_floating(parquet_type):
+            # numpy represents nulls as NaN, which would also turn integers into floats
+            values: List[Any] = parquet_values.fill_null(0).to_numpy().tolist()
+            return ParquetParser._with_nulls(parquet_values, values)
+
+        numpy_values = parquet_values.to_numpy(zero_copy_only=False)
+        # numpy converts dates and timestamps to Python objects depending on the unit, so it is set to the one pyarrow uses
+        if pa.types.is_timestamp(parquet_type):
+            numpy_values = numpy_values.astype("datetime64[us]")
+        elif pa.types.is_date(parquet_type):
+            numpy_values = numpy_values.astype("datetime64[D]")
+        return numpy_values.tolist()  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _list_to_python_values(parquet_values: pa.Array) -> List[Any]:
+        offsets, values = ParquetParser._list_offsets_and_values(
+            parquet_values, parquet_values.values
+        )
+        python_values = ParquetParser._to_python_values(values)
+        lists = [python_values[start:end] for start, end in zip(offsets, offsets[1:])]
+        return ParquetParser._with_nulls(parquet_values, lists)
+
+    @staticmethod
+    def _map_to_python_values(parquet_values: pa.Array) -> List[Any]:
+        # maps are converted to lists of key and item pairs, as `as_py` does
+        offsets, keys = ParquetParser._list_offsets_and_values(parquet_values, parquet_values.keys)
+        _, items = ParquetParser._list_offsets_and_values(parquet_values, parquet_values.items)
+        pairs = list(
+            zip(ParquetParser._to_python_values(keys), ParquetParser._to_python_values(items))
+        )
+        maps = [pairs[start:end] for start, end in zip(offsets, offsets[1:])]
+        return ParquetParser._with_nulls(parquet_values, maps)
+
+    @staticmethod
+    def _struct_to_python_values(parquet_values: pa.Array) -> List[Any]:
+        names = [field.name for field in parquet_values.type]
+        if len(set(names)) != len(names):
+            return parquet_values.to_pylist()  # type: ignore[no-any-return]
+        fields = [ParquetParser._to_python_values(field) for field in parquet_values.flatten()]
+        structs = [dict(zip(names, values)) for values in zip(*fields)]
+        if not fields:
+            structs = [{} for _ in range(len(parquet_values))]
+        return ParquetParser._with_nulls(parquet_values, structs)
+
+    @staticmethod
+    def _list_offsets_and_values(
+        parquet_values: pa.Array, child_values: pa.Array
+    ) -> Tuple[List[int], pa.Array]:
+        """
+        Return the offsets of the lists in their values and the values of the lists. The child values of a sliced array
+        are not sliced so they are sliced to the values of the lists and the offsets are shifted accordingly.
+        """
+        offsets: List[int] = parquet_values.offsets.to_numpy().tolist()
+        first_offset = offsets[0]
+        values = child_values.slice(first_offset, offsets[-1] - first_offset)
+        return [offset - first_offset for offset in offsets], values
+
+    @staticmethod
+    def _with_nulls(parquet_values: pa.Array, values: List[Any]) -> List[Any]:
+        if not parquet_values.null_count:
+            return values
+        is_null = parquet_values.is_null().to_numpy(zero_copy_only=False).tolist()
+        return [None if null else value for value, null in zip(values, is_null)]
+
+    @staticmethod
+    def _is_numpy_convertible(parquet_type: pa.DataType) -> bool:
+        return (
+            pa.types.is_boolean(parquet_type)
+            or pa.types.is_integer(parquet_type)
+            or (pa.types.is_floating(parquet_type) and not pa.types.is_float16(parquet_type))
+            or pa.types.is_string(parquet_type)
+            or pa.types.is_large_string(parquet_type)
+            or pa.types.is_date(parquet_type)
+            # timestamps in nanoseconds are not represented by `datetime` and timezones are not kept by numpy
+            or (
+                pa.types.is_timestamp(parquet_type)
+                and parquet_type.unit != "ns"
+                and parquet_type.tz is None
+            )
+        )
+
     @staticmethod
     def _scalar_to_python_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
         Convert a pyarrow scalar to a value that can be output by the source.
         """
-        if parquet_value.as_py() is None:
+        value = parquet_value.as_py()
+        if value is None:
             return None
+        converter = ParquetParser._python_value_converter(parquet_value.type, parquet_format)
+        return value if converter is None else converter(value)
 
+    @staticmethod
+    def _python_value_converter(
+        parquet_type: pa.DataType, parquet_format: ParquetFormat
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Return the function converting the non-null Python values of a pyarrow type to values that can be output by the
+        source, or None if the values are output as they are.
+        """
         # Convert date and datetime objects to isoformat strings
         if (
-            pa.types.is_time(parquet_value.type)
-            or pa.types.is_timestamp(parquet_value.type)
-            or pa.types.is_date(parquet_value.type)
+            pa.types.is_time(parquet_type)
+            or pa.types.is_timestamp(parquet_type)
+            or pa.types.is_date(parquet_type)
         ):
-            return parquet_value.as_py().isoformat()
+            return lambda value: value.isoformat()
 
         # Convert month_day_nano_interval to array
-        if parquet_value.type == pa.month_day_nano_interval():
-            return json.loads(json.dumps(parquet_value.as_py()))
+        if parquet_type == pa.month_day_nano_interval():
+            return lambda value: json.loads(json.dumps(value))
 
         # Decode binary strings to utf-8
-        if ParquetParser._is_binary(parquet_value.type):
-            return parquet_value.as_py().decode("utf-8")
+        if ParquetParser._is_binary(parquet_type):
+            return lambda value: value.decode("utf-8")
 
-        if pa.types.is_decimal(parquet_value.type):
+        if pa.types.is_decimal(parquet_type):
             if parquet_format.decimal_as_float:
-                return float(parquet_value.as_py())
+                return float
             else:
-                return str(parquet_value.as_py())
+                return str
 
-        if pa.types.is_map(parquet_value.type):
-            return {k: v for k, v in parquet_value.as_py()}
+        if pa.types.is_map(parquet_type):
+            return lambda value: {k: v for k, v in value}
 
-        if pa.types.is_null(parquet_value.type):
-            return None
+        if pa.types.is_null(parquet_type):
+            return lambda value: None
 
         # Convert duration to seconds, then convert to the appropriate unit
-        if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        if pa.types.is_duration(parquet_type):
+            unit = parquet_type.unit
+            if unit == "s":
+                return lambda duration: duration.total_seconds()
+            elif unit == "ms":
+                return lambda duration: duration.total_seconds() * 1000
+            elif unit == "us":
+                return lambda duration: duration.total_seconds() * 1_000_000
+            elif unit == "ns":
+                return lambda duration: (
+                    duration.total_seconds() * 1_000_000_000 + duration.nanoseconds
+                )
             else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
-        else:
-            return parquet_value.as_py()
+                raise ValueError(f"Unknown duration unit: {unit}")
+        return None
 
     @staticmethod
     def _dictionary_array_to_python_value(parquet_value: DictionaryArray) -> Dict[str, Any]:
@@ -13,6 +13,7 @@ from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
 )
+from airbyte_cdk.sources.file_based.byte_range import ByteRange
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
     FileBasedStreamConfig,
     PrimaryKeyType,
@@ -141,6 +142,13 @@ class AbstractFileBasedStream(Stream):
         """
         ...
 
+    def get_byte_ranges(self, file: RemoteFile, partition_size: int) -> Optional[List[ByteRange]]:
+        """
+        Return the byte ranges in which the file can be read independently, or None if the file is read as a whole. The
+        range is passed to `read_records_from_slice` under the `byte_range` key of the slice.
+        """
+        return None
+
     @abstractmethod
     @lru_cache(maxsize=None)
     def get_json_schema(self) -> Mapping[str, Any]:
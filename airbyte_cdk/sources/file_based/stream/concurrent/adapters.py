@@ -23,6 +23,7 @@ from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
     AbstractFileBasedAvailabilityStrategyWrapper,
 )
+from airbyte_cdk.sources.file_based.byte_range import ByteRange
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import PrimaryKeyType
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
@@ -69,9 +70,12 @@ class FileBasedStreamFacade(AbstractStreamFacade[DefaultStream], AbstractFileBas
         logger: logging.Logger,
         state: Optional[MutableMapping[str, Any]],
         cursor: "AbstractConcurrentFileBasedCursor",
+        byte_range_partition_size: Optional[int] = None,
     ) -> "FileBasedStreamFacade":
         """
         Create a ConcurrentStream from a FileBasedStream object.
+
+        If `byte_range_partition_size` is set, the files the stream can split are read in partitions of about that many bytes.
         """
         pk = get_primary_key_from_stream(stream.primary_key)
         cursor_field = get_cursor_field_from_stream(stream)
@@ -94,6 +98,7 @@ class FileBasedStreamFacade(AbstractStreamFacade[DefaultStream], AbstractFileBas
                     [cursor_field] if cursor_field is not None else None,
                     state,
                     cursor,
+                    byte_range_partition_size,
                 ),
                 name=stream.name,
                 json_schema=stream.get_json_schema(),
@@ -283,6 +288,8 @@ class FileBasedStreamPartition(Partition):
             f"Expected 1 file per partition but got {len(self._slice['files'])} for stream {self.stream_name()}"
         )
         file = self._slice["files"][0]
+        if self._slice.get("byte_range") is not None:
+            return {"files": [file], "byte_range": self._slice["byte_range"]}
         return {"files": [file]}
 
     def __hash__(self) -> int:
@@ -294,6 +301,8 @@ class FileBasedStreamPartition(Partition):
                 )
             else:
                 s = f"{self._slice['files'][0].last_modified.strftime('%Y-%m-%dT%H:%M:%S.%fZ')}_{self._slice['files'][0].uri}"
+            if self._slice.get("byte_range") is not None:
+                return hash((self._stream.name, s, self._slice["byte_range"]))
             return hash((self._stream.name, s))
         else:
             return hash(self._stream.name)
@@ -314,6 +323,7 @@ class FileBasedStreamPartitionGenerator(PartitionGenerator):
         cursor_field: Optional[List[str]],
         state: Optional[MutableMapping[str, Any]],
         cursor: "AbstractConcurrentFileBasedCursor",
+        byte_range_partition_size: Optional[int] = None,
     ):
         self._stream = stream
         self._message_repository = message_repository
@@ -321,23 +331,49 @@ class FileBasedStreamPartitionGenerator(PartitionGenerator):
         self._cursor_field = cursor_field
         self._state = state
         self._cursor = cursor
+        self._byte_range_partition_size = byte_range_partition_size
 
     def generate(self) -> Iterable[FileBasedStreamPartition]:
-        pending_partitions = []
+        files: List[RemoteFile] = []
         for _slice in self._stream.stream_slices(
             sync_mode=self._sync_mode, cursor_field=self._cursor_field, stream_state=self._state
         ):
             if _slice is not None:
-                for file in _slice.get("files", []):
-                    pending_partitions.append(
-                        FileBasedStreamPartition(
-                            self._stream,
-                            {"files": [copy.deepcopy(file)]},
-                            self._message_repository,
-                            self._sync_mode,
-                            self._cursor_field,
-                            self._state,
-                        )
-                    )
+                files.extend(copy.deepcopy(file) for file in _slice.get("files", []))
+        pending_partitions = [self._create_partition({"files": [file]}) for file in files]
         self._cursor.set_pending_partitions(pending_partitions)
-        yield from pending_partitions
+        for file, partition in zip(files, pending_partitions):
+            # a file is only split when its partitions are needed so that the partitions of the previous files are read
+            # in the meantime
+            byte_ranges = self._get_byte_ranges(file)
+            if byte_ranges is None:
+                yield partition
+                continue
+            self._cursor.set_pending_byte_ranges(file, len(byte_ranges))
+            for byte_range in byte_ranges:
+                yield self._create_partition({"files": [file], "byte_range": byte_range})
+
+    def _create_partition(self, _slice: StreamSlice) -> FileBasedStreamPartition:
+        return FileBasedStreamPartition(
+            self._stream,
+            _slice,
+            self._message_repository,
+            self._sync_mode,
+            self._cursor_field,
+            self._state,
+        )
+
+    def _get_byte_ranges(self, file: RemoteFile) -> Optional[List[ByteRange]]:
+        if self._byte_range_partition_size is None:
+            return None
+        try:
+            byte_ranges = self._stream.get_byte_ranges(file, self._byte_range_partition_size)
+        except Exception as exception:
+            # the file can still be read as a whole, which will surface the error if it affects the records
+            self._stream.logger.warning(
+                f"Could not split file {file.uri} in byte ranges, reading it as a whole: {exception}"
+            )
+            return None
+        if byte_ranges is None or len(byte_ranges) < 2:
+            return None
+        return byte_ranges
@@ -35,6 +35,13 @@ class AbstractConcurrentFileBasedCursor(Cursor, AbstractFileBasedCursor, ABC):
     @abstractmethod
     def set_pending_partitions(self, partitions: List["FileBasedStreamPartition"]) -> None: ...
 
+    def set_pending_byte_ranges(self, file: RemoteFile, number_of_byte_ranges: int) -> None:
+        """
+        Indicate that a pending file is read in `number_of_byte_ranges` partitions, each of which calls `add_file` once
+        read. Called before the partitions of the file are generated.
+        """
+        pass
+
     @abstractmethod
     def add_file(self, file: RemoteFile) -> None: ...
 
@@ -61,6 +61,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
         self._state_lock = RLock()
         self._pending_files_lock = RLock()
         self._pending_files: Optional[Dict[str, RemoteFile]] = None
+        # number of byte ranges left to read for the pending files read in several partitions
+        self._pending_byte_ranges: Dict[str, int] = {}
         self._file_to_datetime_history = stream_state.get("history", {}) if stream_state else {}
         self._prev_cursor_value = self._compute_prev_sync_cursor(stream_state)
         self._sync_start = self._compute_start_time()
@@ -82,6 +84,7 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
     def set_pending_partitions(self, partitions: List["FileBasedStreamPartition"]) -> None:
         with self._pending_files_lock:
             self._pending_files = {}
+            self._pending_byte_ranges = {}
             for partition in partitions:
                 _slice = partition.to_slice()
                 if _slice is None:
@@ -93,6 +96,14 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                         )
                 self._pending_files.update({file.uri: file})
 
+    def set_pending_byte_ranges(self, file: RemoteFile, number_of_byte_ranges: int) -> None:
+        with self._pending_files_lock:
+            if self._pending_files is None or file.uri not in self._pending_files:
+                raise RuntimeError(
+                    f"Expected file {file.uri} to be in pending files but it was not. This is unexpected. Please contact Support."
+                )
+            self._pending_byte_ranges[file.uri] = number_of_byte_ranges
+
     def _compute_prev_sync_cursor(self, value: Optional[StreamState]) -> Tuple[datetime, str]:
         if not value:
             return self.zero_value, ""
@@ -132,7 +143,8 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
 
     def add_file(self, file: RemoteFile) -> None:
         """
-        Add a file to the cursor. This method is called when a file is processed by the stream.
+        Add a file to the cursor. This method is called when a file is processed by the stream. Files read in several byte
+        ranges are only added once all of their ranges are processed.
         :param file: The file to add
         """
         if self._pending_files is None:
@@ -140,6 +152,11 @@ class FileBasedConcurrentCursor(AbstractConcurrentFileBasedCursor):
                 "Expected pending partitions to be set but it was not. This is unexpected. Please contact Support."
             )
         with self._pending_files_lock:
+            if file.uri in self._pending_byte_ranges:
+                self._pending_byte_ranges[file.uri] -= 1
+                if self._pending_byte_ranges[file.uri] > 0:
+                    return
+                del self._pending_byte_ranges[file.uri]
             with self._state_lock:
                 if file.uri not in self._pending_files:
                     self._message_repository.emit_message(
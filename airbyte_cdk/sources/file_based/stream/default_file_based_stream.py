@@ -13,6 +13,7 @@ from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional,
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteStream, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.file_based.byte_range import ByteRange, ByteRangeStreamReader
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import PrimaryKeyType
 from airbyte_cdk.sources.file_based.exceptions import (
     DuplicatedFilesError,
@@ -48,6 +49,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     FILE_TRANSFER_KW = "use_file_transfer"
     PRESERVE_DIRECTORY_STRUCTURE_KW = "preserve_directory_structure"
     FILES_KEY = "files"
+    BYTE_RANGE_KEY = "byte_range"
     DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
     ab_last_mod_col = "_ab_source_file_last_modified"
     ab_file_name_col = "_ab_source_file_url"
@@ -123,6 +125,13 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                 )
         return slices
 
+    def get_byte_ranges(self, file: RemoteFile, partition_size: int) -> Optional[List[ByteRange]]:
+        if self.use_file_transfer:
+            return None
+        return self.get_parser().get_byte_ranges(
+            self.config, file, self.stream_reader, self.logger, partition_size
+        )
+
     def transform_record(
         self, record: dict[str, Any], file: RemoteFile, last_updated: str
     ) -> dict[str, Any]:
@@ -144,6 +153,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             raise MissingSchemaError(FileBasedSourceError.MISSING_SCHEMA, stream=self.name)
         # The stream only supports a single file type, so we can use the same parser for all files
         parser = self.get_parser()
+        stream_reader = self.stream_reader
+        byte_range = stream_slice.get(self.BYTE_RANGE_KEY)
+        if byte_range is not None:
+            stream_reader = ByteRangeStreamReader(stream_reader, byte_range)
         for file in stream_slice["files"]:
             # only serialize the datetime once
             file_datetime_string = file.last_modified.strftime(self.DATE_TIME_FORMAT)
@@ -161,7 +174,7 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         )
                 else:
                     for record in parser.parse_records(
-                        self.config, file, self.stream_reader, self.logger, schema
+                        self.config, file, stream_reader, self.logger, schema
                     ):
                         line_no += 1
                         if self.config.schemaless:
@@ -3,13 +3,15 @@
 #
 
 import traceback
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Optional
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level
 from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.file_based.byte_range import ByteRange
 from airbyte_cdk.sources.file_based.file_based_stream_permissions_reader import (
     AbstractFileBasedStreamPermissionsReader,
 )
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams.core import JsonSchema
@@ -40,6 +42,10 @@ class PermissionsFileBasedStream(DefaultFileBasedStream):
     ) -> Dict[str, Any]:
         return self.stream_permissions_reader.file_permissions_schema
 
+    def get_byte_ranges(self, file: RemoteFile, partition_size: int) -> Optional[List[ByteRange]]:
+        # permissions are read per file, not from the content of the file
+        return None
+
     def read_records_from_slice(self, stream_slice: StreamSlice) -> Iterable[AirbyteMessage]:
         """
         Yield permissions records from all remote files
@@ -1,7 +1,9 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 
 import json
-from typing import Any, Mapping
+from typing import Any, Dict, Mapping, Tuple
+
+PartitionKey = Tuple[Any, ...]
 
 
 class PerPartitionKeySerializer:
@@ -20,3 +22,56 @@ class PerPartitionKeySerializer:
     @staticmethod
     def to_partition(to_deserialize: Any) -> Mapping[str, Any]:
         return json.loads(to_deserialize)  # type: ignore # The partition is known to be a dict, but the type hint is Any
+
+
+def _to_canonical(value: Any) -> Any:
+    """
+    Hashable form of a JSON-like value where two values are equal if and only if their sorted JSON serializations are: mappings
+    become tuples of sorted items, sequences are tagged to not be mistaken for mappings and other values are tagged with their type
+    so that `1`, `1.0` and `True` stay distinct.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if isinstance(value, Mapping):
+        return tuple(sorted([(key, _to_canonical(item)) for key, item in value.items()]))
+    if value_type is list or value_type is tuple:
+        return (list, tuple([_to_canonical(item) for item in value]))
+    return (value_type, value)
+
+
+class InternedPartitionKeySerializer:
+    """
+    Same purpose as `PerPartitionKeySerializer` for cursors tracking many partitions: the key of a partition is a canonical tuple
+    which is cheaper to compute than a sorted JSON string, and which is interned so that every structure keyed by partition shares
+    the same key object. The partition of a key is cached when the key is first created so converting a key back is a lookup. The
+    cached partition is the JSON round trip of the partition so it is the same as the one `PerPartitionKeySerializer` gives back.
+    """
+
+    def __init__(self) -> None:
+        self._key_and_partition: Dict[PartitionKey, Tuple[PartitionKey, Mapping[str, Any]]] = {}
+
+    def to_partition_key(self, partition: Mapping[str, Any]) -> PartitionKey:
+        key: PartitionKey = _to_canonical(partition)
+        key_and_partition = self._key_and_partition.get(key)
+        if key_and_partition is None:
+            # setdefault is atomic so threads creating the same key concurrently get the same one
+            key_and_partition = self._key_and_partition.setdefault(
+                key,
+                (
+                    key,
+                    PerPartitionKeySerializer.to_partition(
+                        PerPartitionKeySerializer.to_partition_key(partition)
+                    ),
+                ),
+            )
+        return key_and_partition[0]
+
+    def to_partition(self, partition_key: PartitionKey) -> Mapping[str, Any]:
+        return self._key_and_partition[partition_key][1]
+
+    def release(self, partition_key: PartitionKey) -> None:
+        """
+        Forget the partition of a key that is not tracked anymore. The key is created again if the partition is seen again.
+        """
+        self._key_and_partition.pop(partition_key, None)
@@ -303,6 +303,7 @@ class StreamPartition(Partition):
                         data=data_to_return,
                         stream_name=self.stream_name(),
                         associated_slice=self._slice,  # type: ignore [arg-type]
+                        owned=True,
                     )
                 elif isinstance(record_data, AirbyteMessage) and record_data.record is not None:
                     yield Record(
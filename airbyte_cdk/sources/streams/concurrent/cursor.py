@@ -59,6 +59,14 @@ class Cursor(StreamSlicer, ABC):
         """
         raise NotImplementedError()
 
+    def extract_cursor_value(self, record: Record) -> Optional[Any]:
+        """
+        Return the comparable cursor value of the record, or None if the cursor doesn't track the records. This is called by
+        the threads reading the partitions so it must not change the cursor: only the record of each partition with the
+        most recent cursor value is then observed. Cursors which don't override this method observe every record instead.
+        """
+        return None
+
     @abstractmethod
     def close_partition(self, partition: Partition) -> None:
         """
@@ -215,6 +223,13 @@ class ConcurrentCursor(Cursor):
     def _extract_cursor_value(self, record: Record) -> Any:
         return self._connector_state_converter.parse_value(self._cursor_field.extract_value(record))
 
+    def extract_cursor_value(self, record: Record) -> Optional[Any]:
+        try:
+            return self._extract_cursor_value(record)
+        except ValueError:
+            self._log_for_record_without_cursor_value()
+            return None
+
     def close_partition(self, partition: Partition) -> None:
         slice_count_before = len(self._concurrent_state.get("slices", []))
         self._add_slice_to_state(partition)
@@ -45,6 +45,10 @@ class DefaultStream(AbstractStream):
     def generate_partitions(self) -> Iterable[Partition]:
         yield from self._stream_partition_generator.generate()
 
+    @property
+    def partition_generator(self) -> PartitionGenerator:
+        return self._stream_partition_generator
+
     @property
     def name(self) -> str:
         return self._name
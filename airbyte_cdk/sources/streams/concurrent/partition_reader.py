@@ -2,13 +2,36 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 from queue import Queue
+from typing import Any, List, Optional
 
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
     PartitionCompleteSentinel,
     QueueItem,
 )
+from airbyte_cdk.sources.types import Record
+
+
+class MostRecentRecordTracker:
+    """
+    Keeps the record of a partition with the most recent cursor value. Cursor values are extracted by the thread reading the
+    partition so that the main thread only observes one record per partition.
+    """
+
+    def __init__(self, cursor: Cursor) -> None:
+        self._cursor = cursor
+        self._most_recent_cursor_value: Any = None
+        self.most_recent_record: Optional[Record] = None
+
+    def track(self, record: Record) -> None:
+        cursor_value = self._cursor.extract_cursor_value(record)
+        if cursor_value is not None and (
+            self._most_recent_cursor_value is None or self._most_recent_cursor_value < cursor_value
+        ):
+            self._most_recent_cursor_value = cursor_value
+            self.most_recent_record = record
 
 
 class PartitionReader:
@@ -18,28 +41,61 @@ class PartitionReader:
 
     _IS_SUCCESSFUL = True
 
-    def __init__(self, queue: Queue[QueueItem]) -> None:
+    def __init__(self, queue: Queue[QueueItem], batch_size: int = 1) -> None:
         """
         :param queue: The queue to put the records in.
+        :param batch_size: The number of records put in the queue as a single item. With a value greater than 1, records are put in the queue as lists which reduces the contention on the queue lock when there are many workers.
         """
+        if batch_size < 1:
+            raise ValueError(
+                f"PartitionReader expects batch_size to be at least 1 but got {batch_size}"
+            )
         self._queue = queue
+        self._batch_size = batch_size
 
-    def process_partition(self, partition: Partition) -> None:
+    def process_partition(self, partition: Partition, cursor: Cursor) -> None:
         """
-        Process a partition and put the records in the output queue.
+        Process a partition and put the records in the output queue. The cursor values of the records are extracted as they
+        are read so that parsing them doesn't happen on the thread emitting the records: the record with the most recent
+        cursor value is handed to the main thread with the sentinel of the partition.
         When all the partitions are added to the queue, a sentinel is added to the queue to indicate that all the partitions have been generated.
 
         If an exception is encountered, the exception will be caught and put in the queue. This is very important because if we don't, the
         main thread will have no way to know that something when wrong and will wait until the timeout is reached
 
+        When batching is enabled, the records of a partition are always put in the queue before its exception or its sentinel.
+
         This method is meant to be called from a thread.
         :param partition: The partition to read data from
+        :param cursor: The cursor of the stream the partition belongs to
         :return: None
         """
+        batch: List[Record] = []
+        tracker = MostRecentRecordTracker(cursor)
         try:
-            for record in partition.read():
-                self._queue.put(record)
-            self._queue.put(PartitionCompleteSentinel(partition, self._IS_SUCCESSFUL))
+            if self._batch_size == 1:
+                for record in partition.read():
+                    tracker.track(record)
+                    self._queue.put(record)
+            else:
+                for record in partition.read():
+                    tracker.track(record)
+                    batch.append(record)
+                    if len(batch) >= self._batch_size:
+                        self._queue.put(batch)
+                        batch = []
+                self._flush(batch)
+                batch = []
+            self._queue.put(
+                PartitionCompleteSentinel(
+                    partition, self._IS_SUCCESSFUL, tracker.most_recent_record
+                )
+            )
         except Exception as e:
+            self._flush(batch)
             self._queue.put(StreamThreadException(e, partition.stream_name()))
             self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+
+    def _flush(self, batch: List[Record]) -> None:
+        if batch:
+            self._queue.put(batch)
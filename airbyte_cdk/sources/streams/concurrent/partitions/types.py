@@ -2,7 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from typing import Any, Union
+from typing import Any, List, Optional, Union
 
 from airbyte_cdk.sources.concurrent_source.partition_generation_completed_sentinel import (
     PartitionGenerationCompletedSentinel,
@@ -17,12 +17,20 @@ class PartitionCompleteSentinel:
     Includes a pointer to the partition that was processed.
     """
 
-    def __init__(self, partition: Partition, is_successful: bool = True):
+    def __init__(
+        self,
+        partition: Partition,
+        is_successful: bool = True,
+        most_recent_record: Optional[Record] = None,
+    ):
         """
         :param partition: The partition that was processed
+        :param is_successful: Whether all the records of the partition were produced
+        :param most_recent_record: The record of the partition with the most recent cursor value, if any
         """
         self.partition = partition
         self.is_successful = is_successful
+        self.most_recent_record = most_recent_record
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, PartitionCompleteSentinel):
@@ -34,5 +42,10 @@ class PartitionCompleteSentinel:
 Typedef representing the items that can be added to the ThreadBasedConcurrentStream
 """
 QueueItem = Union[
-    Record, Partition, PartitionCompleteSentinel, PartitionGenerationCompletedSentinel, Exception
+    Record,
+    List[Record],
+    Partition,
+    PartitionCompleteSentinel,
+    PartitionGenerationCompletedSentinel,
+    Exception,
 ]
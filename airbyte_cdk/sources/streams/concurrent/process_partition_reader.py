@@ -0,0 +1,303 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import logging
+import multiprocessing
+import pickle
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.connection import Connection
+from queue import Queue
+from typing import Any, Deque, List, Mapping, Optional
+
+import orjson
+
+from airbyte_cdk.logger import AirbyteLogFormatter
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
+from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partition_reader import (
+    MostRecentRecordTracker,
+    PartitionReader,
+)
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    QueueItem,
+)
+from airbyte_cdk.sources.types import Record
+from airbyte_cdk.utils.airbyte_secrets_utils import filter_secrets
+
+_JSON_RECORDS = b"J"
+_PICKLED_RECORDS = b"P"
+_MESSAGES = b"M"
+_EXCEPTION = b"E"
+_DONE = b"D"
+
+# Values orjson would silently convert (datetimes, dataclasses, subclasses of builtins) make the serialization fail instead
+# so that they are pickled and the records in the main process are the same as the ones produced by the partition.
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+
+
+class ProcessPartitionFactory(ABC):
+    """
+    Creates the partitions read by the worker processes of a ProcessPartitionReader. Partitions hold sessions, caches and
+    closures which can't be pickled so the factory is pickled instead when a worker process starts, and it creates the
+    partitions from their stream name and slice. Each worker process therefore has its own components.
+    """
+
+    @abstractmethod
+    def create(self, stream_name: str, stream_slice: Optional[Mapping[str, Any]]) -> Partition:
+        """
+        Create, in a worker process, the partition of the stream with the given slice.
+        """
+
+    @property
+    @abstractmethod
+    def message_repository(self) -> MessageRepository:
+        """
+        The repository on which the partitions created by the factory emit messages.
+        """
+
+
+class ProcessPartitionReader(PartitionReader):
+    """
+    Reads the partitions in a pool of worker processes so that CPU-bound work (decoding, filtering, transformations) is
+    not limited by the GIL. `process_partition` is still called from a worker thread: the thread submits the partition
+    to the pool, receives the records back in serialized batches, tracks their cursor values and puts them in the queue
+    like `PartitionReader` does. Cursors and state are only updated by the main process.
+
+    The worker processes are spawned so they don't inherit the threads, locks and connections of the main process. They
+    create the partitions with a ProcessPartitionFactory and anything the partitions change outside of the records they
+    yield is lost, except for the messages emitted on the message repository of the factory and the logs which are
+    forwarded to the main process. In particular, call rate budgets are not shared between worker processes.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    _POLL_INTERVAL_SECONDS = 1
+
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        message_repository: MessageRepository,
+        partition_factory: ProcessPartitionFactory,
+        max_workers: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        :param queue: The queue to put the records in.
+        :param message_repository: The repository on which messages emitted by the worker processes are re-emitted.
+        :param partition_factory: The factory creating the partitions in the worker processes.
+        :param max_workers: The maximum number of worker processes. There is no need for more processes than threads calling `process_partition`.
+        :param batch_size: The number of records serialized together by the worker process. The records are put in the queue with the same batches.
+        """
+        super().__init__(queue, batch_size=batch_size)
+        self._message_repository = message_repository
+        self._context = multiprocessing.get_context("spawn")
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=self._context,
+            initializer=_initialize_worker,
+            initargs=(partition_factory,),
+        )
+
+    def process_partition(self, partition: Partition, cursor: Cursor) -> None:
+        """
+        Read the partition in a worker process and put the records in the output queue followed by a sentinel. Exceptions
+        raised in the worker process are re-raised in the calling thread and put in the queue as for `PartitionReader`.
+
+        This method is meant to be called from a thread.
+        :param partition: The partition to read data from
+        :param cursor: The cursor of the stream the partition belongs to
+        :return: None
+        """
+        receiver, sender = self._context.Pipe(duplex=False)
+        tracker = MostRecentRecordTracker(cursor)
+        try:
+            future = self._pool.submit(
+                _read_partition,
+                partition.stream_name(),
+                partition.to_slice(),
+                sender,
+                self._batch_size,
+            )
+            self._receive(partition, tracker, receiver, future)
+            self._queue.put(
+                PartitionCompleteSentinel(
+                    partition, self._IS_SUCCESSFUL, tracker.most_recent_record
+                )
+            )
+        except Exception as e:
+            self._queue.put(StreamThreadException(e, partition.stream_name()))
+            self._queue.put(PartitionCompleteSentinel(partition, not self._IS_SUCCESSFUL))
+        finally:
+            receiver.close()
+            sender.close()
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes once the partitions they are reading are done. Partitions not submitted yet won't be read.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _receive(
+        self,
+        partition: Partition,
+        tracker: MostRecentRecordTracker,
+        receiver: Connection,
+        future: "Future[None]",
+    ) -> None:
+        while True:
+            # the sending end is also held by this process until the task is done so the end of the data can't be
+            # detected with EOFError: instead, the task is checked while waiting
+            if not receiver.poll(self._POLL_INTERVAL_SECONDS):
+                if future.done() and not receiver.poll():
+                    future.result()
+                    raise RuntimeError(
+                        f"The process reading a partition of stream {partition.stream_name()} stopped before sending all the records"
+                    )
+                continue
+            payload = receiver.recv_bytes()
+            kind, content = payload[:1], payload[1:]
+            if kind == _DONE:
+                return
+            elif kind == _JSON_RECORDS:
+                self._put_records(self._to_records(partition, orjson.loads(content)), tracker)
+            elif kind == _PICKLED_RECORDS:
+                self._put_records(self._to_records(partition, pickle.loads(content)), tracker)
+            elif kind == _MESSAGES:
+                for message in pickle.loads(content):
+                    if message.type == Type.LOG and message.log:
+                        # the secrets of the config are only known by the main process
+                        message.log.message = filter_secrets(message.log.message)
+                    self._message_repository.emit_message(message)
+            elif kind == _EXCEPTION:
+                raise pickle.loads(content)
+            else:
+                raise ValueError(f"Unexpected payload type {kind!r} received from worker process")
+
+    def _put_records(self, records: List[Record], tracker: MostRecentRecordTracker) -> None:
+        for record in records:
+            tracker.track(record)
+        self._queue.put(records)
+
+    @staticmethod
+    def _to_records(partition: Partition, batch: List[Mapping[str, Any]]) -> List[Record]:
+        stream_name = partition.stream_name()
+        associated_slice = partition.to_slice()
+        return [
+            # the data was deserialized for these records only so they own it
+            Record(
+                data=data,
+                stream_name=stream_name,
+                associated_slice=associated_slice,  # type: ignore[arg-type]  # partitions slices are StreamSlices
+                owned=True,
+            )
+            for data in batch
+        ]
+
+
+_partition_factory: Optional[ProcessPartitionFactory] = None
+_log_messages: Deque[AirbyteMessage] = deque()
+
+
+class _LogMessageHandler(logging.Handler):
+    """
+    Turns the log records of a worker process into log messages sent to the main process along with the records.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            _log_messages.append(
+                AirbyteMessage(
+                    type=Type.LOG,
+                    log=AirbyteLogMessage(
+                        level=AirbyteLogFormatter.level_mapping.get(record.levelno, Level.INFO),
+                        message=self.format(record),
+                    ),
+                )
+            )
+        except Exception:
+            self.handleError(record)
+
+
+def _initialize_worker(partition_factory: ProcessPartitionFactory) -> None:
+    global _partition_factory
+    _partition_factory = partition_factory
+    # importing the CDK configures the loggers to print on the stdout shared with the main process, where the lines
+    # could interleave with the output of the main process
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_LogMessageHandler())
+
+
+def _read_partition(
+    stream_name: str,
+    stream_slice: Optional[Mapping[str, Any]],
+    sender: Connection,
+    batch_size: int,
+) -> None:
+    """
+    Task run by the worker processes.
+    """
+    assert _partition_factory, "The worker process was not initialized with a partition factory"
+    message_repository = _partition_factory.message_repository
+    batch: List[Mapping[str, Any]] = []
+    try:
+        partition = _partition_factory.create(stream_name, stream_slice)
+        for record in partition.read():
+            if record.file_reference:
+                raise ValueError(
+                    "Reading partitions in worker processes does not support file transfer records"
+                )
+            batch.append(record.data)
+            if len(batch) >= batch_size:
+                _send_records(sender, message_repository, batch)
+                batch = []
+        _send_records(sender, message_repository, batch)
+        sender.send_bytes(_DONE)
+    except Exception as exception:
+        # as for `PartitionReader`, the records read before the error still reach the queue
+        try:
+            _send_records(sender, message_repository, batch)
+        except Exception:
+            pass
+        _send_exception(sender, exception)
+    finally:
+        sender.close()
+
+
+def _send_records(
+    sender: Connection, message_repository: MessageRepository, batch: List[Mapping[str, Any]]
+) -> None:
+    # messages are sent first as they were emitted before the last record of the batch was read
+    messages: List[AirbyteMessage] = []
+    while _log_messages:
+        messages.append(_log_messages.popleft())
+    messages.extend(message_repository.consume_queue())
+    if messages:
+        sender.send_bytes(_MESSAGES + pickle.dumps(messages))
+    if not batch:
+        return
+    try:
+        sender.send_bytes(_JSON_RECORDS + orjson.dumps(batch, option=_ORJSON_OPTIONS))
+    except TypeError:
+        sender.send_bytes(_PICKLED_RECORDS + pickle.dumps(batch))
+
+
+def _send_exception(sender: Connection, exception: Exception) -> None:
+    try:
+        serialized_exception = pickle.dumps(exception)
+        pickle.loads(serialized_exception)
+    except Exception:
+        serialized_exception = pickle.dumps(
+            RuntimeError(f"{type(exception).__name__}: {exception}")
+        )
+    sender.send_bytes(_EXCEPTION + serialized_exception)
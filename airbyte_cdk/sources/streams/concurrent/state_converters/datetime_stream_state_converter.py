@@ -194,6 +194,9 @@ class CustomFormatConcurrentStreamStateConverter(IsoMillisConcurrentStreamStateC
     """
     Datetime State converter that emits state according to the supplied datetime format. The converter supports reading
     incoming state in any valid datetime format using AirbyteDateTime parsing utilities.
+
+    As the values of a stream usually all have the same format, the input format that matched the last value is tried
+    first. The other formats are only tried, in order, when it does not match.
     """
 
     def __init__(
@@ -210,14 +213,25 @@ class CustomFormatConcurrentStreamStateConverter(IsoMillisConcurrentStreamStateC
         self._input_datetime_formats = input_datetime_formats if input_datetime_formats else []
         self._input_datetime_formats += [self._datetime_format]
         self._parser = DatetimeParser()
+        self._last_matching_format: Optional[str] = None
 
     def output_format(self, timestamp: datetime) -> str:
         return self._parser.format(timestamp, self._datetime_format)
 
     def parse_timestamp(self, timestamp: str) -> datetime:
-        for datetime_format in self._input_datetime_formats:
+        last_matching_format = self._last_matching_format
+        if last_matching_format is not None:
             try:
-                return self._parser.parse(timestamp, datetime_format)
+                return self._parser.parse(timestamp, last_matching_format)
             except ValueError:
                 pass
+        for datetime_format in self._input_datetime_formats:
+            if datetime_format == last_matching_format:
+                continue
+            try:
+                parsed_datetime = self._parser.parse(timestamp, datetime_format)
+            except ValueError:
+                continue
+            self._last_matching_format = datetime_format
+            return parsed_datetime
         raise ValueError(f"No format in {self._input_datetime_formats} matching {timestamp}")
@@ -19,22 +19,33 @@ EmptyString = str()
 
 
 class Record(Mapping[str, Any]):
+    """
+    A record read from a stream. A record is `owned` if nothing else references its data: the CDK can then modify the data
+    in place and emit it without copying it. Records that are not owned are copied before being modified.
+    """
+
     def __init__(
         self,
         data: Mapping[str, Any],
         stream_name: str,
         associated_slice: Optional[StreamSlice] = None,
         file_reference: Optional[AirbyteRecordMessageFileReference] = None,
+        owned: bool = False,
     ):
         self._data = data
         self._associated_slice = associated_slice
         self.stream_name = stream_name
         self._file_reference = file_reference
+        self._owned = owned
 
     @property
     def data(self) -> Mapping[str, Any]:
         return self._data
 
+    @property
+    def owned(self) -> bool:
+        return self._owned
+
     @property
     def associated_slice(self) -> Optional[StreamSlice]:
         return self._associated_slice
@@ -72,7 +83,26 @@ class Record(Mapping[str, Any]):
         return not self.__eq__(other)
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Convert a JSON-like value to a hashable value that is equal for equal values.
+    """
+    if isinstance(value, Mapping):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
 class StreamSlice(Mapping[str, Any]):
+    """
+    Immutable mapping of the partition and cursor slice values. As slices are used as dictionary keys for every record
+    (for example to track the most recent cursor value per partition), the hash is computed on first use and cached:
+    neither the slice nor the values it was built from should be modified afterwards.
+    """
+
     def __init__(
         self,
         *,
@@ -94,6 +124,7 @@ class StreamSlice(Mapping[str, Any]):
             raise ValueError("Keys for partition and incremental sync cursor should not overlap")
 
         self._stream_slice = dict(partition) | dict(cursor_slice)
+        self._hash: Optional[int] = None
 
     @property
     def partition(self) -> Mapping[str, Any]:
@@ -161,9 +192,24 @@ class StreamSlice(Mapping[str, Any]):
         return self._stream_slice
 
     def __hash__(self) -> int:
-        return SliceHasher.hash(
-            stream_slice=self._stream_slice
-        )  # no need to provide stream_name here as this is used for slicing the cursor
+        if self._hash is None:
+            try:
+                self._hash = hash(frozenset(self._stream_slice.items()))
+            except TypeError:
+                try:
+                    self._hash = hash(_freeze(self._stream_slice))
+                except TypeError:
+                    # values that are neither hashable nor containers are hashed on their JSON representation
+                    self._hash = SliceHasher.hash(stream_slice=self._stream_slice)
+        return self._hash
+
+    def __getstate__(self) -> Mapping[str, Any]:
+        # hashes of strings are different from one process to the other so the cached hash is not pickled
+        return {key: value for key, value in self.__dict__.items() if key != "_hash"}
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._hash = None
 
     def __bool__(self) -> bool:
         return bool(self._stream_slice) or bool(self._extra_fields)
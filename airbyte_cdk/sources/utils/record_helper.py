@@ -23,13 +23,22 @@ def stream_data_to_airbyte_message(
     transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform),
     schema: Optional[Mapping[str, Any]] = None,
     file_reference: Optional[AirbyteRecordMessageFileReference] = None,
+    owned: bool = False,
 ) -> AirbyteMessage:
+    """
+    :param owned: Whether nothing else references `data_or_message` when it is a mapping. Owned data is transformed in place
+        and emitted as is instead of being copied.
+    """
     if schema is None:
         schema = {}
 
     match data_or_message:
         case ABCMapping():
-            data = dict(data_or_message)
+            data = (
+                data_or_message
+                if owned and isinstance(data_or_message, dict)
+                else dict(data_or_message)
+            )
             now_millis = time.time_ns() // 1_000_000
             # Transform object fields according to config. Most likely you will
             # need it to normalize values against json schema. By default no action
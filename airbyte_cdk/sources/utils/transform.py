@@ -4,11 +4,20 @@
 
 import logging
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Generator, Mapping, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Tuple, cast
 
-from jsonschema import Draft7Validator, RefResolver, ValidationError, Validator, validators
+from jsonschema import (
+    Draft7Validator,
+    RefResolutionError,
+    RefResolver,
+    ValidationError,
+    Validator,
+    validators,
+)
 
 MAX_NESTING_DEPTH = 3
+# Number of schemas for which a TypeTransformer keeps the compiled normalization
+MAX_COMPILED_SCHEMAS = 16
 json_to_python_simple = {
     "string": str,
     "number": float,
@@ -44,6 +53,112 @@ def _strtobool(value: str, /) -> int:
     raise ValueError(f"Invalid boolean value: {normalized_str}")
 
 
+# Python types for which the Draft 7 type check passes without having to call the type checker. Other values (booleans
+# for "number", floats for "integer", subclasses, ...) go through `_TYPE_CHECKER` so that the result is the same.
+_TYPE_CHECKER = Draft7Validator.TYPE_CHECKER
+_ALWAYS_VALID_PYTHON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "null": (type(None),),
+    "object": (dict,),
+    "array": (list,),
+}
+_SIMPLE_PYTHON_TYPES = frozenset(json_to_python_simple.values())
+
+# A path in the record is built as a linked list of (parent path, key) as it is only needed when logging an error
+_Path = Optional[Tuple[Any, Any]]
+
+
+def _to_path_elements(path: _Path) -> List[Any]:
+    elements = []
+    while path is not None:
+        path, key = path
+        elements.append(key)
+    elements.reverse()
+    return elements
+
+
+def _identity(original_item: Any) -> Any:
+    return original_item
+
+
+def _convert_to_string(original_item: Any) -> Any:
+    if type(original_item) is str:
+        return original_item
+    try:
+        return str(original_item)
+    except (ValueError, TypeError):
+        return original_item
+
+
+def _convert_to_number(original_item: Any) -> Any:
+    if type(original_item) is float:
+        return original_item
+    try:
+        return float(original_item)
+    except (ValueError, TypeError):
+        return original_item
+
+
+def _convert_to_integer(original_item: Any) -> Any:
+    if type(original_item) is int:
+        return original_item
+    try:
+        return int(original_item)
+    except (ValueError, TypeError):
+        return original_item
+
+
+def _convert_to_boolean(original_item: Any) -> Any:
+    if type(original_item) is bool:
+        return original_item
+    try:
+        if isinstance(original_item, str):
+            return _strtobool(original_item) == 1
+        return bool(original_item)
+    except (ValueError, TypeError):
+        return original_item
+
+
+def _convert_to_array(original_item: Any) -> Any:
+    if type(original_item) in _SIMPLE_PYTHON_TYPES:
+        return [original_item]
+    return original_item
+
+
+def _raise_when_called(error: RefResolutionError) -> Callable[..., Any]:
+    def raise_error(*args: Any) -> Any:
+        raise error
+
+    return raise_error
+
+
+class _UnsupportedSchemaError(Exception):
+    """
+    Raised when compiling a schema using constructs for which the compiled normalization would not behave exactly like
+    the jsonschema traversal (boolean schemas, tuple validation, nested `$id`, remote references, unknown types, ...).
+    """
+
+
+class _CompiledSchema:
+    """
+    Normalization plan of a (sub)schema. Each step replays what the validator registered for a schema keyword does in
+    `TypeTransformer._normalizer`, in the order the keywords appear in the schema so that values are normalized and
+    warnings are logged in the same order.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self) -> None:
+        self.steps: List[Callable[[Any, _Path], None]] = []
+
+    def apply(self, instance: Any, path: _Path) -> None:
+        for step in self.steps:
+            step(instance, path)
+
+
 class TransformConfig(Flag):
     """
     TypeTransformer class config. Configs can be combined using bitwise or operator e.g.
@@ -87,6 +202,11 @@ class TypeTransformer:
         self._normalizer = validators.create(
             meta_schema=Draft7Validator.META_SCHEMA, validators=all_validators
         )
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = {}
+
+    @property
+    def config(self) -> TransformConfig:
+        return self._config
 
     def registerCustomTransform(
         self, normalization_callback: Callable[[Any, dict[str, Any]], Any]
@@ -234,10 +354,15 @@ class TypeTransformer:
         """
         Normalize and validate according to config.
         :param record: record instance for normalization/transformation. All modification are done by modifying existent object.
-        :param schema: object's jsonschema for normalization.
+        :param schema: object's jsonschema for normalization. The schema is compiled the first time it is seen and is
+            expected not to be modified afterwards.
         """
         if TransformConfig.NoTransform in self._config:
             return
+        compiled_schema = self._get_compiled_schema(schema)
+        if compiled_schema is not None:
+            compiled_schema.apply(record, None)
+            return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -246,6 +371,121 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def _get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        """
+        Return the compiled normalization for the schema or None if the schema needs to be normalized through the
+        jsonschema validator. Streams often build a new but equal schema for each record so a schema that is not known
+        by identity is compared to the ones already compiled before being compiled.
+        """
+        cached = self._compiled_schemas.get(id(schema))
+        if cached is not None:
+            return cached[1]
+
+        for cached_schema, cached_compiled_schema in list(self._compiled_schemas.values()):
+            if cached_schema == schema:
+                compiled_schema = cached_compiled_schema
+                break
+        else:
+            compiled_schema = self._compile(schema)
+
+        if len(self._compiled_schemas) >= MAX_COMPILED_SCHEMAS:
+            self._compiled_schemas.pop(next(iter(self._compiled_schemas)), None)
+        # the schema is kept in the cache so that its id can't be reused by another object
+        self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        return compiled_schema
+
+    def _compile(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        if type(self).__normalize is not TypeTransformer.__normalize or not isinstance(
+            schema, Mapping
+        ):
+            return None
+        try:
+            return _SchemaCompiler(self, schema).compile(schema)
+        except _UnsupportedSchemaError:
+            return None
+
+    def _compile_default_convert(self, subschema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        """
+        Build the equivalent of `default_convert` for a given subschema.
+        """
+
+        def convert_with_subschema(original_item: Any) -> Any:
+            return self.default_convert(original_item, cast(Dict[str, Any], subschema))
+
+        if type(self).default_convert is not TypeTransformer.default_convert:
+            return convert_with_subschema
+
+        target_type = subschema.get("type", [])
+        if isinstance(target_type, list):
+            nullable = "null" in target_type
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return _identity
+            target_type = target_type[0]
+        elif isinstance(target_type, str):
+            nullable = "null" in target_type
+        else:
+            return convert_with_subschema
+
+        if target_type == "string":
+            convert = _convert_to_string
+        elif target_type == "number":
+            convert = _convert_to_number
+        elif target_type == "integer":
+            convert = _convert_to_integer
+        elif target_type == "boolean":
+            convert = _convert_to_boolean
+        elif target_type == "array":
+            try:
+                item_types = set(subschema.get("items", {}).get("type", set()))
+            except (AttributeError, TypeError):
+                return convert_with_subschema
+            if not item_types.issubset(json_to_python_simple):
+                return _identity
+            convert = _convert_to_array
+        else:
+            return _identity
+
+        if nullable:
+            return lambda original_item: None if original_item is None else convert(original_item)
+        return convert
+
+    def _compile_normalize(self, subschema: Mapping[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """
+        Build the equivalent of `__normalize` for a given subschema or None if values are never modified.
+        """
+        default_convert = (
+            self._compile_default_convert(subschema)
+            if TransformConfig.DefaultSchemaNormalization in self._config
+            else None
+        )
+        if TransformConfig.CustomSchemaNormalization not in self._config:
+            return default_convert
+
+        def normalize(original_item: Any) -> Any:
+            if default_convert:
+                original_item = default_convert(original_item)
+            # the custom normalizer can be registered after the schema was compiled
+            if self._custom_normalizer:
+                original_item = self._custom_normalizer(original_item, subschema)  # type: ignore[arg-type]
+            return original_item
+
+        return normalize
+
+    def _log_type_error(
+        self, instance: Any, types: Any, schema: Mapping[str, Any], path: _Path
+    ) -> None:
+        reprs = ", ".join(repr(type) for type in ([types] if isinstance(types, str) else types))
+        error = ValidationError(
+            f"{instance!r} is not of type {reprs}",
+            validator="type",
+            validator_value=types,
+            instance=instance,
+            schema=schema,
+            path=_to_path_elements(path),
+        )
+        logger.warning(self.get_error_message(error))
+
     def get_error_message(self, e: ValidationError) -> str:
         """
         Construct a sanitized error message from a ValidationError instance.
@@ -275,3 +515,138 @@ class TypeTransformer:
 
         else:
             return python_to_json[type(input_data)]
+
+
+class _SchemaCompiler:
+    """
+    Compile a schema in the plan of steps the jsonschema traversal of `TypeTransformer._normalizer` would run on every
+    record. References are resolved once using the same resolver as the validator.
+    """
+
+    def __init__(self, transformer: TypeTransformer, root_schema: Mapping[str, Any]) -> None:
+        # References that can't be resolved only fail the records that have a value for them, as with the validator
+        self._transformer = transformer
+        self._root_schema = root_schema
+        self._resolver = RefResolver.from_schema(root_schema)  # type: ignore[arg-type]
+        self._compiled: Dict[int, _CompiledSchema] = {}
+
+    def compile(self, schema: Any) -> _CompiledSchema:
+        if not isinstance(schema, Mapping):
+            raise _UnsupportedSchemaError()
+        # subschemas referenced many times, including recursively, are compiled once
+        if id(schema) in self._compiled:
+            return self._compiled[id(schema)]
+        if schema is not self._root_schema and "$id" in schema:
+            raise _UnsupportedSchemaError()
+
+        compiled_schema = _CompiledSchema()
+        self._compiled[id(schema)] = compiled_schema
+        for key, value in schema.items():
+            if key == "type":
+                compiled_schema.steps.append(self._compile_type(value, schema))
+            elif key == "properties":
+                compiled_schema.steps.append(self._compile_properties(value))
+            elif key == "items":
+                compiled_schema.steps.append(self._compile_items(value))
+            elif key == "$ref":
+                compiled_schema.steps.append(self._compile_ref(value))
+        return compiled_schema
+
+    def _resolve(self, reference: Any) -> Mapping[str, Any]:
+        if not isinstance(reference, str) or not reference.startswith("#"):
+            raise _UnsupportedSchemaError()
+        _, resolved = self._resolver.resolve(reference)
+        if not isinstance(resolved, Mapping):
+            raise _UnsupportedSchemaError()
+        return resolved  # type: ignore[no-any-return]
+
+    def _resolve_for_normalization(self, subschema: Any) -> Mapping[str, Any]:
+        if not isinstance(subschema, Mapping):
+            raise _UnsupportedSchemaError()
+        # as `resolve` in `TypeTransformer.__get_normalizer`, only the first reference is followed
+        if "$ref" in subschema:
+            return self._resolve(subschema["$ref"])
+        return subschema
+
+    def _compile_normalize(self, subschema: Any) -> Optional[Callable[[Any], Any]]:
+        try:
+            resolved_subschema = self._resolve_for_normalization(subschema)
+        except RefResolutionError as error:
+            return _raise_when_called(error)
+        return self._transformer._compile_normalize(resolved_subschema)
+
+    def _compile_type(self, types: Any, schema: Mapping[str, Any]) -> Callable[[Any, _Path], None]:
+        type_names = [types] if isinstance(types, str) else types
+        if not isinstance(type_names, list) or not all(
+            isinstance(type_name, str) and type_name in _ALWAYS_VALID_PYTHON_TYPES
+            for type_name in type_names
+        ):
+            raise _UnsupportedSchemaError()
+        always_valid_python_types = frozenset(
+            python_type
+            for type_name in type_names
+            for python_type in _ALWAYS_VALID_PYTHON_TYPES[type_name]
+        )
+        log_type_error = self._transformer._log_type_error
+
+        def check_type(instance: Any, path: _Path) -> None:
+            if type(instance) in always_valid_python_types:
+                return
+            if not any(_TYPE_CHECKER.is_type(instance, type_name) for type_name in type_names):
+                log_type_error(instance, types, schema, path)
+
+        return check_type
+
+    def _compile_properties(self, properties: Any) -> Callable[[Any, _Path], None]:
+        if not isinstance(properties, Mapping):
+            raise _UnsupportedSchemaError()
+        compiled_properties = [
+            (
+                name,
+                self._compile_normalize(subschema),
+                self.compile(subschema),
+            )
+            for name, subschema in properties.items()
+        ]
+        to_normalize = [
+            (name, normalize) for name, normalize, _ in compiled_properties if normalize
+        ]
+
+        def normalize_properties(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, normalize in to_normalize:
+                if name in instance:
+                    instance[name] = normalize(instance[name])
+            for name, _, compiled_property in compiled_properties:
+                if compiled_property.steps and name in instance:
+                    compiled_property.apply(instance[name], (path, name))
+
+        return normalize_properties
+
+    def _compile_items(self, items: Any) -> Callable[[Any, _Path], None]:
+        normalize = self._compile_normalize(items)
+        compiled_items = self.compile(items)
+
+        def normalize_items(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, list):
+                return
+            if normalize:
+                for index, item in enumerate(instance):
+                    instance[index] = normalize(item)
+            if compiled_items.steps:
+                for index, item in enumerate(instance):
+                    compiled_items.apply(item, (path, index))
+
+        return normalize_items
+
+    def _compile_ref(self, reference: Any) -> Callable[[Any, _Path], None]:
+        try:
+            compiled_reference = self.compile(self._resolve(reference))
+        except RefResolutionError as error:
+            return _raise_when_called(error)
+
+        def follow_reference(instance: Any, path: _Path) -> None:
+            compiled_reference.apply(instance, path)
+
+        return follow_reference
@@ -3,3 +3,4 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_BUFFERED_OUTPUT = "AIRBYTE_BUFFERED_OUTPUT"
@@ -81,10 +81,11 @@ assert not ab_datetime_try_parse("foo")                    # Invalid: not parsab
 ```
 """
 
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union, overload
 
-from dateutil import parser
+from dateutil import parser, tz
 from typing_extensions import Never
 from whenever import Instant, LocalDateTime, ZonedDateTime
 
@@ -358,6 +359,48 @@ def ab_datetime_now() -> AirbyteDateTime:
     return AirbyteDateTime.from_datetime(datetime.now(timezone.utc))
 
 
+# Layout of the RFC3339 strings most APIs return. Fractions longer than microseconds are truncated like dateutil does.
+_RFC3339_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(Z|[+-]\d{2}:\d{2})?"
+)
+
+
+def _parse_rfc3339(dt_str: str) -> Optional[AirbyteDateTime]:
+    """Parses the common RFC3339 layouts without going through `dateutil.parser.parse()`.
+
+    The result is equal to the one of the generic path, with the same offset and timezone name. None is returned if the
+    string does not have one of these layouts or does not represent a valid datetime so that the generic path handles it.
+    """
+    match = _RFC3339_DATETIME.fullmatch(dt_str)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    if offset is None:
+        tzinfo: Any = timezone.utc
+    elif offset == "Z":
+        tzinfo = tz.UTC
+    elif int(offset[1:3]) > 23:
+        return None
+    else:
+        offset_seconds = int(offset[1:3]) * 3600 + int(offset[4:6]) * 60
+        if offset[0] == "-":
+            offset_seconds = -offset_seconds
+        tzinfo = tz.UTC if offset_seconds == 0 else tz.tzoffset(None, offset_seconds)
+    try:
+        return AirbyteDateTime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo,
+        )
+    except ValueError:
+        return None
+
+
 def ab_datetime_parse(dt_str: str | int) -> AirbyteDateTime:
     """Parses a datetime string or timestamp into an AirbyteDateTime with timezone awareness.
 
@@ -408,6 +451,11 @@ def ab_datetime_parse(dt_str: str | int) -> AirbyteDateTime:
                 f"Could not parse datetime string: expected string or integer, got {type(dt_str)}"
             )
 
+        # Most values are RFC3339 strings that can be parsed without dateutil
+        rfc3339_datetime = _parse_rfc3339(dt_str)
+        if rfc3339_datetime is not None:
+            return rfc3339_datetime
+
         # Handle date-only format first
         if ":" not in dt_str and dt_str.count("-") == 2 and "/" not in dt_str:
             try:
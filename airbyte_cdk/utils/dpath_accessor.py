@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from typing import Any, List, Mapping, Optional, Sequence, Union
+
+import dpath
+
+_NO_DEFAULT = object()
+_MISSING = object()
+_GLOB_CHARACTERS = ("*", "?", "[", "]")
+
+
+class _Segment:
+    """
+    A path segment matching a mapping key and/or a sequence index the way `dpath.segments.match` does: a segment that
+    can be converted to an int matches list indices (negative ones included) and integer keys as well as the string key.
+    """
+
+    __slots__ = ("key", "index")
+
+    def __init__(self, key: Optional[str], index: Optional[int]) -> None:
+        self.key = key
+        self.index = index
+
+    def child(self, node: Any) -> Any:
+        if isinstance(node, Mapping):
+            if self.key is not None and self.key in node:
+                return node[self.key]
+            if self.index is not None and self.index in node:
+                return node[self.index]
+        elif isinstance(node, (list, tuple)) and self.index is not None:
+            if -len(node) <= self.index < len(node):
+                return node[self.index]
+        return _MISSING
+
+    def children(self, node: Any) -> List[Any]:
+        child = self.child(node)
+        return [] if child is _MISSING else [child]
+
+
+class _WildcardSegment:
+    __slots__ = ()
+
+    def children(self, node: Any) -> List[Any]:
+        if isinstance(node, Mapping):
+            return list(node.values())
+        if isinstance(node, (list, tuple)):
+            return list(node)
+        return []
+
+
+def _compile_segment(segment: Any) -> Union[_Segment, _WildcardSegment, None]:
+    if type(segment) is int:
+        return _Segment(None, segment)
+    if type(segment) is not str:
+        return None
+    if segment == "*":
+        return _WildcardSegment()
+    if any(character in segment for character in _GLOB_CHARACTERS):
+        return None
+    try:
+        return _Segment(segment, int(segment))
+    except ValueError:
+        return _Segment(segment, None)
+
+
+class DpathAccessor:
+    """
+    Path compiled once into a chain of key and index lookups that can be applied to many documents.
+
+    `dpath.get` and `dpath.values` walk the whole document and glob-match every path they find against the requested
+    one which is expensive when the same path is applied to every response or record. The accessor gives the same
+    results for JSON-like documents by looking up each segment directly, fanning out on `*` segments. Paths with other
+    glob patterns (`**`, `?`, `[...]`, partial `*`) or segments that are neither strings nor integers are delegated to
+    dpath.
+
+    As with dpath, a string path is split on `/` and a list path is used as is.
+    """
+
+    def __init__(self, path: Union[str, Sequence[Any]]) -> None:
+        self.path = path
+        self._segments: Optional[List[Union[_Segment, _WildcardSegment]]] = None
+        self._has_wildcard = False
+
+        segments = path.lstrip("/").split("/") if isinstance(path, str) else path
+        compiled_segments = [_compile_segment(segment) for segment in segments]
+        if all(segment is not None for segment in compiled_segments):
+            self._segments = compiled_segments  # type: ignore[assignment]  # None segments are filtered above
+            self._has_wildcard = any(
+                isinstance(segment, _WildcardSegment) for segment in compiled_segments
+            )
+
+    def get(self, obj: Any, default: Any = _NO_DEFAULT) -> Any:
+        """
+        Equivalent of `dpath.get(obj, path, default=default)`: return the only value matching the path, the default if
+        no value matches or raise KeyError if there is no default. ValueError is raised if many values match.
+        """
+        if (isinstance(self.path, str) and self.path == "/") or len(self.path) == 0:
+            return obj
+        if self._segments is None:
+            if default is _NO_DEFAULT:
+                return dpath.get(obj, self.path)  # type: ignore[arg-type]  # path is a dpath glob
+            return dpath.get(obj, self.path, default=default)  # type: ignore[arg-type]  # path is a dpath glob
+
+        if self._has_wildcard:
+            matches = self._find_all(obj)
+            if len(matches) > 1:
+                raise ValueError(f"dpath.get() globs must match only one leaf: {self.path}")
+            value = matches[0] if matches else _MISSING
+        else:
+            value = obj
+            for segment in self._segments:
+                value = segment.child(value)  # type: ignore[union-attr]  # there are no wildcards
+                if value is _MISSING:
+                    break
+
+        if value is _MISSING:
+            if default is _NO_DEFAULT:
+                raise KeyError(self.path)
+            return default
+        return value
+
+    def values(self, obj: Any) -> List[Any]:
+        """
+        Equivalent of `dpath.values(obj, path)`: return all the values matching the path.
+        """
+        if self._segments is None:
+            return dpath.values(obj, self.path)  # type: ignore[arg-type, no-any-return]  # path is a dpath glob
+        if len(self._segments) == 0:
+            return []
+        return self._find_all(obj)
+
+    def _find_all(self, obj: Any) -> List[Any]:
+        nodes = [obj]
+        for segment in self._segments:  # type: ignore[union-attr]  # only called on compiled paths
+            nodes = [child for node in nodes for child in segment.children(node)]
+            if not nodes:
+                break
+        return nodes
@@ -2,11 +2,12 @@
 
 import sys
 import time
-from io import StringIO
 from threading import RLock
 from types import TracebackType
 from typing import Optional
 
+DEFAULT_MAX_BUFFER_SIZE = 1024 * 1024
+
 
 class PrintBuffer:
     """
@@ -17,9 +18,13 @@ class PrintBuffer:
     scenarios where you want to minimize the number of I/O operations by grouping
     multiple print statements together and flushing them as a single operation.
 
+    Text written through `write` and pre-serialized lines written through `write_line` share the same
+    byte buffer so that the order in which they were written is the order in which they reach stdout.
+
     Attributes:
-        buffer (StringIO): A buffer to store the messages before flushing.
+        buffer (bytearray): A buffer to store the encoded messages before flushing.
         flush_interval (float): The time interval (in seconds) after which the buffer is flushed.
+        max_buffer_size (int): The number of buffered bytes after which the buffer is flushed regardless of the interval.
         last_flush_time (float): The last time the buffer was flushed.
         lock (RLock): A reentrant lock to ensure thread-safe operations.
 
@@ -27,6 +32,10 @@ class PrintBuffer:
         write(message: str) -> None:
             Writes a message to the buffer and flushes if the interval has passed.
 
+        write_line(line: bytes, flush: bool = False) -> None:
+            Writes an already serialized line to the buffer, followed by a line break. Flushes if requested, if
+            the interval has passed or if the buffer exceeds `max_buffer_size`.
+
         flush() -> None:
             Flushes the buffer content to the standard output.
 
@@ -37,25 +46,48 @@ class PrintBuffer:
             Exits the runtime context and restores the original stdout and stderr.
     """
 
-    def __init__(self, flush_interval: float = 0.1):
-        self.buffer = StringIO()
+    def __init__(self, flush_interval: float = 0.1, max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE):
+        self.buffer = bytearray()
         self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
         self.last_flush_time = time.monotonic()
         self.lock = RLock()
 
     def write(self, message: str) -> None:
         with self.lock:
-            self.buffer.write(message)
-            current_time = time.monotonic()
-            if (current_time - self.last_flush_time) >= self.flush_interval:
-                self.flush()
-                self.last_flush_time = current_time
+            self.buffer += message.encode()
+            self._flush_if_needed(force=False)
+
+    def write_line(self, line: bytes, flush: bool = False) -> None:
+        with self.lock:
+            self.buffer += line
+            self.buffer += b"\n"
+            self._flush_if_needed(force=flush)
 
     def flush(self) -> None:
         with self.lock:
-            combined_message = self.buffer.getvalue()
-            sys.__stdout__.write(combined_message)  # type: ignore[union-attr]
-            self.buffer = StringIO()
+            if not self.buffer:
+                return
+            stdout = sys.__stdout__
+            binary_stdout = getattr(stdout, "buffer", None)
+            if binary_stdout is None:
+                stdout.write(self.buffer.decode())  # type: ignore[union-attr]
+            else:
+                # anything written to the text layer directly needs to go out before our bytes
+                stdout.flush()  # type: ignore[union-attr]
+                binary_stdout.write(self.buffer)
+                binary_stdout.flush()
+            self.buffer = bytearray()
+
+    def _flush_if_needed(self, force: bool) -> None:
+        current_time = time.monotonic()
+        if (
+            force
+            or len(self.buffer) >= self.max_buffer_size
+            or (current_time - self.last_flush_time) >= self.flush_interval
+        ):
+            self.flush()
+            self.last_flush_time = current_time
 
     def __enter__(self) -> "PrintBuffer":
         self.old_stdout, self.old_stderr = sys.stdout, sys.stderr
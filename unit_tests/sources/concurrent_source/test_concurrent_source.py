@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import itertools
+from queue import Queue
+from unittest.mock import Mock, call, patch
+
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import (
+    MemoryBoundedQueue,
+    estimate_size_in_bytes,
+)
+from airbyte_cdk.sources.types import Record
+
+_A_STREAM_NAME = "a_stream"
+
+
+def _concurrent_stream_processor(number_of_items: int) -> Mock:
+    concurrent_stream_processor = Mock()
+    concurrent_stream_processor.on_record.return_value = []
+    concurrent_stream_processor.is_done.side_effect = [False] * (number_of_items - 1) + [True]
+    return concurrent_stream_processor
+
+
+def test_given_memory_bounded_queue_when_consume_from_queue_then_log_metrics_periodically():
+    logger = Mock()
+    concurrent_source = ConcurrentSource(Mock(), logger)
+    queue = MemoryBoundedQueue(max_size_in_bytes=10_000_000)
+    for i in range(3):
+        queue.put(Record(data={"id": i}, stream_name=_A_STREAM_NAME))
+    record_size = estimate_size_in_bytes({"id": 0})
+
+    # the clock moves by 31 seconds per record so the 60 seconds interval elapses once, after the second record
+    with patch(
+        "airbyte_cdk.sources.concurrent_source.concurrent_source.time.monotonic",
+        side_effect=itertools.count(0, 31),
+    ):
+        list(concurrent_source._consume_from_queue(queue, _concurrent_stream_processor(3)))
+
+    assert logger.info.call_args_list == [
+        call(
+            "Record queue metrics: {'number_of_items': 1, 'size_in_bytes': %d, 'max_number_of_items': 3, 'max_size_in_bytes': %d, 'number_of_blocked_puts': 0}"
+            % (record_size, 3 * record_size)
+        )
+    ]
+
+
+def test_given_queue_bounded_by_number_of_items_when_consume_from_queue_then_do_not_log_metrics():
+    logger = Mock()
+    concurrent_source = ConcurrentSource(Mock(), logger)
+    queue: Queue = Queue()
+    for i in range(3):
+        queue.put(Record(data={"id": i}, stream_name=_A_STREAM_NAME))
+
+    with patch(
+        "airbyte_cdk.sources.concurrent_source.concurrent_source.time.monotonic",
+        side_effect=itertools.count(0, 31),
+    ):
+        list(concurrent_source._consume_from_queue(queue, _concurrent_stream_processor(3)))
+
+    logger.info.assert_not_called()
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import threading
+from queue import Full
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.concurrent_source.memory_bounded_queue import (
+    MemoryBoundedQueue,
+    estimate_size_in_bytes,
+)
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
+from airbyte_cdk.sources.types import Record
+
+_A_STREAM_NAME = "a_stream"
+
+
+def _record(data):
+    return Record(data=data, stream_name=_A_STREAM_NAME)
+
+
+def test_estimate_size_in_bytes_grows_with_nested_values():
+    assert estimate_size_in_bytes({"id": 1, "nested": {"values": ["a" * 1000]}}) > 1000
+
+
+def test_given_queue_has_record_bytes_when_put_record_exceeding_limit_then_raise_full():
+    record = _record({"value": "a" * 1000})
+    queue = MemoryBoundedQueue(max_size_in_bytes=estimate_size_in_bytes(record.data) + 10)
+    queue.put(record)
+
+    with pytest.raises(Full):
+        queue.put(_record({"value": "a" * 1000}), block=False)
+
+
+def test_given_empty_queue_when_put_record_bigger_than_limit_then_accept_it():
+    queue = MemoryBoundedQueue(max_size_in_bytes=1)
+
+    queue.put(_record({"value": "a" * 1000}), block=False)
+
+    assert queue.qsize() == 1
+
+
+def test_given_queue_is_full_when_put_sentinel_then_accept_it():
+    queue = MemoryBoundedQueue(max_size_in_bytes=1)
+    queue.put(_record({"value": "a" * 1000}))
+
+    queue.put(PartitionCompleteSentinel(Mock()), block=False)
+
+    assert queue.qsize() == 2
+
+
+def test_when_get_then_release_bytes_and_unblock_producers():
+    first_record = _record({"value": "a" * 1000})
+    second_record = _record({"value": "b" * 1000})
+    queue = MemoryBoundedQueue(max_size_in_bytes=estimate_size_in_bytes(first_record.data) + 10)
+    queue.put(first_record)
+    producer = threading.Thread(target=queue.put, args=(second_record,))
+    producer.start()
+
+    assert queue.get() is first_record
+    producer.join(timeout=5)
+
+    assert not producer.is_alive()
+    assert queue.get() is second_record
+    assert queue.metrics()["size_in_bytes"] == 0
+    assert queue.metrics()["number_of_blocked_puts"] == 1
+
+
+def test_metrics_keep_track_of_the_maximum_depth():
+    queue = MemoryBoundedQueue(max_size_in_bytes=10_000_000)
+    records = [_record({"id": i}) for i in range(3)]
+    for record in records:
+        queue.put(record)
+    for _ in records:
+        queue.get()
+
+    metrics = queue.metrics()
+    assert metrics["number_of_items"] == 0
+    assert metrics["max_number_of_items"] == 3
+    assert metrics["max_size_in_bytes"] == sum(estimate_size_in_bytes(r.data) for r in records)
+
+
+def test_given_maxsize_when_put_sentinel_on_full_queue_then_raise_full():
+    queue = MemoryBoundedQueue(max_size_in_bytes=10_000_000, maxsize=1)
+    queue.put(PartitionCompleteSentinel(Mock()))
+
+    with pytest.raises(Full):
+        queue.put(PartitionCompleteSentinel(Mock()), block=False)
+
+
+def test_given_record_batch_when_put_then_weigh_every_record():
+    records = [_record({"id": i}) for i in range(3)]
+    queue = MemoryBoundedQueue(max_size_in_bytes=10_000_000)
+
+    queue.put(records)
+
+    assert queue.metrics()["size_in_bytes"] == sum(estimate_size_in_bytes(r.data) for r in records)
@@ -92,3 +92,49 @@ def test_max_concurrency_is_required_for_default_concurrency_using_config() -> N
             config=config,
             parameters={},
         )
+
+
+@pytest.mark.parametrize(
+    "max_queue_size_in_bytes, config, expected_max_queue_size_in_bytes",
+    [
+        pytest.param(1024, {}, 1024, id="test_max_queue_size_in_bytes_as_int"),
+        pytest.param(None, {}, None, id="test_max_queue_size_in_bytes_not_set"),
+        pytest.param(
+            "{{ config['max_queue_size_in_bytes'] }}",
+            {"max_queue_size_in_bytes": "2048"},
+            2048,
+            id="test_max_queue_size_in_bytes_using_interpolation",
+        ),
+        pytest.param(
+            "{{ config.get('max_queue_size_in_bytes') }}",
+            {},
+            None,
+            id="test_max_queue_size_in_bytes_using_interpolation_no_value",
+        ),
+    ],
+)
+def test_max_queue_size_in_bytes(
+    max_queue_size_in_bytes: Optional[Union[int, str]],
+    config: Mapping[str, Any],
+    expected_max_queue_size_in_bytes: Optional[int],
+) -> None:
+    concurrency_level = ConcurrencyLevel(
+        default_concurrency=10,
+        max_concurrency=None,
+        config=config,
+        parameters={},
+        max_queue_size_in_bytes=max_queue_size_in_bytes,
+    )
+
+    assert concurrency_level.get_max_queue_size_in_bytes() == expected_max_queue_size_in_bytes
+
+
+def test_given_max_queue_size_in_bytes_not_evaluating_to_an_integer_then_raise_error() -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyLevel(
+            default_concurrency=10,
+            max_concurrency=None,
+            config={"max_queue_size_in_bytes": "one megabyte"},
+            parameters={},
+            max_queue_size_in_bytes="{{ config['max_queue_size_in_bytes'] }}",
+        )
@@ -3,6 +3,7 @@
 #
 
 import datetime
+import re
 
 import pytest
 
@@ -125,3 +126,54 @@ def test_format_datetime(input_dt: datetime.datetime, datetimeformat: str, expec
     parser = DatetimeParser()
     output_date = parser.format(input_dt, datetimeformat)
     assert output_date == expected_output
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-01-01T00:00:00.123Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+        ("2021-1-1t0:0:0z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-01-01T00:00:00-04:30", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:00+01:00:30.5", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01    00:00", "%Y-%m-%d %H:%M"),
+        (" 1/12/2021", "%d/%m/%Y"),
+        ("100% 2021", "100%% %Y"),
+    ],
+)
+def test_parse_compiled_format_matches_strptime(input_date: str, date_format: str):
+    expected_output_date = datetime.datetime.strptime(input_date, date_format)
+    if expected_output_date.tzinfo is None:
+        expected_output_date = expected_output_date.replace(tzinfo=datetime.timezone.utc)
+
+    output_date = DatetimeParser().parse(input_date, date_format)
+
+    assert output_date == expected_output_date
+    assert output_date.tzinfo == expected_output_date.tzinfo
+
+
+@pytest.mark.parametrize(
+    "input_date, date_format",
+    [
+        ("2021-01-01", "%Y-%m-%dT%H:%M:%S"),
+        ("2021-01-01T00:00:00.1234567", "%Y-%m-%dT%H:%M:%S.%f"),
+        ("2021-02-30", "%Y-%m-%d"),
+        ("2021-13-01", "%Y-%m-%d"),
+        ("2021-01-01T00:00:00+01:0030", "%Y-%m-%dT%H:%M:%S%z"),
+        ("2021-01-01T00:00:61", "%Y-%m-%dT%H:%M:%S"),
+    ],
+)
+def test_parse_compiled_format_raises_like_strptime(input_date: str, date_format: str):
+    with pytest.raises(ValueError) as expected_error:
+        datetime.datetime.strptime(input_date, date_format)
+
+    with pytest.raises(ValueError, match=re.escape(str(expected_error.value))):
+        DatetimeParser().parse(input_date, date_format)
+
+
+def test_parse_format_with_other_directives_uses_strptime():
+    output_date = DatetimeParser().parse(
+        "Mon, 01 Feb 2021 10:00:00 GMT", "%a, %d %b %Y %H:%M:%S %Z"
+    )
+
+    assert output_date == datetime.datetime(2021, 2, 1, 10, tzinfo=datetime.timezone.utc)
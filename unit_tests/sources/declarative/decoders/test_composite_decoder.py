@@ -4,9 +4,11 @@
 import csv
 import gzip
 import json
+import math
 import socket
+import time
 from http.server import BaseHTTPRequestHandler, HTTPServer
-from io import BytesIO, StringIO
+from io import BytesIO, RawIOBase, StringIO
 from threading import Thread
 from typing import ClassVar, Iterable
 from unittest.mock import Mock, patch
@@ -20,6 +22,10 @@ from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
     GzipParser,
     JsonLineParser,
     JsonParser,
+    _IncrementalJsonReader,
+)
+from airbyte_cdk.sources.declarative.decoders.decoded_response_cache import (
+    invalidate_decoded_bodies,
 )
 from airbyte_cdk.utils import AirbyteTracedException
 
@@ -180,6 +186,143 @@ def test_composite_raw_decoder_jsonline_parser(requests_mock, encoding: str):
     assert counter == 3
 
 
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_jsonline_parser_splits_lines_across_chunks(chunk_size, monkeypatch):
+    monkeypatch.setattr(JsonLineParser, "CHUNK_SIZE", chunk_size)
+    raw_data = b'{"id": 1, "name": "caf\xc3\xa9"}\n[1, 2]\r\n\n{"id": 3}'
+
+    assert list(JsonLineParser().parse(BytesIO(raw_data))) == [
+        {"id": 1, "name": "caf\u00e9"},
+        [1, 2],
+        {"id": 3},
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_jsonline_parser_falls_back_on_json_library(chunk_size, monkeypatch):
+    monkeypatch.setattr(JsonLineParser, "CHUNK_SIZE", chunk_size)
+    raw_data = (
+        b'{"big_integer": 123456789012345678901234567890, "string": "1234567890123456789012"}\n'
+        b'{"value": NaN}\n'
+        b'{"id": 1}\n'
+    )
+
+    records = list(JsonLineParser().parse(BytesIO(raw_data)))
+
+    assert records[0] == {
+        "big_integer": 123456789012345678901234567890,
+        "string": "1234567890123456789012",
+    }
+    assert math.isnan(records[1]["value"])
+    assert records[2] == {"id": 1}
+
+
+def test_jsonline_parser_skips_invalid_lines(caplog):
+    raw_data = b'{"id": 1}\nnot json\n{"id": 2}\n'
+
+    assert list(JsonLineParser().parse(BytesIO(raw_data))) == [{"id": 1}, {"id": 2}]
+    assert "Cannot decode/parse line b'not json' as JSON" in caplog.text
+
+
+class _RepeatedGzipMember(RawIOBase):
+    """
+    Concatenated gzip members decompress to the concatenation of their content which allows to build a large input
+    without compressing all of it.
+    """
+
+    def __init__(self, member: bytes, repetitions: int) -> None:
+        self._member = member
+        self._remaining_repetitions = repetitions
+        self._position = len(member)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._position == len(self._member):
+            if self._remaining_repetitions == 0:
+                return 0
+            self._remaining_repetitions -= 1
+            self._position = 0
+        size = min(len(buffer), len(self._member) - self._position)
+        buffer[:size] = self._member[self._position : self._position + size]
+        self._position += size
+        return size
+
+
+def _parse_jsonlines_with_json_library(data) -> Iterable:
+    for line in data:
+        try:
+            yield json.loads(line.decode("utf-8"))
+        except json.JSONDecodeError:
+            pass
+
+
+@pytest.mark.slow
+def test_gzip_jsonline_parser_benchmark():
+    """
+    Reports the throughput of GzipParser(JsonLineParser) and of parsing line by line with the json library. Timings vary
+    too much between machines to be asserted on.
+    """
+    lines_per_member = 100_000
+    member_content = b"".join(
+        json.dumps(
+            {
+                "id": i,
+                "email": f"user{i}@example.com",
+                "created_at": "2025-01-01T00:00:00Z",
+                "score": i / 7,
+                "tags": ["a", "b"],
+                "address": {"city": "Montreal", "country": "CA"},
+            }
+        ).encode()
+        + b"\n"
+        for i in range(lines_per_member)
+    )
+    member = gzip.compress(member_content, compresslevel=1)
+    repetitions = 2 * 1024**3 // len(member_content)  # ≈ 2 GB once decompressed
+
+    start = time.perf_counter()
+    number_of_records = sum(
+        1
+        for _ in GzipParser(inner_parser=JsonLineParser()).parse(
+            _RepeatedGzipMember(member, repetitions)
+        )
+    )
+    duration = time.perf_counter() - start
+
+    # the baseline parses a sample of the input line by line with the json library
+    baseline_repetitions = max(1, repetitions // 20)
+    start = time.perf_counter()
+    with gzip.GzipFile(fileobj=_RepeatedGzipMember(member, baseline_repetitions)) as data:
+        number_of_baseline_records = sum(1 for _ in _parse_jsonlines_with_json_library(data))
+    baseline_duration = time.perf_counter() - start
+
+    throughput = repetitions * len(member_content) / duration / 1024**2
+    baseline_throughput = baseline_repetitions * len(member_content) / baseline_duration / 1024**2
+    print(
+        f"GzipParser(JsonLineParser): {throughput:.1f} MiB/s, json library line by line: {baseline_throughput:.1f} MiB/s"
+    )
+    assert number_of_records == repetitions * lines_per_member
+    assert number_of_baseline_records == baseline_repetitions * lines_per_member
+
+
+def test_gzip_jsonline_parser_parses_concatenated_gzip_members():
+    member_content = b"".join(
+        json.dumps({"id": i, "address": {"city": "Montreal"}}).encode() + b"\n"
+        if i % 10
+        else b"not json\n"
+        for i in range(1000)
+    )
+    member = gzip.compress(member_content, compresslevel=1)
+
+    records = list(GzipParser(inner_parser=JsonLineParser()).parse(_RepeatedGzipMember(member, 3)))
+
+    with gzip.GzipFile(fileobj=_RepeatedGzipMember(member, 3)) as data:
+        assert records == list(_parse_jsonlines_with_json_library(data))
+    assert len(records) == 3 * 900
+
+
 @pytest.mark.parametrize(
     "test_data",
     [
@@ -323,3 +466,181 @@ def test_given_response_is_not_streamed_when_decode_then_can_be_called_multiple_
     content_second_time = list(composite_raw_decoder.decode(response))
 
     assert content == content_second_time
+
+
+def test_given_response_is_not_streamed_when_decode_multiple_times_then_body_is_parsed_once(
+    requests_mock,
+):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", content=json.dumps([{"id": 1}, {"id": 2}]).encode()
+    )
+    response = requests.get("https://airbyte.io/")
+    composite_raw_decoder = CompositeRawDecoder(
+        parser=JsonParser(encoding="utf-8"),
+        stream_response=False,
+    )
+
+    content = list(composite_raw_decoder.decode(response))
+    with patch("orjson.loads") as orjson_loads:
+        content_second_time = list(composite_raw_decoder.decode(response))
+
+    orjson_loads.assert_not_called()
+    assert all(first is second for first, second in zip(content, content_second_time))
+
+
+def test_given_other_decoder_when_decode_then_body_is_parsed_again(requests_mock):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", content=json.dumps({"test": "test"}).encode()
+    )
+    response = requests.get("https://airbyte.io/")
+
+    content = next(CompositeRawDecoder(parser=JsonParser(), stream_response=False).decode(response))
+    other_content = next(
+        CompositeRawDecoder(parser=JsonParser(), stream_response=False).decode(response)
+    )
+
+    assert other_content == content
+    assert other_content is not content
+
+
+def test_given_decoded_bodies_invalidated_when_decode_then_body_is_parsed_again(requests_mock):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", content=json.dumps({"test": "test"}).encode()
+    )
+    response = requests.get("https://airbyte.io/")
+    composite_raw_decoder = CompositeRawDecoder(parser=JsonParser(), stream_response=False)
+    content = next(composite_raw_decoder.decode(response))
+    content["test"] = "modified"
+
+    invalidate_decoded_bodies(response)
+
+    assert next(composite_raw_decoder.decode(response)) == {"test": "test"}
+
+
+_STREAMED_RECORDS = [
+    {"id": 1, "name": 'with "escaped" quotes and [brackets] {braces}'},
+    {"id": 2, "nested": {"list": [1, [2, {"3": None}]], "empty": {}}},
+    {"id": 3, "unicode": "caf\u00e9 \U0001f600", "escaped_unicode": "\\u00e9"},
+    [1, 2],
+    "a string",
+    -1.5e10,
+    True,
+    None,
+]
+
+
+@pytest.mark.parametrize(
+    "document, records_path, expected_records",
+    [
+        pytest.param(_STREAMED_RECORDS, [], _STREAMED_RECORDS, id="array_at_root"),
+        pytest.param(
+            {"meta": {"data": ["not", "these"]}, "data": _STREAMED_RECORDS, "after": [{}]},
+            ["data"],
+            _STREAMED_RECORDS,
+            id="array_at_path",
+        ),
+        pytest.param(
+            {"response": {"count": 8, "items": _STREAMED_RECORDS}},
+            ["response", "items"],
+            _STREAMED_RECORDS,
+            id="array_at_nested_path",
+        ),
+        pytest.param([], [], [], id="empty_array"),
+        pytest.param({"id": 1}, [], [{"id": 1}], id="object_at_root"),
+        pytest.param({"data": {"id": 1}}, ["data"], [{"id": 1}], id="object_at_path"),
+        pytest.param({"other": [1, 2]}, ["data"], [], id="missing_path"),
+        pytest.param([{"data": [1]}], ["data"], [], id="path_in_array"),
+    ],
+)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_streaming_json_parser(document, records_path, expected_records, indent, monkeypatch):
+    # small chunks make sure that values are split across reads
+    monkeypatch.setattr(_IncrementalJsonReader, "CHUNK_SIZE", 3)
+    raw_data = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+
+    parser = JsonParser(streaming=True, records_path=records_path)
+
+    assert list(parser.parse(BytesIO(raw_data))) == expected_records
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "iso-8859-1", "utf-16"])
+def test_streaming_json_parser_encoding(encoding):
+    raw_data = json.dumps({"data": [{"name": "caf\u00e9"}]}, ensure_ascii=False).encode(encoding)
+
+    parser = JsonParser(encoding=encoding, streaming=True, records_path=["data"])
+
+    if encoding == "utf-16":
+        # encodings other than ASCII-compatible ones are parsed as a whole
+        assert list(parser.parse(BytesIO(raw_data))) == [{"data": [{"name": "caf\u00e9"}]}]
+    else:
+        assert list(parser.parse(BytesIO(raw_data))) == [{"name": "caf\u00e9"}]
+
+
+def test_streaming_json_parser_yields_records_before_reading_the_whole_response():
+    class _ControlledStream(BytesIO):
+        def __init__(self, chunks):
+            super().__init__()
+            self._chunks = iter(chunks)
+            self.number_of_reads = 0
+
+        def read(self, size=-1):
+            self.number_of_reads += 1
+            return next(self._chunks, b"")
+
+    data = _ControlledStream([b'{"data": [{"id": 1},', b' {"id": 2}', b"]}"])
+    records = JsonParser(streaming=True, records_path=["data"]).parse(data)
+
+    assert next(records) == {"id": 1}
+    assert data.number_of_reads == 1
+    assert list(records) == [{"id": 2}]
+
+
+def test_streaming_json_parser_does_not_keep_skipped_values_in_memory(monkeypatch):
+    monkeypatch.setattr(_IncrementalJsonReader, "CHUNK_SIZE", 1024)
+    raw_data = json.dumps(
+        {"skipped": [{"value": "x" * 100} for _ in range(1000)], "data": [{"id": 1}]}
+    ).encode()
+    reader_buffers = []
+    original_read_more = _IncrementalJsonReader._read_more
+
+    def _read_more(reader):
+        has_more = original_read_more(reader)
+        reader_buffers.append(len(reader._buffer))
+        return has_more
+
+    monkeypatch.setattr(_IncrementalJsonReader, "_read_more", _read_more)
+
+    records = list(JsonParser(streaming=True, records_path=["data"]).parse(BytesIO(raw_data)))
+
+    assert records == [{"id": 1}]
+    assert max(reader_buffers) < 2 * 1024
+
+
+@pytest.mark.parametrize(
+    "raw_data",
+    [
+        pytest.param(b"", id="empty"),
+        pytest.param(b'[{"id": 1}, {"id": 2', id="truncated_record"),
+        pytest.param(b'[{"id": 1}', id="truncated_array"),
+        pytest.param(b'{"data": [{"id": "1', id="truncated_string"),
+        pytest.param(b'[{"id": 1}, {"id": }]', id="invalid_record"),
+    ],
+)
+def test_streaming_json_parser_raises_traced_exception_on_invalid_json(raw_data):
+    parser = JsonParser(streaming=True, records_path=[])
+
+    with pytest.raises(AirbyteTracedException):
+        list(parser.parse(BytesIO(raw_data)))
+
+
+def test_streaming_json_parser_with_composite_raw_decoder(requests_mock):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", content=json.dumps({"data": [{"id": 1}, {"id": 2}]}).encode()
+    )
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    composite_raw_decoder = CompositeRawDecoder(
+        parser=JsonParser(streaming=True, records_path=["data"]), stream_response=True
+    )
+
+    assert list(composite_raw_decoder.decode(response)) == [{"id": 1}, {"id": 2}]
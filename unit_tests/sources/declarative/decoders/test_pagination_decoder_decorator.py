@@ -22,3 +22,16 @@ def test_pagination_decoder_decorator(requests_mock, decoder_class, expected):
     requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
     response = requests.get("https://airbyte.io/")
     assert next(decoder.decode(response)) == expected
+
+
+def test_given_decoded_by_extractor_decoder_when_decode_for_pagination_then_body_is_not_parsed_again(
+    requests_mock,
+):
+    json_decoder = JsonDecoder(parameters={})
+    decoder = PaginationDecoderDecorator(decoder=json_decoder)
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}]}')
+    response = requests.get("https://airbyte.io/")
+
+    extracted_body = next(json_decoder.decode(response))
+
+    assert next(decoder.decode(response)) is extracted_body
@@ -122,3 +122,37 @@ def test_dpath_extractor(field_path: List, decoder: Decoder, body, expected_reco
     actual_records = list(extractor.extract_records(response))
 
     assert actual_records == expected_records
+
+
+def test_given_field_path_depending_only_on_config_when_extract_records_then_evaluate_path_once(
+    mocker,
+):
+    extractor = DpathExtractor(
+        field_path=["{{ config['field'] }}"], config=config, decoder=decoder_json, parameters={}
+    )
+    eval_spy = mocker.spy(extractor._field_path[0], "eval")
+
+    for _ in range(3):
+        records = list(extractor.extract_records(create_response({"record_array": [{"id": 1}]})))
+        assert records == [{"id": 1}]
+
+    assert eval_spy.call_count == 1
+
+
+def test_given_field_path_using_macros_when_extract_records_then_evaluate_path_on_every_call(
+    mocker,
+):
+    extractor = DpathExtractor(
+        field_path=["{{ 'data' if now_utc() else 'other' }}"],
+        config=config,
+        decoder=decoder_json,
+        parameters={},
+    )
+    eval_spy = mocker.spy(extractor._field_path[0], "eval")
+
+    for _ in range(3):
+        assert list(extractor.extract_records(create_response({"data": [{"id": 1}]}))) == [
+            {"id": 1}
+        ]
+
+    assert eval_spy.call_count == 3
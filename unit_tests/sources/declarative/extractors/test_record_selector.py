@@ -3,8 +3,9 @@
 #
 
 import json
-from unittest.mock import MagicMock, Mock, call
+from unittest.mock import MagicMock, Mock, call, patch
 
+import orjson
 import pytest
 import requests
 
@@ -14,6 +15,7 @@ from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilte
 from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.types import Record, StreamSlice
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
@@ -312,3 +314,176 @@ def test_transform_before_filtering(transform_before_filtering):
     else:
         assert final_record_data[0]["id"] == 2
         assert final_record_data[0]["myfield"] == 999
+
+
+class _RemoveId(RecordTransformation):
+    def transform(self, record, config=None, stream_state=None, stream_slice=None):
+        record.pop("id", None)
+
+
+@pytest.mark.parametrize(
+    "transformations, expected_number_of_parsings",
+    [
+        pytest.param([], 1, id="test_body_is_shared_without_transformations"),
+        pytest.param([_RemoveId()], 2, id="test_body_is_decoded_again_after_transformations"),
+    ],
+)
+def test_given_records_selected_when_decode_response_again_then_body_is_not_modified(
+    transformations, expected_number_of_parsings
+):
+    decoder = JsonDecoder(parameters={})
+    record_selector = RecordSelector(
+        extractor=DpathExtractor(field_path=["data"], decoder=decoder, config={}, parameters={}),
+        transformations=transformations,
+        config={},
+        parameters={},
+        name="test_stream",
+        schema_normalization=TypeTransformer(TransformConfig.NoTransform),
+    )
+    response = create_response({"data": [{"id": 1}, {"id": 2}], "next": "page_2"})
+
+    with patch("orjson.loads", wraps=orjson.loads) as orjson_loads:
+        records = list(
+            record_selector.select_records(
+                response=response, stream_state={}, records_schema=create_schema()
+            )
+        )
+        # e.g. a paginator reading `response.data[-1].id` after the records
+        body = next(decoder.decode(response))
+
+    assert len(records) == 2
+    assert body["data"][-1]["id"] == 2
+    assert orjson_loads.call_count == expected_number_of_parsings
+
+
+@pytest.mark.parametrize(
+    "transformations, schema_transformation, expected_owned, expected_data_is_extracted",
+    [
+        pytest.param(
+            [], TransformConfig.NoTransform, False, True, id="test_records_shared_with_body"
+        ),
+        pytest.param(
+            [],
+            TransformConfig.DefaultSchemaNormalization,
+            True,
+            True,
+            id="test_records_normalized_in_place",
+        ),
+        pytest.param(
+            [_RemoveId()],
+            TransformConfig.NoTransform,
+            True,
+            True,
+            id="test_records_transformed_in_place",
+        ),
+    ],
+)
+def test_select_records_ownership(
+    transformations, schema_transformation, expected_owned, expected_data_is_extracted
+):
+    extracted_records = [{"id": 1, "field_int": "1"}, {"id": 2, "field_int": "2"}]
+    extractor = MagicMock()
+    extractor.extract_records.return_value = extracted_records
+    record_selector = RecordSelector(
+        extractor=extractor,
+        transformations=transformations,
+        config={},
+        parameters={},
+        name="test_stream",
+        schema_normalization=TypeTransformer(schema_transformation),
+    )
+
+    records = list(
+        record_selector.select_records(
+            response=create_response({}), stream_state={}, records_schema=create_schema()
+        )
+    )
+
+    assert [record.owned for record in records] == [expected_owned] * 2
+    assert [record.data is data for record, data in zip(records, extracted_records)] == [
+        expected_data_is_extracted
+    ] * 2
+
+
+def test_given_records_not_owned_when_filter_and_transform_then_normalize_copies():
+    extracted_records = [{"id": 1, "field_int": "1"}]
+    record_selector = RecordSelector(
+        extractor=MagicMock(),
+        config={},
+        parameters={},
+        name="test_stream",
+        schema_normalization=TypeTransformer(TransformConfig.DefaultSchemaNormalization),
+    )
+
+    records = list(
+        record_selector.filter_and_transform(
+            extracted_records, stream_state={}, records_schema=create_schema()
+        )
+    )
+
+    assert records[0].data == {"id": "1", "field_int": 1}
+    assert records[0].owned
+    assert extracted_records == [{"id": 1, "field_int": "1"}]
+
+
+def test_given_owned_records_when_emitting_messages_then_extracted_records_are_not_copied():
+    extracted_records = [{"id": 1, "field_int": "1"}, {"id": 2, "field_int": "2"}]
+    extractor = MagicMock()
+    extractor.extract_records.return_value = extracted_records
+    record_selector = RecordSelector(
+        extractor=extractor,
+        config={},
+        parameters={},
+        name="test_stream",
+        schema_normalization=TypeTransformer(TransformConfig.DefaultSchemaNormalization),
+    )
+
+    messages = [
+        stream_data_to_airbyte_message(record.stream_name, record.data, owned=record.owned)
+        for record in record_selector.select_records(
+            response=create_response({}), stream_state={}, records_schema=create_schema()
+        )
+    ]
+
+    assert [message.record.data for message in messages] == [
+        {"id": "1", "field_int": 1},
+        {"id": "2", "field_int": 2},
+    ]
+    assert [message.record.data is data for message, data in zip(messages, extracted_records)] == [
+        True
+    ] * 2
+
+
+@pytest.fixture(name="large_extracted_records")
+def large_extracted_records_fixture():
+    # the values are shared between records so that copying a record only allocates its dict
+    values = {f"field_{i}": f"value_{i}" for i in range(100)}
+    return [dict(values) for _ in range(20_000)]  # ≈ 100 MB of dicts
+
+
+@pytest.mark.slow
+@pytest.mark.limit_memory("20 MB")
+def test_owned_records_memory_usage(large_extracted_records):
+    extractor = MagicMock()
+    extractor.extract_records.return_value = large_extracted_records
+    record_selector = RecordSelector(
+        extractor=extractor,
+        config={},
+        parameters={},
+        name="test_stream",
+        schema_normalization=TypeTransformer(TransformConfig.DefaultSchemaNormalization),
+    )
+    schema = {
+        "type": "object",
+        "properties": {f"field_{i}": {"type": "string"} for i in range(100)},
+    }
+
+    # the messages are kept so that copies of the records would add up
+    messages = [
+        stream_data_to_airbyte_message(record.stream_name, record.data, owned=record.owned)
+        for record in record_selector.select_records(
+            response=create_response({}), stream_state={}, records_schema=schema
+        )
+    ]
+
+    assert len(messages) == len(large_extracted_records)
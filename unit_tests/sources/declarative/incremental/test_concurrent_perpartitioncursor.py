@@ -3435,8 +3435,12 @@ def test_semaphore_cleanup():
     # Verify initial state
     assert len(cursor._semaphore_per_partition) == 2
     assert len(cursor._partition_parent_state_map) == 2
-    assert cursor._partition_parent_state_map['{"id":"1"}'] == {"parent": {"state": "state1"}}
-    assert cursor._partition_parent_state_map['{"id":"2"}'] == {"parent": {"state": "state2"}}
+    assert cursor._partition_parent_state_map[cursor._to_partition_key({"id": "1"})] == {
+        "parent": {"state": "state1"}
+    }
+    assert cursor._partition_parent_state_map[cursor._to_partition_key({"id": "2"})] == {
+        "parent": {"state": "state2"}
+    }
 
     # Close partitions to acquire semaphores (value back to 0)
     for s in generated_slices:
@@ -3445,12 +3449,133 @@ def test_semaphore_cleanup():
     # Check state after closing partitions
     assert len(cursor._finished_partitions) == 2
     assert len(cursor._semaphore_per_partition) == 0
-    assert '{"id":"1"}' not in cursor._semaphore_per_partition
-    assert '{"id":"2"}' not in cursor._semaphore_per_partition
+    assert cursor._to_partition_key({"id": "1"}) not in cursor._semaphore_per_partition
+    assert cursor._to_partition_key({"id": "2"}) not in cursor._semaphore_per_partition
     assert len(cursor._partition_parent_state_map) == 0  # All parent states should be popped
     assert cursor._parent_state == {"parent": {"state": "state2"}}  # Last parent state
 
 
+def _single_slice_per_partition_cursor(
+    partitions: List[StreamSlice], parent_states: List[Mapping[str, Any]]
+) -> ConcurrentPerPartitionCursor:
+    mock_cursor = MagicMock()
+    mock_cursor.stream_slices.side_effect = lambda: iter([{}])
+    mock_cursor.state = {"updated_at": "2024-01-01T00:00:00Z"}
+    cursor_factory_mock = MagicMock()
+    cursor_factory_mock.create.return_value = mock_cursor
+
+    cursor = ConcurrentPerPartitionCursor(
+        cursor_factory=cursor_factory_mock,
+        partition_router=MagicMock(),
+        stream_name="test_stream",
+        stream_namespace=None,
+        stream_state={},
+        message_repository=MagicMock(),
+        connector_state_manager=MagicMock(),
+        connector_state_converter=MagicMock(),
+        cursor_field=CursorField(cursor_field_key="updated_at"),
+    )
+    cursor._partition_router.stream_slices.return_value = iter(partitions)
+    cursor._partition_router.get_stream_state.side_effect = parent_states
+    return cursor
+
+
+def test_given_partitions_closed_out_of_order_when_close_partition_then_parent_state_waits_for_first_partition():
+    partitions = [StreamSlice(partition={"id": str(i)}, cursor_slice={}) for i in range(1, 4)]
+    cursor = _single_slice_per_partition_cursor(
+        partitions, [{"parent": {"state": f"state{i}"}} for i in range(1, 4)]
+    )
+    generated_slices = list(cursor.stream_slices())
+
+    for s in generated_slices[1:]:
+        cursor.close_partition(DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), s))
+
+    assert cursor._parent_state is None
+    assert len(cursor._semaphore_per_partition) == 3
+
+    cursor.close_partition(
+        DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), generated_slices[0])
+    )
+
+    assert cursor._parent_state == {"parent": {"state": "state3"}}
+    assert len(cursor._semaphore_per_partition) == 0
+    assert len(cursor._partition_parent_state_map) == 0
+
+
+def test_given_duplicated_partition_when_close_partition_then_parent_state_waits_for_duplicated_slices():
+    partitions = [
+        StreamSlice(partition={"id": "1"}, cursor_slice={}),
+        StreamSlice(partition={"id": "2"}, cursor_slice={}),
+        StreamSlice(partition={"id": "2"}, cursor_slice={}),
+        StreamSlice(partition={"id": "3"}, cursor_slice={}),
+    ]
+    parent_states = [{"parent": {"state": "state1"}}] * 3 + [{"parent": {"state": "state2"}}]
+    cursor = _single_slice_per_partition_cursor(partitions, parent_states)
+    slices_iterator = iter(cursor.stream_slices())
+    for _ in range(2):
+        cursor.close_partition(
+            DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), next(slices_iterator))
+        )
+    duplicated_slice = next(slices_iterator)
+    cursor.close_partition(
+        DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), next(slices_iterator))
+    )
+
+    # the parent state of the third partition requires the duplicated slice of the second partition to be closed
+    assert cursor._parent_state == {"parent": {"state": "state1"}}
+
+    cursor.close_partition(
+        DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), duplicated_slice)
+    )
+
+    assert cursor._parent_state == {"parent": {"state": "state2"}}
+
+
+def test_given_partition_closed_when_state_then_partition_state_is_updated():
+    partitions = [StreamSlice(partition={"id": "1"}, cursor_slice={})]
+    cursor = _single_slice_per_partition_cursor(partitions, [{"parent": {"state": "state1"}}])
+    generated_slices = list(cursor.stream_slices())
+    partition_cursor = cursor._cursor_per_partition[cursor._to_partition_key({"id": "1"})]
+
+    assert cursor.state["states"] == [
+        {"partition": {"id": "1"}, "cursor": {"updated_at": "2024-01-01T00:00:00Z"}}
+    ]
+
+    partition_cursor.state = {"updated_at": "2024-01-02T00:00:00Z"}
+    cursor.close_partition(
+        DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), generated_slices[0])
+    )
+
+    assert cursor.state["states"] == [
+        {"partition": {"id": "1"}, "cursor": {"updated_at": "2024-01-02T00:00:00Z"}}
+    ]
+
+
+def test_given_partitions_closed_in_order_when_close_partition_then_finished_partitions_are_untracked():
+    number_of_partitions = 100
+    partitions = [
+        StreamSlice(partition={"id": str(i)}, cursor_slice={}) for i in range(number_of_partitions)
+    ]
+    # the parent state only changes for the last partition so the partitions in between are all tracked
+    parent_states = [{"parent": {"state": "state1"}}] * (number_of_partitions - 1) + [
+        {"parent": {"state": "state2"}}
+    ]
+    cursor = _single_slice_per_partition_cursor(partitions, parent_states)
+    generated_partitions = [
+        DeclarativePartition("test_stream", {}, MagicMock(), MagicMock(), s)
+        for s in cursor.stream_slices()
+    ]
+
+    for partition in generated_partitions:
+        cursor.close_partition(partition)
+
+    assert cursor._parent_state == {"parent": {"state": "state2"}}
+    assert cursor._first_unfinished_sequence == number_of_partitions
+    assert len(cursor._semaphore_per_partition) == 0
+    assert len(cursor._partition_per_sequence) == 0
+    assert len(cursor._partition_parent_state_map) == 0
+
+
 def test_given_global_state_when_read_then_state_is_not_per_partition() -> None:
     manifest = deepcopy(SUBSTREAM_MANIFEST)
     manifest["definitions"]["post_comments_stream"]["incremental_sync"][
@@ -5,6 +5,7 @@
 import pytest
 
 from airbyte_cdk.sources.declarative.interpolation.interpolated_boolean import InterpolatedBoolean
+from airbyte_cdk.sources.types import StreamSlice
 
 config = {
     "parent": {"key_with_true": True},
@@ -49,3 +50,60 @@ def test_interpolated_boolean(test_name, template, expected_result):
         condition=template, parameters={"from_parameters": "come_find_me"}
     )
     assert interpolated_bool.eval(config) == expected_result
+
+
+@pytest.mark.parametrize(
+    "template, record",
+    [
+        pytest.param(
+            "{{ record['updated_at'] >= stream_interval['start_time'] }}",
+            {"updated_at": "2024-01-02"},
+            id="comparison_with_alias",
+        ),
+        pytest.param(
+            "{{ record['updated_at'] >= stream_interval['start_time'] }}",
+            {},
+            id="comparison_with_undefined_value",
+        ),
+        pytest.param(
+            "{{ record['updated_at'] >= stream_interval['start_time'] }}",
+            {"updated_at": 1},
+            id="comparison_raising_type_error",
+        ),
+        pytest.param("{{ 0 < record['count'] <= 10 }}", {"count": 10}, id="chained_comparison"),
+        pytest.param(
+            "{{ record['status'] in ['active', 'pending'] }}", {"status": "active"}, id="in"
+        ),
+        pytest.param(
+            "{{ record.status is defined and not record.deleted }}", {"status": "a"}, id="test"
+        ),
+        pytest.param("{{ record['deleted'] or record['status'] }}", {"status": "0"}, id="or_value"),
+        pytest.param("{{ record['status'] }}", {"status": None}, id="none_value"),
+        pytest.param("{{ record.items }}", {}, id="attribute_of_mapping"),
+        pytest.param("{{ record['status'] | length }}", {"status": "a"}, id="not_compiled_filter"),
+    ],
+)
+def test_compiled_condition_evaluates_like_template(template, record):
+    compiled_condition = InterpolatedBoolean(condition=template, parameters={})
+    template_condition = InterpolatedBoolean(condition=template, parameters={})
+    template_condition._compiled_condition = None
+    stream_slice = StreamSlice(partition={}, cursor_slice={"start_time": "2024-01-01"})
+
+    assert compiled_condition.eval(
+        config, record=record, stream_slice=stream_slice
+    ) == template_condition.eval(config, record=record, stream_slice=stream_slice)
+
+
+def test_given_unsupported_expression_when_create_then_condition_is_not_compiled():
+    assert InterpolatedBoolean(condition="{{ record['a'] }}", parameters={})._compiled_condition
+    assert not InterpolatedBoolean(
+        condition="{{ now_utc() > record['a'] }}", parameters={}
+    )._compiled_condition
+    assert not InterpolatedBoolean(
+        condition="{{ record['a'] }} and {{ record['b'] }}", parameters={}
+    )._compiled_condition
+
+
+def test_given_missing_variable_when_eval_compiled_condition_then_raise_like_template():
+    with pytest.raises(ValueError, match="undeclared variables"):
+        InterpolatedBoolean(condition="{{ record['a'] }}", parameters={}).eval(config)
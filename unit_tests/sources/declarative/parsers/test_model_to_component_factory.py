@@ -36,6 +36,10 @@ from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
 from airbyte_cdk.sources.declarative.datetime.min_max_datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.decoders import JsonDecoder, PaginationDecoderDecorator
+from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
+    CompositeRawDecoder,
+    JsonParser,
+)
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import (
@@ -71,6 +75,7 @@ from airbyte_cdk.sources.declarative.models import (
     GroupingPartitionRouter as GroupingPartitionRouterModel,
 )
 from airbyte_cdk.sources.declarative.models import HttpRequester as HttpRequesterModel
+from airbyte_cdk.sources.declarative.models import JsonDecoder as JsonDecoderModel
 from airbyte_cdk.sources.declarative.models import JwtAuthenticator as JwtAuthenticatorModel
 from airbyte_cdk.sources.declarative.models import ListPartitionRouter as ListPartitionRouterModel
 from airbyte_cdk.sources.declarative.models import OAuthAuthenticator as OAuthAuthenticatorModel
@@ -725,6 +730,80 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].request_option is None
 
 
+@pytest.mark.parametrize(
+    "disable_cache",
+    [pytest.param(False, id="test_cache_enabled"), pytest.param(True, id="test_cache_disabled")],
+)
+def test_create_substream_partition_router_shares_parent_record_cache(disable_cache):
+    content = """
+    stream_A:
+      type: DeclarativeStream
+      name: "A"
+      primary_key: "id"
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: HttpRequester
+          url_base: "https://airbyte.io"
+          path: "a"
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: []
+    stream_B:
+      type: DeclarativeStream
+      name: "B"
+      primary_key: "id"
+      retriever:
+        type: SimpleRetriever
+        requester:
+          type: HttpRequester
+          url_base: "https://airbyte.io"
+          path: "b"
+        record_selector:
+          type: RecordSelector
+          extractor:
+            type: DpathExtractor
+            field_path: []
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/stream_A"
+          parent_key: id
+          partition_field: a_id
+        - stream: "#/stream_B"
+          parent_key: id
+          partition_field: b_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters(
+        "", resolved_manifest["partition_router"], {}
+    )
+    component_factory = ModelToComponentFactory(disable_cache=disable_cache)
+
+    first_router, second_router = [
+        component_factory.create_component(
+            model_type=SubstreamPartitionRouterModel,
+            component_definition=partition_router_manifest,
+            config=input_config,
+        )
+        for _ in range(2)
+    ]
+
+    first_configs = first_router.parent_stream_configs
+    second_configs = second_router.parent_stream_configs
+    if disable_cache:
+        assert all(
+            parent_config.record_cache is None for parent_config in first_configs + second_configs
+        )
+    else:
+        assert first_configs[0].record_cache is second_configs[1].record_cache
+        assert first_configs[0].record_cache_key == second_configs[0].record_cache_key
+        assert first_configs[0].record_cache_key != first_configs[1].record_cache_key
+
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -4216,6 +4295,33 @@ def test_simple_retriever_with_request_parameters_properties_from_endpoint():
     assert property_chunking.property_limit == 3
 
 
+@pytest.mark.parametrize(
+    "emit_connector_builder_messages,expected_max_concurrent_requests",
+    [
+        pytest.param(False, 5, id="test_max_concurrent_requests"),
+        pytest.param(True, 1, id="test_connector_builder_requests_sequentially"),
+    ],
+)
+def test_create_property_chunking_with_max_concurrent_requests(
+    emit_connector_builder_messages, expected_max_concurrent_requests
+):
+    property_chunking = ModelToComponentFactory(
+        emit_connector_builder_messages=emit_connector_builder_messages
+    ).create_component(
+        model_type=PropertyChunkingModel,
+        component_definition={
+            "type": "PropertyChunking",
+            "property_limit_type": "property_count",
+            "property_limit": 3,
+            "max_concurrent_requests": 5,
+        },
+        config=input_config,
+    )
+
+    assert isinstance(property_chunking, PropertyChunking)
+    assert property_chunking.max_concurrent_requests == expected_max_concurrent_requests
+
+
 def test_simple_retriever_with_requester_properties_from_endpoint():
     content = """
     selector:
@@ -4561,3 +4667,35 @@ def test_create_property_chunking_invalid_property_limit_type():
             component_definition=property_chunking_model,
             config={},
         )
+
+
+def test_create_json_decoder():
+    decoder = factory.create_component(
+        model_type=JsonDecoderModel, component_definition={"type": "JsonDecoder"}, config={}
+    )
+
+    assert isinstance(decoder, JsonDecoder)
+
+
+@pytest.mark.parametrize(
+    "emit_connector_builder_messages, expected_stream_response",
+    [(False, True), (True, False)],
+)
+def test_create_streaming_json_decoder(emit_connector_builder_messages, expected_stream_response):
+    decoder = ModelToComponentFactory(
+        emit_connector_builder_messages=emit_connector_builder_messages
+    ).create_component(
+        model_type=JsonDecoderModel,
+        component_definition={
+            "type": "JsonDecoder",
+            "streaming": True,
+            "records_path": ["data", "items"],
+        },
+        config={},
+    )
+
+    assert isinstance(decoder, CompositeRawDecoder)
+    assert decoder.is_stream_response() == expected_stream_response
+    assert isinstance(decoder.parser, JsonParser)
+    assert decoder.parser.streaming
+    assert decoder.parser.records_path == ["data", "items"]
@@ -0,0 +1,135 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import gc
+import os
+
+import pytest
+
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+    ParentRecordCacheStats,
+)
+
+_RECORDS = [
+    ({"id": 1, "nested": {"values": [1, 2]}}, {"parent_slice": {}}),
+    ({"id": 2, "nested": None}, None),
+]
+
+
+class _ParentStream:
+    def __init__(self, records=_RECORDS, error_after=None):
+        self.read_count = 0
+        self._records = records
+        self._error_after = error_after
+
+    def read(self):
+        self.read_count += 1
+        for index, record in enumerate(self._records):
+            if index == self._error_after:
+                raise ValueError("parent read failed")
+            yield record
+
+
+def test_given_complete_read_when_read_again_then_replay_records_without_reading_parent():
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream()
+
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+
+    assert parent_stream.read_count == 1
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.cached_reads, stats.cached_records) == (1, 1, 1, 2)
+    assert stats.memory_bytes > 0
+    assert stats.spilled_bytes == 0
+
+
+def test_given_different_keys_when_read_then_read_each_parent():
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream()
+
+    list(cache.read("parent", parent_stream.read))
+    list(cache.read("other_parent", parent_stream.read))
+
+    assert parent_stream.read_count == 2
+
+
+def test_given_read_stopped_early_when_read_again_then_read_parent_again():
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream()
+
+    records = iter(cache.read("parent", parent_stream.read))
+    next(records)
+    records.close()
+
+    assert cache.stats.memory_bytes == 0
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert parent_stream.read_count == 2
+
+
+def test_given_read_fails_when_read_again_then_read_parent_again():
+    cache = ParentRecordCache()
+    failing_parent_stream = _ParentStream(error_after=1)
+
+    with pytest.raises(ValueError):
+        list(cache.read("parent", failing_parent_stream.read))
+
+    assert cache.stats.cached_reads == 0
+    assert cache.stats.memory_bytes == 0
+
+
+def test_given_records_that_are_not_json_when_read_then_do_not_cache():
+    cache = ParentRecordCache()
+    records = [({"id": 1, "updated_at": datetime.datetime(2024, 1, 1)}, None)]
+    parent_stream = _ParentStream(records)
+
+    assert list(cache.read("parent", parent_stream.read)) == records
+    assert list(cache.read("parent", parent_stream.read)) == records
+
+    assert parent_stream.read_count == 2
+    assert cache.stats == ParentRecordCacheStats(
+        hits=0, misses=2, cached_reads=0, cached_records=0, memory_bytes=0, spilled_bytes=0
+    )
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        pytest.param([({"id": 1, "score": float("nan")}, None)], id="nan"),
+        pytest.param([({"id": 1, "scores": [1.0, float("inf")]}, None)], id="infinity"),
+        pytest.param(
+            [({"id": 1}, {"parent_slice": {"range": (-float("inf"), 0)}})], id="in_partition"
+        ),
+        pytest.param([({"id": 1, "pair": (1, 2)}, None)], id="tuple"),
+    ],
+)
+def test_given_records_altered_by_json_when_read_then_do_not_cache(records):
+    cache = ParentRecordCache()
+    parent_stream = _ParentStream(records)
+
+    list(cache.read("parent", parent_stream.read))
+    list(cache.read("parent", parent_stream.read))
+
+    assert parent_stream.read_count == 2
+    assert cache.stats.cached_reads == 0
+    assert cache.stats.memory_bytes == 0
+
+
+def test_given_memory_budget_exceeded_when_read_then_spill_to_disk(tmp_path):
+    cache = ParentRecordCache(max_memory_bytes=50, spill_directory=str(tmp_path))
+    parent_stream = _ParentStream()
+
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+    assert list(cache.read("parent", parent_stream.read)) == _RECORDS
+
+    assert parent_stream.read_count == 1
+    assert cache.stats.memory_bytes == 0
+    assert cache.stats.spilled_bytes > 0
+    assert len(os.listdir(tmp_path)) == 1
+
+    del cache
+    gc.collect()
+    assert os.listdir(tmp_path) == []
@@ -24,6 +24,9 @@ from airbyte_cdk.sources.declarative.partition_routers import (
     CartesianProductStreamSlicer,
     ListPartitionRouter,
 )
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import (
+    ParentRecordCache,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import (
     ParentStreamConfig,
     SubstreamPartitionRouter,
@@ -837,6 +840,50 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
 
 
+@pytest.mark.parametrize(
+    "incremental_dependency, expected_read_count",
+    [
+        pytest.param(False, 1, id="test_full_refresh_parent_is_read_once"),
+        pytest.param(True, 2, id="test_incremental_parent_is_not_cached"),
+    ],
+)
+def test_given_record_cache_when_stream_slices_then_parent_records_are_shared(
+    mocker, incremental_dependency, expected_read_count
+):
+    record_cache = ParentRecordCache()
+    parent_stream = MockStream(parent_slices, all_parent_data, "first_stream")
+    read_only_records = mocker.spy(parent_stream, "read_only_records")
+
+    def _partition_router() -> SubstreamPartitionRouter:
+        return SubstreamPartitionRouter(
+            parent_stream_configs=[
+                ParentStreamConfig(
+                    stream=parent_stream,
+                    parent_key="id",
+                    partition_field="first_stream_id",
+                    parameters={},
+                    config={},
+                    incremental_dependency=incremental_dependency,
+                    record_cache=record_cache,
+                    record_cache_key="first_stream",
+                )
+            ],
+            parameters={},
+            config={},
+        )
+
+    first_slices = list(_partition_router().stream_slices())
+    second_slices = list(_partition_router().stream_slices())
+
+    assert first_slices == second_slices
+    assert [s.partition for s in first_slices] == [
+        {"first_stream_id": 0, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 1, "parent_slice": {"slice": "first"}},
+        {"first_stream_id": 2, "parent_slice": {"slice": "second"}},
+    ]
+    assert read_only_records.call_count == expected_read_count
+
+
 def test_substream_using_incremental_parent_stream():
     mock_slices = [
         StreamSlice(
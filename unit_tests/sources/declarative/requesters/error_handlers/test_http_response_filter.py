@@ -3,6 +3,7 @@
 #
 
 import json
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -237,3 +238,39 @@ def test_matches(
         assert actual_response_status.error_message == expected_error_resolution.error_message
     else:
         assert actual_response_status is None
+
+
+def test_given_many_filters_when_matches_then_response_body_is_parsed_once(requests_mock):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", text=json.dumps({"error": "rate limited"}), status_code=400
+    )
+    response = requests.get("https://airbyte.io/")
+    response_filters = [
+        HttpResponseFilter(
+            action=ResponseAction.RETRY,
+            config={},
+            parameters={},
+            predicate="{{ response.error == 'rate limited' }}",
+            error_message="{{ response.error }}",
+        ),
+        HttpResponseFilter(
+            action=ResponseAction.FAIL,
+            config={},
+            parameters={},
+            predicate="{{ 'error' in response }}",
+        ),
+    ]
+
+    with patch.object(
+        requests.Response, "json", autospec=True, side_effect=requests.Response.json
+    ) as json_method:
+        error_resolutions = [
+            response_filter.matches(response) for response_filter in response_filters
+        ]
+
+    assert json_method.call_count == 1
+    assert [resolution.response_action for resolution in error_resolutions] == [
+        ResponseAction.RETRY,
+        ResponseAction.FAIL,
+    ]
+    assert error_resolutions[0].error_message == "rate limited"
@@ -578,3 +578,71 @@ def test_path_with_additional_interpolation_context() -> None:
         stream_state=stream_state,
         stream_slice=stream_slice,
     )
+
+
+@pytest.mark.parametrize(
+    "prefetch_pages, next_page_token, expected_predicted_tokens",
+    [
+        pytest.param(0, None, [], id="test_no_prefetch"),
+        pytest.param(
+            3,
+            None,
+            [{"next_page_token": 2}, {"next_page_token": 4}, {"next_page_token": 6}],
+            id="test_prefetch_after_first_page",
+        ),
+        pytest.param(
+            2,
+            {"next_page_token": 4},
+            [{"next_page_token": 6}, {"next_page_token": 8}],
+            id="test_prefetch_after_page",
+        ),
+    ],
+)
+def test_predict_next_page_tokens(prefetch_pages, next_page_token, expected_predicted_tokens):
+    paginator = DefaultPaginator(
+        OffsetIncrement(config={}, page_size=2, extractor=None, parameters={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        prefetch_pages=prefetch_pages,
+    )
+
+    assert paginator.predict_next_page_tokens(next_page_token) == expected_predicted_tokens
+
+
+def test_predict_next_page_tokens_without_prediction_from_strategy():
+    paginator = DefaultPaginator(
+        CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        prefetch_pages=3,
+    )
+
+    assert paginator.predict_next_page_tokens({"next_page_token": "a_cursor"}) == []
+
+
+def test_prefetch_pages_cannot_be_negative():
+    with pytest.raises(ValueError):
+        DefaultPaginator(
+            PageIncrement(config={}, page_size=2, parameters={}),
+            config={},
+            url_base="https://airbyte.io",
+            parameters={},
+            prefetch_pages=-1,
+        )
+
+
+def test_limit_page_fetched_does_not_prefetch():
+    paginator = PaginatorTestReadDecorator(
+        DefaultPaginator(
+            PageIncrement(config={}, page_size=2, parameters={}),
+            config={},
+            url_base="https://airbyte.io",
+            parameters={},
+            prefetch_pages=3,
+        ),
+        maximum_number_of_pages=5,
+    )
+
+    assert paginator.predict_next_page_tokens(None) == []
@@ -146,3 +146,29 @@ def test_offset_increment_paginator_strategy_initial_token(
     )
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "page_size, last_page_token_value, expected_predicted_token",
+    [
+        pytest.param(20, None, 20, id="test_predict_after_first_page_not_injected"),
+        pytest.param(20, 0, 20, id="test_predict_after_first_page_injected"),
+        pytest.param(20, 40, 60, id="test_predict_after_page"),
+        pytest.param(20, "40", None, id="test_no_prediction_for_non_integer_token"),
+        pytest.param(None, 40, None, id="test_no_prediction_without_page_size"),
+        pytest.param(
+            "{{ response.limit }}", 40, None, id="test_no_prediction_if_page_size_needs_response"
+        ),
+    ],
+)
+def test_offset_increment_predict_next_page_token(
+    page_size, last_page_token_value, expected_predicted_token
+):
+    paginator_strategy = OffsetIncrement(
+        page_size=page_size, extractor=None, parameters={}, config={}
+    )
+
+    assert (
+        paginator_strategy.predict_next_page_token(last_page_token_value)
+        == expected_predicted_token
+    )
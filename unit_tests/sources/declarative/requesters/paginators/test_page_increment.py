@@ -105,3 +105,25 @@ def test_page_increment_paginator_strategy_initial_token(
     )
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "start_from_page, last_page_token_value, expected_predicted_token",
+    [
+        pytest.param(1, None, 2, id="test_predict_after_first_page_not_injected"),
+        pytest.param(0, 0, 1, id="test_predict_after_first_page_injected"),
+        pytest.param(0, 4, 5, id="test_predict_after_page"),
+        pytest.param(0, "4", None, id="test_no_prediction_for_non_integer_token"),
+    ],
+)
+def test_page_increment_predict_next_page_token(
+    start_from_page, last_page_token_value, expected_predicted_token
+):
+    paginator_strategy = PageIncrement(
+        page_size=20, parameters={}, start_from_page=start_from_page, config={}
+    )
+
+    assert (
+        paginator_strategy.predict_next_page_token(last_page_token_value)
+        == expected_predicted_token
+    )
@@ -104,3 +104,15 @@ def test_get_merge_key():
 
     merge_key = property_chunking.get_merge_key(record=record)
     assert merge_key == "0"
+
+
+def test_given_max_concurrent_requests_not_positive_when_create_then_raise():
+    with pytest.raises(ValueError):
+        PropertyChunking(
+            property_limit_type=PropertyLimitType.property_count,
+            property_limit=10,
+            record_merge_strategy=GroupByKey(key="id", config=CONFIG, parameters={}),
+            config=CONFIG,
+            parameters={},
+            max_concurrent_requests=0,
+        )
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from typing import Any, List, Mapping, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import PageIncrement
+from airbyte_cdk.sources.declarative.retrievers.page_prefetcher import PagePrefetcher
+
+
+def _paginator(prefetch_pages: int) -> DefaultPaginator:
+    return DefaultPaginator(
+        PageIncrement(config={}, page_size=2, parameters={}, inject_on_first_request=True),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        prefetch_pages=prefetch_pages,
+    )
+
+
+def _token(page: int) -> Mapping[str, Any]:
+    return {"next_page_token": page}
+
+
+class _PageServer:
+    def __init__(self, failing_pages: Optional[List[int]] = None) -> None:
+        self.requested_pages: List[Optional[int]] = []
+        self._failing_pages = failing_pages or []
+        self._lock = threading.Lock()
+
+    def fetch(self, next_page_token: Optional[Mapping[str, Any]]) -> Any:
+        page = next_page_token["next_page_token"] if next_page_token else None
+        with self._lock:
+            self.requested_pages.append(page)
+        if page in self._failing_pages:
+            raise ValueError(f"page {page} failed")
+        response = MagicMock()
+        response.page = page
+        return response
+
+
+def test_given_no_prefetch_when_fetch_then_request_page_only():
+    server = _PageServer()
+    prefetcher = PagePrefetcher(_paginator(prefetch_pages=0), server.fetch, "test")
+
+    assert prefetcher.fetch(_token(1)).page == 1
+    assert prefetcher.fetch(_token(2)).page == 2
+    prefetcher.close()
+
+    assert server.requested_pages == [1, 2]
+
+
+def test_given_predicted_pages_when_fetch_then_reuse_pages_requested_ahead():
+    server = _PageServer()
+    prefetcher = PagePrefetcher(_paginator(prefetch_pages=2), server.fetch, "test")
+
+    responses = [prefetcher.fetch(_token(page)).page for page in range(1, 5)]
+    prefetcher.close()
+
+    assert responses == [1, 2, 3, 4]
+    # every page is requested once, including the two pages requested ahead of the last fetched one
+    assert sorted(server.requested_pages) == [1, 2, 3, 4, 5, 6]
+
+
+def test_given_unexpected_token_when_fetch_then_discard_pages_requested_ahead():
+    server = _PageServer()
+    prefetcher = PagePrefetcher(_paginator(prefetch_pages=2), server.fetch, "test")
+
+    assert prefetcher.fetch(_token(1)).page == 1
+    assert prefetcher.fetch(_token(10)).page == 10
+    prefetcher.close()
+
+    assert server.requested_pages.count(10) == 1
+
+
+def test_given_page_requested_ahead_fails_when_not_fetched_then_error_is_discarded():
+    server = _PageServer(failing_pages=[3])
+    prefetcher = PagePrefetcher(_paginator(prefetch_pages=2), server.fetch, "test")
+
+    assert prefetcher.fetch(_token(1)).page == 1
+    prefetcher.close()
+
+
+def test_given_page_requested_ahead_fails_when_fetched_then_raise():
+    server = _PageServer(failing_pages=[2])
+    prefetcher = PagePrefetcher(_paginator(prefetch_pages=2), server.fetch, "test")
+
+    assert prefetcher.fetch(_token(1)).page == 1
+    with pytest.raises(ValueError, match="page 2 failed"):
+        prefetcher.fetch(_token(2))
+    prefetcher.close()
@@ -3,6 +3,8 @@
 #
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Any, Iterable, Mapping, Optional
 from unittest.mock import MagicMock, Mock, patch
@@ -1660,3 +1662,304 @@ def test_simple_retriever_still_emit_records_if_no_merge_key():
 
     assert len(actual_records) == 10
     assert actual_records == expected_records
+
+
+def _chunked_retriever(requester, max_concurrent_requests, paginator=None):
+    stream_name = "stream_name"
+
+    def _select_records(response, stream_slice, **kwargs):
+        return [
+            Record(
+                data={
+                    "id": record_id,
+                    **{field: f"{field}_{record_id}" for field in response.fields},
+                },
+                associated_slice=stream_slice,
+                stream_name=stream_name,
+            )
+            for record_id in ["a", "b"]
+        ]
+
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = _select_records
+
+    return SimpleRetriever(
+        name=stream_name,
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=record_selector,
+        paginator=paginator,
+        additional_query_properties=QueryProperties(
+            property_list=["first_name", "last_name", "nonary", "bracelet"],
+            always_include_properties=["id"],
+            property_chunking=PropertyChunking(
+                property_limit_type=PropertyLimitType.property_count,
+                property_limit=1,
+                record_merge_strategy=GroupByKey(key="id", config=config, parameters={}),
+                config=config,
+                parameters={},
+                max_concurrent_requests=max_concurrent_requests,
+            ),
+            config=config,
+            parameters={},
+        ),
+        parameters={},
+        config={},
+    )
+
+
+def _chunk_response(stream_slice):
+    response = MagicMock()
+    response.fields = [
+        field for field in stream_slice.extra_fields["query_properties"] if field != "id"
+    ]
+    return response
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [1, 2, 4])
+def test_simple_retriever_with_property_chunks_requested_concurrently(max_concurrent_requests):
+    requester = MagicMock()
+    requester.send_request.side_effect = lambda stream_slice, **kwargs: _chunk_response(
+        stream_slice
+    )
+    retriever = _chunked_retriever(requester, max_concurrent_requests)
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert [record.data for record in actual_records] == [
+        {
+            "id": record_id,
+            "first_name": f"first_name_{record_id}",
+            "last_name": f"last_name_{record_id}",
+            "nonary": f"nonary_{record_id}",
+            "bracelet": f"bracelet_{record_id}",
+        }
+        for record_id in ["a", "b"]
+    ]
+    assert actual_records[0].associated_slice.extra_fields["query_properties"] == [
+        "id",
+        "bracelet",
+    ]
+    assert requester.send_request.call_count == 4
+
+
+def test_simple_retriever_requests_next_property_chunk_while_waiting_for_first():
+    second_chunk_requested = threading.Event()
+
+    def _send_request(stream_slice, **kwargs):
+        if stream_slice.extra_fields["query_properties"] == ["id", "first_name"]:
+            # only returns once the next chunk has been requested which can't happen if chunks are requested sequentially
+            assert second_chunk_requested.wait(timeout=10)
+        else:
+            second_chunk_requested.set()
+        return _chunk_response(stream_slice)
+
+    requester = MagicMock()
+    requester.send_request.side_effect = _send_request
+    retriever = _chunked_retriever(requester, max_concurrent_requests=2)
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert len(actual_records) == 2
+    assert second_chunk_requested.is_set()
+
+
+def test_given_property_chunk_request_fails_when_read_records_then_raise():
+    def _send_request(stream_slice, **kwargs):
+        if stream_slice.extra_fields["query_properties"] == ["id", "last_name"]:
+            raise ValueError("request failed")
+        return _chunk_response(stream_slice)
+
+    requester = MagicMock()
+    requester.send_request.side_effect = _send_request
+    retriever = _chunked_retriever(requester, max_concurrent_requests=2)
+
+    with pytest.raises(ValueError, match="request failed"):
+        list(
+            retriever.read_records(
+                records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+            )
+        )
+
+
+def test_given_multiple_pages_when_read_records_then_property_chunks_requested_from_one_pool():
+    requester = MagicMock()
+    requester.send_request.side_effect = lambda stream_slice, **kwargs: _chunk_response(
+        stream_slice
+    )
+    paginator = MagicMock()
+    paginator.get_initial_token.return_value = None
+    paginator.next_page_token.side_effect = [{"next_page_token": 2}, None]
+    for method_name in [
+        "get_request_params",
+        "get_request_headers",
+        "get_request_body_data",
+        "get_request_body_json",
+    ]:
+        getattr(paginator, method_name).return_value = {}
+        getattr(paginator, method_name).__name__ = method_name
+    retriever = _chunked_retriever(requester, max_concurrent_requests=2, paginator=paginator)
+
+    with patch(
+        "airbyte_cdk.sources.declarative.retrievers.simple_retriever.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as thread_pool_executor:
+        actual_records = list(
+            retriever.read_records(
+                records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+            )
+        )
+
+    assert len(actual_records) == 4
+    assert requester.send_request.call_count == 8
+    thread_pool_executor.assert_called_once()
+
+
+def _paginated_retriever(requester, prefetch_pages, record_filter=None):
+    stream_name = "stream_name"
+
+    def _select_records(response, stream_slice, **kwargs):
+        number_of_records = 2 if response.page < 4 else 1
+        records = [
+            Record(
+                data={"id": f"{response.page}_{i}"},
+                associated_slice=stream_slice,
+                stream_name=stream_name,
+            )
+            for i in range(number_of_records)
+        ]
+        return [record for record in records if not record_filter or record_filter(record)]
+
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = _select_records
+
+    return SimpleRetriever(
+        name=stream_name,
+        primary_key=primary_key,
+        requester=requester,
+        record_selector=record_selector,
+        paginator=DefaultPaginator(
+            PageIncrement(config={}, page_size=2, parameters={}, inject_on_first_request=True),
+            config={},
+            url_base="https://airbyte.io",
+            parameters={},
+            prefetch_pages=prefetch_pages,
+        ),
+        parameters={},
+        config={},
+    )
+
+
+class _PagedRequester:
+    def __init__(self, failing_pages=()):
+        self.requested_pages = []
+        self._failing_pages = failing_pages
+        self._lock = threading.Lock()
+
+    def send_request(self, next_page_token, **kwargs):
+        page = next_page_token["next_page_token"]
+        with self._lock:
+            self.requested_pages.append(page)
+        if page in self._failing_pages:
+            raise ValueError(f"page {page} failed")
+        response = MagicMock()
+        response.page = page
+        return response
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 1, 3, 10])
+def test_simple_retriever_with_prefetched_pages(prefetch_pages):
+    requester = _PagedRequester()
+    retriever = _paginated_retriever(requester, prefetch_pages)
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert [record.data["id"] for record in actual_records] == [
+        "0_0",
+        "0_1",
+        "1_0",
+        "1_1",
+        "2_0",
+        "2_1",
+        "3_0",
+        "3_1",
+        "4_0",
+    ]
+    assert sorted(set(requester.requested_pages))[:5] == [0, 1, 2, 3, 4]
+    assert len(requester.requested_pages) == len(set(requester.requested_pages))
+
+
+def test_given_page_after_last_page_fails_when_prefetched_then_error_is_ignored():
+    requester = _PagedRequester(failing_pages=[5, 6])
+    retriever = _paginated_retriever(requester, prefetch_pages=3)
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert len(actual_records) == 9
+
+
+def test_given_prefetched_page_fails_when_read_then_raise():
+    requester = _PagedRequester(failing_pages=[2])
+    retriever = _paginated_retriever(requester, prefetch_pages=3)
+
+    with pytest.raises(ValueError, match="page 2 failed"):
+        list(
+            retriever.read_records(
+                records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+            )
+        )
+
+
+def test_given_partial_page_when_prefetched_then_stop_at_actual_last_page():
+    requester = _PagedRequester()
+    # the second record of page 1 is filtered out so pagination stops there even if later pages were requested ahead
+    retriever = _paginated_retriever(
+        requester, prefetch_pages=3, record_filter=lambda record: record.data["id"] != "1_1"
+    )
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert [record.data["id"] for record in actual_records] == ["0_0", "0_1", "1_0"]
+
+
+def test_given_prefetched_pages_when_read_then_pages_are_requested_concurrently():
+    requester = _PagedRequester()
+    # the first two pages wait for each other, which never happens when pages are fetched one at a time
+    barrier = threading.Barrier(2, timeout=10)
+    send_request = requester.send_request
+
+    def _send_request(next_page_token, **kwargs):
+        if next_page_token["next_page_token"] < 2:
+            barrier.wait()
+        return send_request(next_page_token, **kwargs)
+
+    requester.send_request = _send_request
+    retriever = _paginated_retriever(requester, prefetch_pages=1)
+
+    actual_records = list(
+        retriever.read_records(
+            records_schema={}, stream_slice=StreamSlice(cursor_slice={}, partition={})
+        )
+    )
+
+    assert len(actual_records) == 9
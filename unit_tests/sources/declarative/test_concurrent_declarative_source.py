@@ -5,6 +5,7 @@
 import copy
 import json
 import math
+import pickle
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 from unittest.mock import patch
@@ -32,6 +33,7 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.concurrent_declarative_source import (
     ConcurrentDeclarativeSource,
+    DeclarativeProcessPartitionFactory,
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.extractors.record_filter import (
@@ -1659,6 +1661,110 @@ def test_concurrency_level_initial_number_partitions_to_generate_is_always_one_o
     assert source._concurrent_source._initial_number_partitions_to_generate == 1
 
 
+@pytest.mark.parametrize(
+    "max_queue_size_in_bytes",
+    [
+        pytest.param(1024, id="test_max_queue_size_in_bytes_as_int"),
+        pytest.param(
+            "{{ config.get('max_queue_size_in_bytes', 1024) }}",
+            id="test_max_queue_size_in_bytes_using_interpolation",
+        ),
+    ],
+)
+def test_given_max_queue_size_in_bytes_when_create_source_then_queue_is_bounded_by_size(
+    max_queue_size_in_bytes,
+):
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="palaces", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            ),
+        ]
+    )
+
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"]["max_queue_size_in_bytes"] = max_queue_size_in_bytes
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=_CONFIG, catalog=catalog, state=[]
+    )
+    assert source._concurrent_source._max_queue_size_in_bytes == 1024
+
+
+def test_given_record_batch_size_when_create_source_then_records_are_queued_in_batches():
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(
+                    name="palaces", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]
+                ),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            ),
+        ]
+    )
+
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"]["record_batch_size"] = 100
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=_CONFIG, catalog=catalog, state=[]
+    )
+    assert source._concurrent_source._record_batch_size == 100
+
+
+def test_given_read_partitions_in_processes_when_create_source_then_worker_processes_can_create_partitions():
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"]["read_partitions_in_processes"] = True
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest, config=_CONFIG, catalog=_CATALOG, state=[]
+    )
+
+    partition_factory = source._concurrent_source._process_partition_factory
+    assert isinstance(partition_factory, DeclarativeProcessPartitionFactory)
+    # the factory is pickled when the worker processes start
+    worker_partition_factory = pickle.loads(pickle.dumps(partition_factory))
+    stream_slice = StreamSlice(partition={}, cursor_slice={})
+    partition = worker_partition_factory.create("palaces", stream_slice)
+    assert partition.stream_name() == "palaces"
+    assert partition.to_slice() == stream_slice
+
+
+def test_given_read_partitions_in_processes_and_connector_builder_when_create_source_then_partitions_are_read_in_threads():
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"]["read_partitions_in_processes"] = True
+
+    source = ConcurrentDeclarativeSource(
+        source_config=manifest,
+        config=_CONFIG,
+        catalog=_CATALOG,
+        state=[],
+        emit_connector_builder_messages=True,
+    )
+
+    assert source._concurrent_source._process_partition_factory is None
+
+
+def test_given_read_partitions_in_processes_and_subclass_when_create_source_then_partitions_are_read_in_threads():
+    class _SourceWithOverrides(ConcurrentDeclarativeSource):
+        def streams(self, config):
+            return super().streams(config)[:1]
+
+    manifest = copy.deepcopy(_MANIFEST)
+    manifest["concurrency_level"]["read_partitions_in_processes"] = True
+
+    source = _SourceWithOverrides(
+        source_config=manifest, config=_CONFIG, catalog=_CATALOG, state=[]
+    )
+
+    assert source._concurrent_source._process_partition_factory is None
+
+
 def test_given_partition_routing_and_incremental_sync_then_stream_is_concurrent():
     manifest = {
         "version": "5.0.0",
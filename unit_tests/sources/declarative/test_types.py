@@ -1,8 +1,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
+import pickle
+from unittest.mock import patch
+
 import pytest
 
-from airbyte_cdk.sources.types import StreamSlice
+from airbyte_cdk.sources.types import Record, StreamSlice, _freeze
+from airbyte_cdk.utils.slice_hasher import SliceHasher
 
 
 @pytest.mark.parametrize(
@@ -93,3 +97,83 @@ def test_cursor_slice(stream_slice, expected_cursor_slice):
     cursor_slice = stream_slice.cursor_slice
 
     assert cursor_slice == expected_cursor_slice
+
+
+@pytest.mark.parametrize(
+    "stream_slice, equal_stream_slice",
+    [
+        pytest.param(
+            StreamSlice(partition={"id": 1, "name": "a"}, cursor_slice={"start": "2024-01-01"}),
+            StreamSlice(partition={"name": "a", "id": 1}, cursor_slice={"start": "2024-01-01"}),
+            id="test_key_order_is_ignored",
+        ),
+        pytest.param(
+            StreamSlice(
+                partition={"parent_slice": {"ids": [1, 2], "nested": {"a": None}}},
+                cursor_slice={},
+            ),
+            StreamSlice(
+                partition={"parent_slice": {"nested": {"a": None}, "ids": [1, 2]}},
+                cursor_slice={},
+            ),
+            id="test_nested_values",
+        ),
+        pytest.param(
+            StreamSlice(
+                partition={"parent_slice": StreamSlice(partition={"id": 1}, cursor_slice={})},
+                cursor_slice={},
+            ),
+            StreamSlice(partition={"parent_slice": {"id": 1}}, cursor_slice={}),
+            id="test_nested_stream_slice",
+        ),
+        pytest.param(
+            StreamSlice(partition={"id": 1}, cursor_slice={}, extra_fields={"name": "a"}),
+            StreamSlice(partition={"id": 1}, cursor_slice={}, extra_fields={"name": "b"}),
+            id="test_extra_fields_are_ignored",
+        ),
+    ],
+)
+def test_equal_stream_slices_have_the_same_hash(stream_slice, equal_stream_slice):
+    assert stream_slice == equal_stream_slice
+    assert hash(stream_slice) == hash(equal_stream_slice)
+    assert {stream_slice: "value"}[equal_stream_slice] == "value"
+
+
+def test_stream_slice_hash_is_computed_once():
+    stream_slice = StreamSlice(partition={"ids": [1, 2]}, cursor_slice={"start": "2024-01-01"})
+
+    with patch("airbyte_cdk.sources.types._freeze", wraps=_freeze) as freeze:
+        first_hash = hash(stream_slice)
+        number_of_calls = freeze.call_count
+        assert hash(stream_slice) == first_hash
+
+    assert number_of_calls > 0
+    assert freeze.call_count == number_of_calls
+
+
+def test_stream_slice_with_values_that_are_not_hashable_is_hashed_on_json_representation():
+    class _Unhashable:
+        __hash__ = None
+
+        def __json_serializable__(self):
+            return "unhashable"
+
+    stream_slice = StreamSlice(partition={"value": _Unhashable()}, cursor_slice={})
+
+    assert hash(stream_slice) == hash(SliceHasher.hash(stream_slice={"value": "unhashable"}))
+
+
+def test_stream_slice_hash_is_not_pickled():
+    stream_slice = StreamSlice(partition={"id": 1}, cursor_slice={"start": "2024-01-01"})
+    hash(stream_slice)
+
+    unpickled_stream_slice = pickle.loads(pickle.dumps(stream_slice))
+
+    assert unpickled_stream_slice._hash is None
+    assert unpickled_stream_slice == stream_slice
+    assert hash(unpickled_stream_slice) == hash(stream_slice)
+
+
+def test_record_is_not_owned_by_default():
+    assert not Record(data={"id": 1}, stream_name="stream").owned
+    assert Record(data={"id": 1}, stream_name="stream", owned=True).owned
@@ -3,12 +3,21 @@
 #
 
 import datetime
+import io
 import uuid
+from typing import Any, Dict, List, Mapping, Optional
+from unittest.mock import Mock
 
+import fastavro
 import pytest
 
 from airbyte_cdk.sources.file_based.config.avro_format import AvroFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
+    FileBasedStreamConfig,
+    ValidationPolicy,
+)
 from airbyte_cdk.sources.file_based.file_types import AvroParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 _default_avro_format = AvroFormat()
 _double_as_string_avro_format = AvroFormat(double_as_string=True)
@@ -388,3 +397,91 @@ def test_convert_primitive_avro_type_to_json(
 def test_to_output_value(avro_format, record_type, record_value, expected_value):
     parser = AvroParser()
     assert parser._to_output_value(avro_format, record_type, record_value) == expected_value
+
+
+_AVRO_SCHEMA = {
+    "type": "record",
+    "name": "Record",
+    "namespace": "test",
+    "fields": [
+        {
+            "name": "inner",
+            "type": {"type": "record", "name": "Inner", "fields": [{"name": "x", "type": "int"}]},
+        },
+        {"name": "other_inner", "type": "Inner"},
+        {"name": "id", "type": "long"},
+        {"name": "name", "type": "string"},
+    ],
+}
+_AVRO_RECORDS = [
+    {"inner": {"x": 1}, "other_inner": {"x": 2}, "id": 1, "name": "first"},
+    {"inner": {"x": 3}, "other_inner": {"x": 4}, "id": 2, "name": "second"},
+]
+
+
+def _parse_avro_records(
+    discovered_schema: Optional[Mapping[str, Any]],
+    validation_policy: ValidationPolicy = ValidationPolicy.emit_record,
+) -> List[Dict[str, Any]]:
+    avro_file = io.BytesIO()
+    fastavro.writer(avro_file, fastavro.parse_schema(_AVRO_SCHEMA), _AVRO_RECORDS)
+    avro_file.seek(0)
+    config = FileBasedStreamConfig(
+        name="test", format=AvroFormat(), validation_policy=validation_policy
+    )
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=avro_file)
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    file = RemoteFile(uri="test.avro", last_modified=datetime.datetime.now())
+    return list(AvroParser().parse_records(config, file, stream_reader, Mock(), discovered_schema))
+
+
+def _schema(*columns: str) -> Mapping[str, Any]:
+    return {"type": "object", "properties": {column: {} for column in columns}}
+
+
+@pytest.mark.parametrize(
+    "discovered_schema, validation_policy, expected_columns",
+    [
+        pytest.param(
+            _schema("id", "_ab_source_file_url"),
+            ValidationPolicy.emit_record,
+            ["id"],
+            id="test_only_selected_columns_are_read",
+        ),
+        pytest.param(
+            _schema("inner", "name"),
+            ValidationPolicy.emit_record,
+            ["inner", "name"],
+            id="test_nested_record_selected",
+        ),
+        pytest.param(
+            _schema("other_inner"),
+            ValidationPolicy.emit_record,
+            ["inner", "other_inner", "id", "name"],
+            id="test_selected_field_referring_to_unselected_type_reads_all_columns",
+        ),
+        pytest.param(
+            None,
+            ValidationPolicy.emit_record,
+            ["inner", "other_inner", "id", "name"],
+            id="test_no_schema_reads_all_columns",
+        ),
+        pytest.param(
+            _schema("id"),
+            ValidationPolicy.skip_record,
+            ["inner", "other_inner", "id", "name"],
+            id="test_validating_policy_reads_all_columns",
+        ),
+    ],
+)
+def test_parse_records_column_projection(
+    discovered_schema: Optional[Mapping[str, Any]],
+    validation_policy: ValidationPolicy,
+    expected_columns: List[str],
+) -> None:
+    records = _parse_avro_records(discovered_schema, validation_policy)
+
+    assert records == [
+        {column: record[column] for column in expected_columns} for record in _AVRO_RECORDS
+    ]
@@ -8,13 +8,14 @@ import io
 import logging
 import unittest
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Set
+from typing import Any, Dict, Generator, List, Mapping, Set
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
 import pytest
 
 from airbyte_cdk.models import FailureType
+from airbyte_cdk.sources.file_based.byte_range import ByteRangeStreamReader
 from airbyte_cdk.sources.file_based.config.csv_format import (
     DEFAULT_FALSE_VALUES,
     DEFAULT_TRUE_VALUES,
@@ -29,7 +30,12 @@ from airbyte_cdk.sources.file_based.file_based_stream_reader import (
     AbstractFileBasedStreamReader,
     FileReadMode,
 )
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import (
+    CsvParser,
+    _CsvReader,
+    _RowCaster,
+    _to_dict,
+)
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -658,6 +664,20 @@ class CsvReaderTest(unittest.TestCase):
         assert "encoding" in ate.value.message
         assert self._csv_reader._get_headers.called
 
+    def test_given_empty_lines_when_read_rows_then_skip_empty_lines(self) -> None:
+        self._stream_reader.open_file.return_value = (
+            CsvFileBuilder().with_data(["header1,header2", "1,2", "", "3,4"]).build()
+        )
+
+        rows = self._csv_reader.read_rows(
+            self._config, self._file, self._stream_reader, self._logger, FileReadMode.READ
+        )
+
+        assert list(rows) == [
+            (["header1", "header2"], ["1", "2"]),
+            (["header1", "header2"], ["3", "4"]),
+        ]
+
     def _read_data(self) -> Generator[Dict[str, str], None, None]:
         data_generator = self._csv_reader.read_data(
             self._config,
@@ -785,3 +805,294 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_ROW_CASTER_PROPERTY_TYPES = {
+    "null": "null",
+    "boolean": "boolean",
+    "integer": "integer",
+    "number": "number",
+    "string": "string",
+    "object": "object",
+    "array": "array",
+    "unknown_type": "date",
+}
+
+
+def _cast_and_nullify(
+    row: Dict[Any, Any],
+    deduped_property_types: Mapping[str, str],
+    config_format: CsvFormat,
+    cast_logger: logging.Logger,
+    schemaless: bool,
+) -> Dict[str, Any]:
+    cast_fn = CsvParser._get_cast_function(
+        deduped_property_types, config_format, cast_logger, schemaless
+    )
+    return CsvParser._to_nullable(
+        cast_fn(row),
+        deduped_property_types,
+        config_format.null_values,
+        config_format.strings_can_be_null,
+    )
+
+
+@pytest.mark.parametrize(
+    "headers, values",
+    [
+        pytest.param(
+            ["null", "boolean", "integer", "number", "string", "not_in_schema"],
+            ["", "true", "1", "1.5", "a string", "x"],
+            id="test_valid_values",
+        ),
+        pytest.param(
+            ["null", "boolean", "integer", "number", "string", "object", "array"],
+            ["x", "maybe", "1.5", "a", "", "not json", "{}"],
+            id="test_invalid_values",
+        ),
+        pytest.param(
+            ["null", "boolean", "integer", "number", "string", "object", "array", "unknown_type"],
+            ["NULL", "NULL", "NULL", "NULL", "NULL", "NULL", "NULL", "NULL"],
+            id="test_null_values",
+        ),
+        pytest.param(
+            ["integer", "string", "integer"],
+            ["1", "NULL", "x"],
+            id="test_duplicated_headers",
+        ),
+        pytest.param(["integer", "string"], ["1", "a", "extra"], id="test_extra_values"),
+        pytest.param(["integer", "string"], ["1"], id="test_missing_values"),
+    ],
+)
+@pytest.mark.parametrize(
+    "property_types, schemaless",
+    [
+        pytest.param(_ROW_CASTER_PROPERTY_TYPES, False, id="test_with_schema"),
+        pytest.param({}, False, id="test_without_schema"),
+        pytest.param(_ROW_CASTER_PROPERTY_TYPES, True, id="test_schemaless"),
+    ],
+)
+@pytest.mark.parametrize("strings_can_be_null", [True, False])
+def test_row_caster_is_equivalent_to_cast_types_and_to_nullable(
+    headers: List[str],
+    values: List[str],
+    property_types: Mapping[str, str],
+    schemaless: bool,
+    strings_can_be_null: bool,
+) -> None:
+    config_format = CsvFormat(null_values={"NULL"}, strings_can_be_null=strings_can_be_null)
+    expected_logger = Mock(spec=logging.Logger)
+    row_caster_logger = Mock(spec=logging.Logger)
+
+    row_caster = _RowCaster(headers, property_types, config_format, row_caster_logger, schemaless)
+    try:
+        expected = _cast_and_nullify(
+            _to_dict(headers, values), property_types, config_format, expected_logger, schemaless
+        )
+    except TypeError:
+        # extra values are listed under the None key, which can't be checked against null values if they are not cast
+        with pytest.raises(TypeError):
+            row_caster.cast(values)
+        return
+    record = row_caster.cast(values)
+
+    assert record == expected
+    assert list(record) == list(expected)
+    assert row_caster_logger.warning.call_args_list == expected_logger.warning.call_args_list
+
+
+def test_row_caster_casts_objects_and_arrays() -> None:
+    row_caster = _RowCaster(
+        ["object", "array"],
+        _ROW_CASTER_PROPERTY_TYPES,
+        CsvFormat(null_values={"NULL"}),
+        Mock(spec=logging.Logger),
+        schemaless=False,
+    )
+
+    assert row_caster.cast(['{"a": 1}', "[1, 2]"]) == {"object": {"a": 1}, "array": [1, 2]}
+
+
+def _binary_stream_reader(content: bytes) -> Mock:
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(content)
+        if mode == FileReadMode.READ_BINARY
+        else io.TextIOWrapper(io.BytesIO(content), encoding=encoding)
+    )
+    return stream_reader
+
+
+def _csv_content_with_quoted_newlines() -> bytes:
+    content = io.StringIO()
+    writer = csv.writer(content)
+    for i in range(500):
+        writer.writerow([i, ["plain", 'multi\nline "quoted"', "a,b", "", "x\r\ny"][i % 5]])
+    return content.getvalue().encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "header, csv_format",
+    [
+        pytest.param(b"id,text\r\n", CsvFormat(), id="test_header_row"),
+        pytest.param(
+            b"skipped\nid,text\nskipped\n",
+            CsvFormat(skip_rows_before_header=1, skip_rows_after_header=1),
+            id="test_skipped_rows",
+        ),
+        pytest.param(
+            b"",
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["id", "text"])),
+            id="test_user_provided_headers",
+        ),
+    ],
+)
+def test_given_byte_ranges_when_parse_records_then_records_are_the_same_as_for_the_whole_file(
+    header: bytes, csv_format: CsvFormat
+) -> None:
+    content = header + _csv_content_with_quoted_newlines()
+    config = FileBasedStreamConfig(
+        name="test", globs=["*"], format=csv_format, validation_policy="Emit Record"
+    )
+    file = RemoteFile(uri="a.csv", last_modified=datetime.now())
+    parser = CsvParser()
+
+    byte_ranges = parser.get_byte_ranges(
+        config, file, _binary_stream_reader(content), logger, partition_size=1000
+    )
+
+    assert byte_ranges is not None and len(byte_ranges) > 2
+    assert byte_ranges[-1].end == len(content)
+    assert all(byte_range.prefix_end == len(header) for byte_range in byte_ranges[1:])
+    records = [
+        record
+        for byte_range in byte_ranges
+        for record in parser.parse_records(
+            config,
+            file,
+            ByteRangeStreamReader(_binary_stream_reader(content), byte_range),
+            logger,
+            None,
+        )
+    ]
+    assert records == list(
+        parser.parse_records(config, file, _binary_stream_reader(content), logger, None)
+    )
+
+
+@pytest.mark.parametrize(
+    "uri, csv_format",
+    [
+        pytest.param("a.csv.gz", CsvFormat(), id="test_compressed_file"),
+        pytest.param("a.csv", CsvFormat(escape_char="\\"), id="test_escape_char"),
+        pytest.param(
+            "a.csv",
+            CsvFormat(header_definition=CsvHeaderAutogenerated()),
+            id="test_autogenerated_headers",
+        ),
+        pytest.param(
+            "a.csv", CsvFormat(encoding="utf-16"), id="test_encoding_not_ascii_compatible"
+        ),
+    ],
+)
+def test_given_file_which_cannot_be_split_when_get_byte_ranges_then_return_none(
+    uri: str, csv_format: CsvFormat
+) -> None:
+    config = FileBasedStreamConfig(name="test", globs=["*"], format=csv_format)
+    content = b"id,text\n" + _csv_content_with_quoted_newlines()
+
+    assert (
+        CsvParser().get_byte_ranges(
+            config,
+            RemoteFile(uri=uri, last_modified=datetime.now()),
+            _binary_stream_reader(content),
+            logger,
+            partition_size=1000,
+        )
+        is None
+    )
+
+
+def test_given_quoted_value_longer_than_partitions_when_get_byte_ranges_then_do_not_split_it() -> (
+    None
+):
+    config = FileBasedStreamConfig(
+        name="test", globs=["*"], format=CsvFormat(), validation_policy="Emit Record"
+    )
+    content = io.StringIO()
+    writer = csv.writer(content)
+    writer.writerow(["id", "text"])
+    writer.writerow([0, "short"])
+    writer.writerow([1, "\n".join(f"line {i}, not a record" for i in range(25_000))])
+    for i in range(2, 10_000):
+        writer.writerow([i, "short"])
+    data = content.getvalue().encode("utf-8")
+    file = RemoteFile(uri="a.csv", last_modified=datetime.now())
+    parser = CsvParser()
+
+    byte_ranges = parser.get_byte_ranges(
+        config, file, _binary_stream_reader(data), logger, partition_size=200_000
+    )
+
+    # the quoted value spans several partition sizes and ends in the first range
+    assert byte_ranges is not None and len(byte_ranges) == 2
+    assert byte_ranges[0].end > data.index(b"line 24999")
+    records = [
+        record
+        for byte_range in byte_ranges
+        for record in parser.parse_records(
+            config,
+            file,
+            ByteRangeStreamReader(_binary_stream_reader(data), byte_range),
+            logger,
+            None,
+        )
+    ]
+    assert records == list(
+        parser.parse_records(config, file, _binary_stream_reader(data), logger, None)
+    )
+
+
+def test_given_file_smaller_than_partition_size_when_get_byte_ranges_then_return_none() -> None:
+    config = FileBasedStreamConfig(name="test", globs=["*"], format=CsvFormat())
+
+    assert (
+        CsvParser().get_byte_ranges(
+            config,
+            RemoteFile(uri="a.csv", last_modified=datetime.now()),
+            _binary_stream_reader(b"id,text\n1,a\n"),
+            logger,
+            partition_size=1000,
+        )
+        is None
+    )
+
+
+def test_parse_records_is_equivalent_to_casting_dictionaries() -> None:
+    columns = ["integer", "number", "boolean", "string", "null"]
+    rows = ["1,1.5,true,a string,", "x,,maybe,,NULL", '2,-3e2,false,"quoted, value",x'] * 100
+    csv_content = "\n".join([",".join(columns)] + rows)
+    config = FileBasedStreamConfig(
+        name="test",
+        validation_policy="Emit Record",
+        file_type="csv",
+        format=CsvFormat(null_values={"NULL"}),
+    )
+    discovered_schema = {"properties": {column: {"type": column} for column in columns}}
+    property_types = {column: column for column in columns}
+    file = RemoteFile(uri="s3://bucket/key.csv", last_modified=datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=io.StringIO(csv_content))
+    expected = [
+        _cast_and_nullify(row, property_types, config.format, logger, False)
+        for row in _CsvReader().read_data(config, file, stream_reader, logger, FileReadMode.READ)
+    ]
+
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=io.StringIO(csv_content))
+    records = list(
+        CsvParser().parse_records(config, file, stream_reader, logger, discovered_schema)
+    )
+
+    assert records == expected
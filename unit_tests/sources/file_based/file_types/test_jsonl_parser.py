@@ -5,14 +5,21 @@
 import asyncio
 import io
 import json
-from typing import Any, Dict
-from unittest.mock import MagicMock, Mock
+from datetime import datetime
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, Mock, patch
 
+import orjson
 import pytest
 
+from airbyte_cdk.sources.file_based.byte_range import ByteRangeStreamReader
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
-from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader
+from airbyte_cdk.sources.file_based.file_based_stream_reader import (
+    AbstractFileBasedStreamReader,
+    FileReadMode,
+)
 from airbyte_cdk.sources.file_based.file_types import JsonlParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
 JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS = [
     b'{"a": 1, "b": "1"}',
@@ -201,3 +208,162 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def _binary_stream_reader(content: bytes) -> Mock:
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(content)
+        if mode == FileReadMode.READ_BINARY
+        else io.TextIOWrapper(io.BytesIO(content), encoding=encoding)
+    )
+    return stream_reader
+
+
+def test_given_byte_ranges_when_parse_records_then_records_are_the_same_as_for_the_whole_file() -> (
+    None
+):
+    content = b"".join(
+        b'{"a": %d,\n "b": {\n"c": "multiline"}}\n' % i
+        if i % 5 == 0
+        else b'{"a": %d, "b": {"c": "line"}}\n' % i
+        for i in range(500)
+    )
+    file = RemoteFile(uri="a.jsonl", last_modified=datetime.now())
+    parser = JsonlParser()
+
+    byte_ranges = parser.get_byte_ranges(
+        Mock(), file, _binary_stream_reader(content), Mock(), partition_size=1000
+    )
+
+    assert byte_ranges is not None and len(byte_ranges) > 2
+    assert byte_ranges[-1].end == len(content)
+    records = [
+        record
+        for byte_range in byte_ranges
+        for record in parser.parse_records(
+            Mock(),
+            file,
+            ByteRangeStreamReader(_binary_stream_reader(content), byte_range),
+            Mock(),
+            None,
+        )
+    ]
+    assert records == list(
+        parser.parse_records(Mock(), file, _binary_stream_reader(content), Mock(), None)
+    )
+
+
+def test_given_no_record_boundary_when_get_byte_ranges_then_return_none() -> None:
+    content = b"\n".join(JSONL_CONTENT_WITH_MULTILINE_JSON_OBJECTS * 100)
+
+    assert (
+        JsonlParser().get_byte_ranges(
+            Mock(),
+            RemoteFile(uri="a.jsonl", last_modified=datetime.now()),
+            _binary_stream_reader(content),
+            Mock(),
+            partition_size=100,
+        )
+        is None
+    )
+
+
+def test_given_compressed_file_when_get_byte_ranges_then_return_none() -> None:
+    content = b"\n".join(JSONL_CONTENT_WITHOUT_MULTILINE_JSON_OBJECTS * 100)
+
+    assert (
+        JsonlParser().get_byte_ranges(
+            Mock(),
+            RemoteFile(uri="a.jsonl.gz", last_modified=datetime.now()),
+            _binary_stream_reader(content),
+            Mock(),
+            partition_size=100,
+        )
+        is None
+    )
+
+
+def _parse_by_reparsing_accumulated_lines(lines: List[Any]) -> List[Any]:
+    """
+    Parse the lines the way the parser did before tracking brackets: the accumulated lines are parsed after each line.
+    """
+    records = []
+    accumulator = lines[0][:0] if lines else ""
+    for line in lines:
+        accumulator += line
+        try:
+            records.append(orjson.loads(accumulator))
+            accumulator = line[:0]
+        except orjson.JSONDecodeError:
+            pass
+    return records
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param('{"a": 1}\n{"a": 2}\n', id="test_one_object_per_line"),
+        pytest.param('{\n  "a": 1,\n  "b": "}{]["\n}\n{"a": 2}\n', id="test_brackets_in_strings"),
+        pytest.param('{\n  "a": "\\"}",\n  "b": ["\\\\", {}]\n}\n', id="test_escaped_quotes"),
+        pytest.param('[\n1,\n2\n]\n"a string"\n3\n', id="test_arrays_and_scalars"),
+        pytest.param('\n\n{"a": 1}\n\n  \n{\n"a": 2}\n', id="test_blank_lines"),
+        pytest.param('{"a": 1}\nnot json\n{"a": 2}\n', id="test_invalid_line"),
+        pytest.param(
+            '{"a": 1}\n{"a": "multiline\nstring"}\n{"a": 2}\n', id="test_multiline_string"
+        ),
+        pytest.param('{"a": 1}\n]\n{"a": 2}\n', id="test_unbalanced_bracket"),
+        pytest.param('{"a": 1}\n{\n"a": 2', id="test_incomplete_object"),
+    ],
+)
+@pytest.mark.parametrize("binary", [True, False])
+def test_parse_records_is_equivalent_to_reparsing_accumulated_lines(
+    stream_reader: MagicMock, content: str, binary: bool
+) -> None:
+    lines = io.StringIO(content).readlines()
+    if binary:
+        lines = [line.encode("utf-8") for line in lines]
+    stream_reader.open_file.return_value.__enter__.return_value = lines
+    expected_records = _parse_by_reparsing_accumulated_lines(lines)
+
+    if expected_records:
+        records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+        assert records == expected_records
+    else:
+        with pytest.raises(RecordParseError):
+            list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+
+def test_given_concatenated_json_objects_when_parse_records_then_return_each_object(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO(
+        '{"a": 1}{"a": 2} {"a": 3}\n{"a":\n 4}[5]\n'
+    )
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [{"a": 1}, {"a": 2}, {"a": 3}, {"a": 4}, [5]]
+
+
+def test_given_multiline_json_objects_when_parse_records_then_lines_are_not_parsed_again_for_each_line(
+    stream_reader: MagicMock,
+) -> None:
+    record = {f"key_{i}": {"value": i, "text": "some text"} for i in range(200)}
+    content = "".join(json.dumps(record, indent=2) + "\n" for _ in range(3))
+    lines = io.StringIO(content).readlines()
+    stream_reader.open_file.return_value.__enter__.return_value = lines
+    expected_records = _parse_by_reparsing_accumulated_lines(lines)
+    parsed_sizes = []
+    loads = orjson.loads
+
+    def _loads(value: Any) -> Any:
+        parsed_sizes.append(len(value))
+        return loads(value)
+
+    with patch("orjson.loads", side_effect=_loads):
+        records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == expected_records
+    # reparsing the accumulated lines after each line would parse about `len(lines) / 2` times the content
+    assert sum(parsed_sizes) < 2 * len(content)
@@ -4,11 +4,14 @@
 
 import asyncio
 import datetime
+import decimal
+import io
 import math
-from typing import Any, Mapping, Union
+from typing import Any, Dict, Iterable, List, Mapping, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pyarrow import Scalar
 
@@ -19,6 +22,7 @@ from airbyte_cdk.sources.file_based.config.file_based_stream_config import (
 )
 from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
 from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
+from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_types import ParquetParser
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 
@@ -517,3 +521,272 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
         asyncio.get_event_loop().run_until_complete(
             parser.infer_schema(config, file, stream_reader, logger)
         )
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> io.BytesIO:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    buffer.seek(0)
+    return buffer
+
+
+def _parse_records(
+    table: pa.Table,
+    parquet_format: ParquetFormat,
+    row_group_size: int = 7,
+    uri: str = "s3://mybucket/year=2024/test.parquet",
+) -> Iterable[Dict[str, Any]]:
+    config = FileBasedStreamConfig(
+        name="test", format=parquet_format, validation_policy=ValidationPolicy.emit_record
+    )
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(
+        return_value=_parquet_file(table, row_group_size)
+    )
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+    return ParquetParser().parse_records(config, file, stream_reader, Mock(), None)
+
+
+def _parse_records_value_by_value(
+    table: pa.Table, parquet_format: ParquetFormat, row_group_size: int = 7
+) -> List[Dict[str, Any]]:
+    table = pq.read_table(_parquet_file(table, row_group_size))
+    return [
+        {
+            **{
+                column: ParquetParser._to_output_value(table.column(column)[row], parquet_format)
+                for column in table.column_names
+            },
+            "year": "2024",
+        }
+        for row in range(table.num_rows)
+    ]
+
+
+def _table_with_all_types(num_rows: int) -> pa.Table:
+    def values(value_at: Any) -> List[Any]:
+        # every third value is null
+        return [None if row % 3 == 2 else value_at(row) for row in range(num_rows)]
+
+    return pa.table(
+        {
+            "bool": pa.array(values(lambda row: row % 2 == 0), type=pa.bool_()),
+            "int": pa.array(values(lambda row: row), type=pa.int64()),
+            "float": pa.array(values(lambda row: row / 3), type=pa.float64()),
+            "string": pa.array(values(lambda row: f"value {row}"), type=pa.string()),
+            "binary": pa.array(values(lambda row: f"bytes {row}".encode()), type=pa.binary()),
+            "time": pa.array(
+                values(lambda row: datetime.time(1, 2, row % 60)), type=pa.time64("us")
+            ),
+            "timestamp": pa.array(
+                values(lambda row: datetime.datetime(2024, 1, 1, 0, 0, row % 60)),
+                type=pa.timestamp("ms"),
+            ),
+            "timestamp_tz": pa.array(
+                values(lambda row: datetime.datetime(2024, 1, 1, 0, 0, row % 60)),
+                type=pa.timestamp("us", "utc"),
+            ),
+            "date": pa.array(
+                values(lambda row: datetime.date(2024, 1, 1 + row % 28)), type=pa.date32()
+            ),
+            "duration": pa.array(
+                values(lambda row: datetime.timedelta(seconds=row)), type=pa.duration("ms")
+            ),
+            "decimal": pa.array(
+                values(lambda row: decimal.Decimal(row) / 4), type=pa.decimal128(10, 2)
+            ),
+            "dictionary": pa.array(
+                values(lambda row: ["apple", "banana"][row % 2]),
+                type=pa.dictionary(pa.int32(), pa.string()),
+            ),
+            "map": pa.array(
+                values(lambda row: {"key": row}), type=pa.map_(pa.string(), pa.int32())
+            ),
+            "struct": pa.array(
+                values(lambda row: {"timestamp": datetime.datetime(2024, 1, 1), "binary": b"a"}),
+                type=pa.struct(
+                    [pa.field("timestamp", pa.timestamp("s")), pa.field("binary", pa.binary())]
+                ),
+            ),
+            "list": pa.array(values(lambda row: [row, row + 1]), type=pa.list_(pa.int32())),
+            "null": pa.array([None] * num_rows, type=pa.null()),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "parquet_format",
+    [
+        pytest.param(_default_parquet_format, id="test_default_format"),
+        pytest.param(_decimal_as_float_parquet_format, id="test_decimal_as_float"),
+    ],
+)
+def test_parse_records_converts_values_as_value_by_value(
+    parquet_format: ParquetFormat, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # batches smaller than row groups so that row groups are read in several batches
+    monkeypatch.setattr(ParquetParser, "BATCH_SIZE", 3)
+    table = _table_with_all_types(num_rows=20)
+
+    records = list(_parse_records(table, parquet_format))
+
+    assert records == _parse_records_value_by_value(table, parquet_format)
+    assert records[0]["dictionary"] == "apple"
+    assert records[0]["binary"] == "bytes 0"
+    assert records[0]["year"] == "2024"
+
+
+def test_parse_records_partition_columns_override_file_columns() -> None:
+    table = pa.table({"year": ["1999"], "id": [1]})
+
+    records = list(_parse_records(table, _default_parquet_format))
+
+    assert records == [{"year": "2024", "id": 1}]
+
+
+def test_parse_records_error_references_row_group() -> None:
+    table = pa.table({"binary": pa.array([b"a", b"\xff"], type=pa.binary())})
+
+    with pytest.raises(RecordParseError) as error:
+        list(_parse_records(table, _default_parquet_format, row_group_size=1))
+
+    assert "row_group=1" in str(error.value)
+
+
+@pytest.mark.parametrize(
+    "selected_columns, validation_policy, schemaless, expected_columns",
+    [
+        pytest.param(
+            ["int", "struct", "_ab_source_file_url"],
+            ValidationPolicy.emit_record,
+            False,
+            ["int", "struct", "year"],
+            id="test_only_selected_columns_are_read",
+        ),
+        pytest.param(
+            ["_ab_source_file_url"],
+            ValidationPolicy.emit_record,
+            False,
+            ["year"],
+            id="test_no_column_of_the_file_selected",
+        ),
+        pytest.param(
+            ["int"],
+            ValidationPolicy.skip_record,
+            False,
+            ["int", "string", "struct", "year"],
+            id="test_validating_policy_reads_all_columns",
+        ),
+        pytest.param(
+            ["data"],
+            ValidationPolicy.emit_record,
+            True,
+            ["int", "string", "struct", "year"],
+            id="test_schemaless_reads_all_columns",
+        ),
+    ],
+)
+def test_parse_records_column_projection(
+    selected_columns: List[str],
+    validation_policy: ValidationPolicy,
+    schemaless: bool,
+    expected_columns: List[str],
+) -> None:
+    table = pa.table(
+        {
+            "int": [1, 2],
+            "string": ["a", "b"],
+            "struct": pa.array([{"x": 1}, {"x": 2}]),
+        }
+    )
+    discovered_schema = {
+        "type": "object",
+        "properties": {column: {} for column in selected_columns},
+    }
+    config = FileBasedStreamConfig(
+        name="test",
+        format=_default_parquet_format,
+        validation_policy=validation_policy,
+        schemaless=schemaless,
+    )
+    file = RemoteFile(
+        uri="s3://mybucket/year=2024/test.parquet", last_modified=datetime.datetime.now()
+    )
+    stream_reader = Mock()
+    stream_reader.open_file.return_value.__enter__ = Mock(return_value=_parquet_file(table, 1))
+    stream_reader.open_file.return_value.__exit__ = Mock(return_value=None)
+
+    records = list(
+        ParquetParser().parse_records(config, file, stream_reader, Mock(), discovered_schema)
+    )
+
+    all_columns = [
+        {"int": 1, "string": "a", "struct": {"x": 1}, "year": "2024"},
+        {"int": 2, "string": "b", "struct": {"x": 2}, "year": "2024"},
+    ]
+    assert records == [
+        {column: record[column] for column in expected_columns} for record in all_columns
+    ]
+
+
+@pytest.mark.parametrize(
+    "pyarrow_type, values",
+    [
+        pytest.param(pa.bool_(), [True, None, False], id="test_bool"),
+        pytest.param(pa.int8(), [-1, None, 2], id="test_int8"),
+        pytest.param(pa.uint64(), [2**64 - 1, None, 0], id="test_uint64"),
+        pytest.param(pa.float32(), [0.1, None, 2.5], id="test_float32"),
+        pytest.param(pa.float64(), [0.1, None, math.inf], id="test_float64"),
+        pytest.param(pa.string(), ["a", None, ""], id="test_string"),
+        pytest.param(pa.large_string(), ["a", None, ""], id="test_large_string"),
+        pytest.param(pa.binary(), [b"a", None, b""], id="test_binary"),
+        pytest.param(
+            pa.timestamp("s"),
+            [datetime.datetime(2024, 1, 1, 1, 2, 3), None, datetime.datetime(1970, 1, 1)],
+            id="test_timestamp_s",
+        ),
+        pytest.param(
+            pa.timestamp("us"),
+            [datetime.datetime(2024, 1, 1, 1, 2, 3, 4), None, datetime.datetime(1, 1, 1)],
+            id="test_timestamp_us",
+        ),
+        pytest.param(
+            pa.timestamp("ms", "utc"),
+            [datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc), None],
+            id="test_timestamp_with_tz",
+        ),
+        pytest.param(pa.date32(), [datetime.date(2024, 1, 2), None], id="test_date32"),
+        pytest.param(pa.date64(), [datetime.date(2024, 1, 2), None], id="test_date64"),
+        pytest.param(
+            pa.dictionary(pa.int32(), pa.string()), ["a", None, "b", "a"], id="test_dictionary"
+        ),
+        pytest.param(
+            pa.dictionary(pa.int32(), pa.binary()), [b"a", None, b"b"], id="test_binary_dictionary"
+        ),
+        pytest.param(pa.list_(pa.int32()), [[1, None], None, [], [3]], id="test_list"),
+        pytest.param(
+            pa.large_list(pa.list_(pa.string())),
+            [[["a"], None], None, [[]], [["b", None]]],
+            id="test_nested_list",
+        ),
+        pytest.param(
+            pa.map_(pa.string(), pa.int32()),
+            [[("a", 1)], None, [], [("b", None), ("c", 3)]],
+            id="test_map",
+        ),
+        pytest.param(
+            pa.struct([pa.field("int", pa.int32()), pa.field("list", pa.list_(pa.string()))]),
+            [{"int": 1, "list": ["a"]}, None, {"int": None, "list": None}],
+            id="test_struct",
+        ),
+        pytest.param(pa.struct([]), [{}, None, {}], id="test_empty_struct"),
+    ],
+)
+@pytest.mark.parametrize("offset", [0, 1])
+def test_to_python_values_is_equivalent_to_to_pylist(
+    pyarrow_type: pa.DataType, values: List[Any], offset: int
+) -> None:
+    parquet_values = pa.array(values, type=pyarrow_type).slice(offset)
+
+    assert ParquetParser._to_python_values(parquet_values) == parquet_values.to_pylist()
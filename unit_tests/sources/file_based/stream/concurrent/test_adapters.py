@@ -14,6 +14,7 @@ from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources.file_based.availability_strategy import (
     DefaultFileBasedAvailabilityStrategy,
 )
+from airbyte_cdk.sources.file_based.byte_range import ByteRange
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.discovery_policy import DefaultDiscoveryPolicy
@@ -27,7 +28,10 @@ from airbyte_cdk.sources.file_based.stream.concurrent.adapters import (
     FileBasedStreamPartition,
     FileBasedStreamPartitionGenerator,
 )
-from airbyte_cdk.sources.file_based.stream.concurrent.cursor import FileBasedFinalStateCursor
+from airbyte_cdk.sources.file_based.stream.concurrent.cursor import (
+    FileBasedConcurrentCursor,
+    FileBasedFinalStateCursor,
+)
 from airbyte_cdk.sources.message import InMemoryMessageRepository
 from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
 from airbyte_cdk.sources.streams.concurrent.exceptions import ExceptionWithDisplayMessage
@@ -70,6 +74,89 @@ def test_file_based_stream_partition_generator(sync_mode):
     )
 
 
+def test_given_byte_range_partition_size_when_generate_then_create_a_partition_per_byte_range():
+    stream = Mock()
+    split_file = RemoteFile(uri="1", last_modified=datetime.now())
+    whole_file = RemoteFile(uri="2", last_modified=datetime.now())
+    stream.stream_slices.return_value = [{"files": [split_file, whole_file]}]
+    byte_ranges = [ByteRange(start=0, end=10), ByteRange(start=10, end=20, prefix_end=5)]
+    stream.get_byte_ranges.side_effect = lambda file, partition_size: (
+        byte_ranges if file.uri == "1" else None
+    )
+
+    partition_generator = FileBasedStreamPartitionGenerator(
+        stream,
+        Mock(),
+        _ANY_SYNC_MODE,
+        _ANY_CURSOR_FIELD,
+        _ANY_STATE,
+        _ANY_CURSOR,
+        byte_range_partition_size=10,
+    )
+
+    slices = [partition.to_slice() for partition in partition_generator.generate()]
+    assert slices == [
+        {"files": [split_file], "byte_range": byte_ranges[0]},
+        {"files": [split_file], "byte_range": byte_ranges[1]},
+        {"files": [whole_file]},
+    ]
+    stream.get_byte_ranges.assert_any_call(split_file, 10)
+
+
+def test_given_byte_range_partition_size_when_generate_then_split_each_file_once_its_partitions_are_needed():
+    stream = Mock()
+    files = [RemoteFile(uri=uri, last_modified=datetime.now()) for uri in ["1", "2"]]
+    stream.stream_slices.return_value = [{"files": files}]
+    stream.get_byte_ranges.return_value = [
+        ByteRange(start=0, end=10),
+        ByteRange(start=10, end=20, prefix_end=5),
+    ]
+    cursor = Mock(spec=FileBasedConcurrentCursor)
+
+    partitions = FileBasedStreamPartitionGenerator(
+        stream,
+        Mock(),
+        _ANY_SYNC_MODE,
+        _ANY_CURSOR_FIELD,
+        _ANY_STATE,
+        cursor,
+        byte_range_partition_size=10,
+    ).generate()
+
+    first_partition = next(partitions)
+    assert first_partition.to_slice()["files"] == [files[0]]
+    assert [
+        partition.to_slice() for partition in cursor.set_pending_partitions.call_args.args[0]
+    ] == [{"files": [file]} for file in files]
+    stream.get_byte_ranges.assert_called_once_with(files[0], 10)
+    cursor.set_pending_byte_ranges.assert_called_once_with(files[0], 2)
+
+    assert len(list(partitions)) == 3
+    cursor.set_pending_byte_ranges.assert_called_with(files[1], 2)
+
+
+def test_given_byte_ranges_cannot_be_computed_when_generate_then_read_whole_file():
+    stream = Mock()
+    file = RemoteFile(uri="1", last_modified=datetime.now())
+    stream.stream_slices.return_value = [{"files": [file]}]
+    stream.get_byte_ranges.side_effect = OSError("connection reset")
+
+    partition_generator = FileBasedStreamPartitionGenerator(
+        stream,
+        Mock(),
+        _ANY_SYNC_MODE,
+        _ANY_CURSOR_FIELD,
+        _ANY_STATE,
+        _ANY_CURSOR,
+        byte_range_partition_size=10,
+    )
+
+    assert [partition.to_slice() for partition in partition_generator.generate()] == [
+        {"files": [file]}
+    ]
+    stream.logger.warning.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "transformer, expected_records",
     [
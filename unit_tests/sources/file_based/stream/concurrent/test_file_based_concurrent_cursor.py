@@ -587,3 +587,78 @@ def test_compute_start_time(input_history, is_history_full, expected_start_time,
     cursor._file_to_datetime_history = input_history
     cursor._is_history_full = MagicMock(return_value=is_history_full)
     assert cursor._compute_start_time() == expected_start_time
+
+
+def test_given_file_read_in_byte_ranges_when_add_file_then_add_file_once_all_ranges_are_read():
+    cursor = _make_cursor({"history": {}})
+    mock_message_repository = MagicMock()
+    cursor._message_repository = mock_message_repository
+    file = RemoteFile(
+        uri="a.csv",
+        last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT),
+    )
+    cursor.set_pending_partitions(
+        [
+            FileBasedStreamPartition(
+                MagicMock(),
+                {"files": [file]},
+                mock_message_repository,
+                SyncMode.full_refresh,
+                FileBasedConcurrentCursor.CURSOR_FIELD,
+                {"history": {}},
+            )
+        ]
+    )
+    cursor.set_pending_byte_ranges(file, 2)
+
+    cursor.add_file(file)
+    assert cursor._file_to_datetime_history == {}
+    assert cursor._pending_files == {"a.csv": file}
+    mock_message_repository.emit_message.assert_not_called()
+
+    cursor.add_file(file)
+    assert cursor._file_to_datetime_history == {"a.csv": "2021-01-01T00:00:00.000000Z"}
+    assert cursor._pending_files == {}
+    assert (
+        mock_message_repository.emit_message.call_args_list[0]
+        .args[0]
+        .state.stream.stream_state._ab_source_file_last_modified
+        == "2021-01-01T00:00:00.000000Z_a.csv"
+    )
+
+
+def test_given_same_file_in_several_partitions_when_set_pending_partitions_then_raise():
+    cursor = _make_cursor({"history": {}})
+    file = RemoteFile(
+        uri="a.csv",
+        last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT),
+    )
+
+    with pytest.raises(RuntimeError):
+        cursor.set_pending_partitions(
+            [
+                FileBasedStreamPartition(
+                    MagicMock(),
+                    {"files": [file]},
+                    MagicMock(),
+                    SyncMode.full_refresh,
+                    FileBasedConcurrentCursor.CURSOR_FIELD,
+                    {"history": {}},
+                )
+                for _ in range(2)
+            ]
+        )
+
+
+def test_given_file_not_pending_when_set_pending_byte_ranges_then_raise():
+    cursor = _make_cursor({"history": {}})
+    cursor.set_pending_partitions([])
+
+    with pytest.raises(RuntimeError):
+        cursor.set_pending_byte_ranges(
+            RemoteFile(
+                uri="a.csv",
+                last_modified=datetime.strptime("2021-01-01T00:00:00.000000Z", DATE_TIME_FORMAT),
+            ),
+            2,
+        )
@@ -24,6 +24,7 @@ from airbyte_cdk.sources.file_based import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.availability_strategy import (
     AbstractFileBasedAvailabilityStrategy,
 )
+from airbyte_cdk.sources.file_based.byte_range import ByteRange, ByteRangeStreamReader
 from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
 from airbyte_cdk.sources.file_based.exceptions import (
     DuplicatedFilesError,
@@ -126,6 +127,21 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         )
         assert list(map(lambda message: message.record.data["data"], messages)) == [self._A_RECORD]
 
+    def test_given_byte_range_when_read_records_from_slice_then_parse_byte_range(self) -> None:
+        self._parser.parse_records.return_value = [self._A_RECORD]
+        file = RemoteFile(uri="uri", last_modified=self._NOW)
+
+        list(
+            self._stream.read_records_from_slice(
+                {"files": [file], "byte_range": ByteRange(start=10, end=20)}
+            )
+        )
+
+        stream_reader = self._parser.parse_records.call_args.args[2]
+        assert isinstance(stream_reader, ByteRangeStreamReader)
+        assert stream_reader._byte_range == ByteRange(start=10, end=20)
+        self._cursor.add_file.assert_called_once_with(file)
+
     def test_when_transform_record_then_return_updated_record(self) -> None:
         file = RemoteFile(uri="uri", last_modified=self._NOW)
         last_updated = self._NOW.isoformat()
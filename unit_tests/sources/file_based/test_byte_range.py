@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import logging
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.sources.file_based.byte_range import (
+    ByteRange,
+    ByteRangeStreamReader,
+    is_splittable,
+    to_byte_ranges,
+)
+from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_FILE = RemoteFile(uri="a.csv", last_modified=datetime(2025, 1, 1))
+_LOGGER = logging.getLogger("test")
+
+
+def _stream_reader(data: bytes) -> Mock:
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: io.BytesIO(data)
+    return stream_reader
+
+
+@pytest.mark.parametrize(
+    "uri, expected_is_splittable",
+    [
+        pytest.param("a.csv", True, id="uncompressed"),
+        pytest.param("a.jsonl", True, id="uncompressed-jsonl"),
+        pytest.param("a.csv.gz", False, id="gzip"),
+        pytest.param("a.JSONL.ZST", False, id="zstd-uppercase"),
+        pytest.param("a.zip", False, id="zip"),
+    ],
+)
+def test_is_splittable(uri: str, expected_is_splittable: bool) -> None:
+    assert is_splittable(RemoteFile(uri=uri, last_modified=datetime(2025, 1, 1))) is (
+        expected_is_splittable
+    )
+
+
+def test_to_byte_ranges() -> None:
+    assert to_byte_ranges([10, 25], 40, prefix_end=4) == [
+        ByteRange(start=0, end=10),
+        ByteRange(start=10, end=25, prefix_end=4),
+        ByteRange(start=25, end=40, prefix_end=4),
+    ]
+
+
+def test_given_byte_range_when_open_file_then_read_prefix_followed_by_range() -> None:
+    stream_reader = _stream_reader(b"header\nrow1\nrow2\nrow3\n")
+    byte_range_stream_reader = ByteRangeStreamReader(
+        stream_reader, ByteRange(start=12, end=17, prefix_end=7)
+    )
+
+    with byte_range_stream_reader.open_file(_FILE, FileReadMode.READ, "utf8", _LOGGER) as fp:
+        assert fp.readline() == "header\n"
+        assert fp.read() == "row2\n"
+        fp.seek(0)
+        assert fp.read() == "header\nrow2\n"
+
+    stream_reader.open_file.assert_called_once_with(_FILE, FileReadMode.READ_BINARY, None, _LOGGER)
+
+
+def test_given_first_byte_range_when_open_file_in_binary_mode_then_read_range_only() -> None:
+    byte_range_stream_reader = ByteRangeStreamReader(
+        _stream_reader(b"row1\nrow2\n"), ByteRange(start=0, end=5)
+    )
+
+    with byte_range_stream_reader.open_file(_FILE, FileReadMode.READ_BINARY, None, _LOGGER) as fp:
+        assert fp.read() == b"row1\n"
+
+
+def test_when_close_then_close_underlying_file() -> None:
+    underlying_file = io.BytesIO(b"row1\nrow2\n")
+    stream_reader = Mock()
+    stream_reader.open_file.return_value = underlying_file
+    byte_range_stream_reader = ByteRangeStreamReader(stream_reader, ByteRange(start=5, end=10))
+
+    with byte_range_stream_reader.open_file(_FILE, FileReadMode.READ, "utf8", _LOGGER) as fp:
+        assert fp.read() == "row2\n"
+
+    assert underlying_file.closed
@@ -0,0 +1,82 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+
+from collections import OrderedDict
+
+import pytest
+
+from airbyte_cdk.sources.streams.checkpoint.per_partition_key_serializer import (
+    InternedPartitionKeySerializer,
+    PerPartitionKeySerializer,
+)
+
+PARTITION = {
+    "partition_key": "first_partition",
+    "parent_slice": {"parent_id": 42, "parent_slice": {}},
+    "values": [1, "2", None],
+}
+
+
+def test_partition_serialization():
+    serializer = InternedPartitionKeySerializer()
+    assert serializer.to_partition(serializer.to_partition_key(PARTITION)) == PARTITION
+
+
+def test_partition_with_different_key_orders():
+    serializer = InternedPartitionKeySerializer()
+
+    assert serializer.to_partition_key(
+        OrderedDict({"1": 1, "2": 2})
+    ) == serializer.to_partition_key(OrderedDict({"2": 2, "1": 1}))
+
+
+def test_given_equal_partitions_then_key_is_interned():
+    serializer = InternedPartitionKeySerializer()
+
+    assert serializer.to_partition_key(dict(PARTITION)) is serializer.to_partition_key(
+        dict(PARTITION)
+    )
+
+
+@pytest.mark.parametrize(
+    "first_partition, second_partition",
+    [
+        pytest.param({"id": 1}, {"id": "1"}, id="int_and_string"),
+        pytest.param({"id": 1}, {"id": 1.0}, id="int_and_float"),
+        pytest.param({"id": 1}, {"id": True}, id="int_and_bool"),
+        pytest.param({"id": {"a": 1}}, {"id": [["a", 1]]}, id="dict_and_list_of_items"),
+        pytest.param({"id": []}, {"id": {}}, id="empty_list_and_empty_dict"),
+    ],
+)
+def test_given_partitions_with_different_json_then_keys_are_different(
+    first_partition, second_partition
+):
+    serializer = InternedPartitionKeySerializer()
+
+    assert serializer.to_partition_key(first_partition) != serializer.to_partition_key(
+        second_partition
+    )
+
+
+def test_given_tuples_in_partition_then_partition_is_the_same_as_json_serializer():
+    serializer = InternedPartitionKeySerializer()
+    partition_with_tuple = {"key": (1, 2, 3)}
+
+    assert serializer.to_partition_key(partition_with_tuple) == serializer.to_partition_key(
+        {"key": [1, 2, 3]}
+    )
+    assert serializer.to_partition(
+        serializer.to_partition_key(partition_with_tuple)
+    ) == PerPartitionKeySerializer.to_partition(
+        PerPartitionKeySerializer.to_partition_key(partition_with_tuple)
+    )
+
+
+def test_given_released_key_when_to_partition_then_raise():
+    serializer = InternedPartitionKeySerializer()
+    partition_key = serializer.to_partition_key(PARTITION)
+
+    serializer.release(partition_key)
+
+    with pytest.raises(KeyError):
+        serializer.to_partition(partition_key)
+    assert serializer.to_partition(serializer.to_partition_key(PARTITION)) == PARTITION
@@ -0,0 +1,28 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+from queue import Queue
+from typing import Callable, List
+
+import pytest
+
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    QueueItem,
+)
+
+
+@pytest.fixture
+def consume_queue() -> Callable[[Queue[QueueItem]], List[QueueItem]]:
+    def _consume_queue(queue: Queue[QueueItem]) -> List[QueueItem]:
+        """
+        Returns the items of the queue up to the first PartitionCompleteSentinel
+        """
+        queue_content = []
+        while queue_item := queue.get():
+            queue_content.append(queue_item)
+            if isinstance(queue_item, PartitionCompleteSentinel):
+                break
+        return queue_content
+
+    return _consume_queue
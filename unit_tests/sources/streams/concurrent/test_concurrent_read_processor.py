@@ -30,6 +30,7 @@ from airbyte_cdk.sources.concurrent_source.stream_thread_exception import Stream
 from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.message import LogMessage, MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
@@ -44,6 +45,28 @@ _ANY_AIRBYTE_MESSAGE = Mock(spec=AirbyteMessage)
 _IS_SUCCESSFUL = True
 
 
+class _ObservingCursor(Cursor):
+    """
+    A cursor only implementing the abstract methods, as cursors implemented outside of the CDK do.
+    """
+
+    def __init__(self) -> None:
+        self.observed_records = []
+
+    @property
+    def state(self):
+        return {}
+
+    def observe(self, record):
+        self.observed_records.append(record)
+
+    def close_partition(self, partition):
+        pass
+
+    def ensure_at_least_one_state_emitted(self):
+        pass
+
+
 class TestConcurrentReadProcessor(unittest.TestCase):
     def setUp(self):
         self._partition_enqueuer = Mock(spec=PartitionEnqueuer)
@@ -179,7 +202,9 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         handler.on_partition(self._a_closed_partition)
 
         self._thread_pool_manager.submit.assert_called_with(
-            self._partition_reader.process_partition, self._a_closed_partition
+            self._partition_reader.process_partition,
+            self._a_closed_partition,
+            self._another_stream.cursor,
         )
         assert (
             self._a_closed_partition in handler._streams_to_running_partitions[_ANOTHER_STREAM_NAME]
@@ -204,7 +229,7 @@ class TestConcurrentReadProcessor(unittest.TestCase):
         handler.on_partition(self._an_open_partition)
 
         self._thread_pool_manager.submit.assert_called_with(
-            self._partition_reader.process_partition, self._an_open_partition
+            self._partition_reader.process_partition, self._an_open_partition, self._stream.cursor
         )
         self._message_repository.emit_message.assert_called_with(self._log_message)
 
@@ -255,6 +280,64 @@ class TestConcurrentReadProcessor(unittest.TestCase):
 
         self._stream.cursor.close_partition.assert_called_once()
 
+    def test_handle_on_partition_complete_sentinel_with_most_recent_record_then_observe_it_before_closing_partition(
+        self,
+    ):
+        partition = Mock(spec=Partition)
+        partition.stream_name.return_value = _STREAM_NAME
+        self._message_repository.consume_queue.return_value = []
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        handler.start_next_partition_generator()
+        handler.on_partition(partition)
+
+        list(
+            handler.on_partition_complete_sentinel(
+                PartitionCompleteSentinel(partition, most_recent_record=self._record)
+            )
+        )
+
+        assert self._stream.cursor.mock_calls == [
+            call.observe(self._record),
+            call.close_partition(partition),
+        ]
+
+    def test_handle_on_failed_partition_complete_sentinel_then_most_recent_record_is_not_observed(
+        self,
+    ):
+        partition = Mock(spec=Partition)
+        partition.stream_name.return_value = _STREAM_NAME
+        self._message_repository.consume_queue.return_value = []
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        handler.start_next_partition_generator()
+        handler.on_partition(partition)
+
+        list(
+            handler.on_partition_complete_sentinel(
+                PartitionCompleteSentinel(
+                    partition, is_successful=False, most_recent_record=self._record
+                )
+            )
+        )
+
+        self._stream.cursor.observe.assert_not_called()
+        self._stream.cursor.close_partition.assert_not_called()
+
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_handle_on_partition_complete_sentinel_yields_status_message_if_the_stream_is_done(
         self,
@@ -416,6 +499,58 @@ class TestConcurrentReadProcessor(unittest.TestCase):
             )
         ]
         assert messages == expected_messages
+        # the cursor observes the most recent record of the partition once the partition is completed
+        self._stream.cursor.observe.assert_not_called()
+
+    def test_on_record_emits_owned_data_without_copy(self):
+        self._message_repository.consume_queue.return_value = []
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        owned_record = Record(data={"id": 1}, stream_name=_STREAM_NAME, owned=True)
+        record = Record(data={"id": 2}, stream_name=_STREAM_NAME)
+
+        owned_record_message = list(handler.on_record(owned_record))[-1]
+        record_message = list(handler.on_record(record))[-1]
+
+        assert owned_record_message.record.data is owned_record.data
+        assert record_message.record.data is not record.data
+        assert record_message.record.data == record.data
+
+    def test_given_cursor_not_extracting_cursor_values_when_on_record_then_observe_every_record(
+        self,
+    ):
+        cursor = _ObservingCursor()
+        self._stream.cursor = cursor
+        self._message_repository.consume_queue.return_value = []
+        handler = ConcurrentReadProcessor(
+            [self._stream],
+            self._partition_enqueuer,
+            self._thread_pool_manager,
+            self._logger,
+            self._slice_logger,
+            self._message_repository,
+            self._partition_reader,
+        )
+        records = [Record(data={"id": i}, stream_name=_STREAM_NAME) for i in range(2)]
+        handler.start_next_partition_generator()
+        handler.on_partition(self._an_open_partition)
+
+        for record in records:
+            list(handler.on_record(record))
+        list(
+            handler.on_partition_complete_sentinel(
+                PartitionCompleteSentinel(self._an_open_partition, _IS_SUCCESSFUL)
+            )
+        )
+
+        assert cursor.observed_records == records
 
     @freezegun.freeze_time("2020-01-01T00:00:00")
     def test_on_record_with_repository_messge(self):
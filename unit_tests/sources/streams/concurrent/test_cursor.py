@@ -124,6 +124,27 @@ class ConcurrentCursorStateTest(TestCase):
 
         # did not raise
 
+    def test_given_cursor_value_when_extract_cursor_value_then_return_parsed_value(self) -> None:
+        cursor = self._cursor_without_slice_boundary_fields()
+
+        assert cursor.extract_cursor_value(
+            _record(10)
+        ) == EpochValueConcurrentStreamStateConverter().parse_value(10)
+
+    def test_given_no_cursor_value_when_extract_cursor_value_then_return_none(self) -> None:
+        cursor = self._cursor_without_slice_boundary_fields()
+
+        assert (
+            cursor.extract_cursor_value(
+                Record(
+                    data={"record_with_A_CURSOR_FIELD_KEY": "any value"},
+                    associated_slice=None,
+                    stream_name=_A_STREAM_NAME,
+                )
+            )
+            is None
+        )
+
     def test_given_boundary_fields_when_close_partition_then_emit_state(self) -> None:
         cursor = self._cursor_with_slice_boundary_fields()
         cursor.close_partition(
@@ -2,9 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from datetime import datetime, timezone
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import pytest
+from dateutil import parser
 
 from airbyte_cdk.sources.streams.concurrent.cursor import CursorField
 from airbyte_cdk.sources.streams.concurrent.state_converters.abstract_stream_state_converter import (
@@ -406,3 +410,127 @@ def test_given_when_parse_timestamp_then_eventually_fallback_on_output_format():
     parsed_datetime = converter.parse_timestamp("2024-01-01T02:00:00")
 
     assert parsed_datetime == datetime(2024, 1, 1, 2, 0, 0, tzinfo=timezone.utc)
+
+
+def test_given_format_matched_previous_timestamp_when_parse_timestamp_then_try_it_first():
+    input_formats = ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d"]
+    converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S", input_formats)
+    converter.parse_timestamp("2024-01-01")
+
+    with patch.object(converter._parser, "parse", wraps=converter._parser.parse) as parse:
+        parsed_datetime = converter.parse_timestamp("2024-01-02")
+
+    assert parsed_datetime == datetime(2024, 1, 2, tzinfo=timezone.utc)
+    parse.assert_called_once_with("2024-01-02", "%Y-%m-%d")
+
+
+def test_given_format_matched_previous_timestamp_does_not_match_when_parse_timestamp_then_try_other_formats():
+    input_formats = ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d"]
+    converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%S", input_formats)
+    converter.parse_timestamp("2024-01-01")
+
+    assert converter.parse_timestamp("2024-01-01T02:00:00.5") == datetime(
+        2024, 1, 1, 2, 0, 0, 500000, tzinfo=timezone.utc
+    )
+    assert converter.parse_timestamp("2024-01-01T02:00:00") == datetime(
+        2024, 1, 1, 2, 0, 0, tzinfo=timezone.utc
+    )
+    with pytest.raises(ValueError):
+        converter.parse_timestamp("01/01/2024")
+
+
+def _cursor_values(value_format: str, number_of_values: int) -> list:
+    # Records are usually sorted or close to sorted on their cursor and a few of them carry an unusual layout
+    random.seed(0)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    values = []
+    for _ in range(number_of_values):
+        start += timedelta(seconds=random.randint(0, 600), microseconds=random.randint(0, 999999))
+        values.append(start.strftime(value_format))
+    return values
+
+
+def test_iso_millis_parse_timestamp_is_equivalent_to_dateutil():
+    values = _cursor_values("%Y-%m-%dT%H:%M:%S.%fZ", 500)
+    values += _cursor_values("%Y-%m-%dT%H:%M:%S+00:00", 250)
+    values += _cursor_values("%Y-%m-%d %H:%M:%S", 250)
+    converter = IsoMillisConcurrentStreamStateConverter()
+
+    def _parse_with_dateutil(value: str) -> datetime:
+        # values without timezone are UTC
+        parsed = parser.parse(value)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    assert [converter.parse_timestamp(value) for value in values] == [
+        _parse_with_dateutil(value) for value in values
+    ]
+
+
+def test_custom_format_parse_timestamp_is_equivalent_to_trying_each_format_with_strptime():
+    input_formats = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%d"]
+    values = _cursor_values("%Y-%m-%dT%H:%M:%S.%fZ", 900) + _cursor_values("%Y-%m-%d", 100)
+    converter = CustomFormatConcurrentStreamStateConverter("%Y-%m-%dT%H:%M:%SZ", input_formats)
+
+    def _parse_with_strptime(value: str) -> datetime:
+        for input_format in input_formats:
+            try:
+                return datetime.strptime(value, input_format).replace(tzinfo=timezone.utc)
+            except ValueError:
+                pass
+        raise ValueError(value)
+
+    assert [converter.parse_timestamp(value) for value in values] == [
+        _parse_with_strptime(value) for value in values
+    ]
+
+
+@pytest.mark.slow
+def test_parse_timestamp_benchmark():
+    """
+    Reports the time per value of the converters over realistic distributions of cursor values, compared to dateutil and
+    to trying each input format with strptime. Timings vary too much between machines to be asserted on.
+    """
+    number_of_values = 100_000
+    iso_values = _cursor_values("%Y-%m-%dT%H:%M:%S.%fZ", number_of_values // 2)
+    iso_values += _cursor_values("%Y-%m-%dT%H:%M:%S+00:00", number_of_values // 4)
+    iso_values += _cursor_values("%Y-%m-%d %H:%M:%S", number_of_values // 4)
+    iso_converter = IsoMillisConcurrentStreamStateConverter()
+    input_formats = ["%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%d"]
+    # the values do not match the first input format so that every value used to try it first
+    custom_values = _cursor_values("%Y-%m-%dT%H:%M:%S.%fZ", number_of_values - 100)
+    custom_values += _cursor_values("%Y-%m-%d", 100)
+    custom_converter = CustomFormatConcurrentStreamStateConverter(
+        "%Y-%m-%dT%H:%M:%SZ", input_formats
+    )
+
+    start = time.perf_counter()
+    for value in iso_values:
+        iso_converter.parse_timestamp(value)
+    iso_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in iso_values:
+        parser.parse(value)
+    dateutil_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in custom_values:
+        custom_converter.parse_timestamp(value)
+    custom_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for value in custom_values:
+        for input_format in input_formats:
+            try:
+                datetime.strptime(value, input_format)
+                break
+            except ValueError:
+                pass
+    strptime_duration = time.perf_counter() - start
+
+    print(
+        f"Per value: {iso_duration / number_of_values * 1e6:.2f} µs with the ISO millis converter, "
+        f"{dateutil_duration / number_of_values * 1e6:.2f} µs with dateutil alone, "
+        f"{custom_duration / number_of_values * 1e6:.2f} µs with the custom format converter, "
+        f"{strptime_duration / number_of_values * 1e6:.2f} µs trying each format with strptime"
+    )
@@ -9,6 +9,7 @@ from unittest.mock import Mock
 import pytest
 
 from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.concurrent.partitions.types import (
@@ -23,13 +24,20 @@ _RECORDS = [
 ]
 
 
+def _a_cursor() -> Mock:
+    cursor = Mock(spec=Cursor)
+    cursor.extract_cursor_value.side_effect = lambda record: record.data.get("id")
+    return cursor
+
+
 class PartitionReaderTest(unittest.TestCase):
     def setUp(self) -> None:
         self._queue: Queue[QueueItem] = Queue()
+        self._cursor = _a_cursor()
         self._partition_reader = PartitionReader(self._queue)
 
     def test_given_no_records_when_process_partition_then_only_emit_sentinel(self):
-        self._partition_reader.process_partition(self._a_partition([]))
+        self._partition_reader.process_partition(self._a_partition([]), self._cursor)
 
         while queue_item := self._queue.get():
             if not isinstance(queue_item, PartitionCompleteSentinel):
@@ -40,11 +48,26 @@ class PartitionReaderTest(unittest.TestCase):
         self,
     ):
         partition = self._a_partition(_RECORDS)
-        self._partition_reader.process_partition(partition)
+        self._partition_reader.process_partition(partition, self._cursor)
 
         queue_content = self._consume_queue()
 
         assert queue_content == _RECORDS + [PartitionCompleteSentinel(partition)]
+        assert queue_content[-1].most_recent_record is _RECORDS[1]
+        self._cursor.observe.assert_not_called()
+        self._cursor.close_partition.assert_not_called()
+
+    def test_given_records_without_cursor_value_when_process_partition_then_sentinel_has_most_recent_record(
+        self,
+    ):
+        records = [
+            Record({"id": 2}, "stream"),
+            Record({"name": "no cursor value"}, "stream"),
+            Record({"id": 1}, "stream"),
+        ]
+        self._partition_reader.process_partition(self._a_partition(records), self._cursor)
+
+        assert self._consume_queue()[-1].most_recent_record is records[0]
 
     def test_given_exception_when_process_partition_then_queue_records_and_exception_and_sentinel(
         self,
@@ -52,7 +75,7 @@ class PartitionReaderTest(unittest.TestCase):
         partition = Mock()
         exception = ValueError()
         partition.read.side_effect = self._read_with_exception(_RECORDS, exception)
-        self._partition_reader.process_partition(partition)
+        self._partition_reader.process_partition(partition, self._cursor)
 
         queue_content = self._consume_queue()
 
@@ -83,3 +106,42 @@ class PartitionReaderTest(unittest.TestCase):
             if isinstance(queue_item, PartitionCompleteSentinel):
                 break
         return queue_content
+
+
+def test_given_batch_size_when_process_partition_then_queue_batches_and_sentinel(consume_queue):
+    queue: Queue[QueueItem] = Queue()
+    records = _RECORDS + [Record({"id": 3, "name": "Jill"}, "stream")]
+    partition = Mock(spec=Partition)
+    partition.read.return_value = iter(records)
+
+    PartitionReader(queue, batch_size=2).process_partition(partition, _a_cursor())
+
+    queue_content = consume_queue(queue)
+    assert queue_content == [
+        records[:2],
+        records[2:],
+        PartitionCompleteSentinel(partition),
+    ]
+    assert queue_content[-1].most_recent_record is records[2]
+
+
+def test_given_batch_size_and_exception_when_process_partition_then_queue_pending_batch_before_exception(
+    consume_queue,
+):
+    queue: Queue[QueueItem] = Queue()
+    partition = Mock()
+    exception = ValueError()
+    partition.read.side_effect = PartitionReaderTest._read_with_exception(_RECORDS[:1], exception)
+
+    PartitionReader(queue, batch_size=2).process_partition(partition, _a_cursor())
+
+    assert consume_queue(queue) == [
+        _RECORDS[:1],
+        StreamThreadException(exception, partition.stream_name()),
+        PartitionCompleteSentinel(partition),
+    ]
+
+
+def test_given_invalid_batch_size_when_init_then_raise():
+    with pytest.raises(ValueError):
+        PartitionReader(Queue(), batch_size=0)
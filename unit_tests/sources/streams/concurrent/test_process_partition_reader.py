@@ -0,0 +1,250 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+import datetime
+import logging
+import os
+from queue import Queue
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
+from airbyte_cdk.sources.concurrent_source.stream_thread_exception import StreamThreadException
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.types import (
+    PartitionCompleteSentinel,
+    QueueItem,
+)
+from airbyte_cdk.sources.streams.concurrent.process_partition_reader import (
+    ProcessPartitionFactory,
+    ProcessPartitionReader,
+)
+from airbyte_cdk.sources.types import Record, StreamSlice
+
+_STREAM_NAME = "stream"
+_SLICE = StreamSlice(partition={"parent_id": 1}, cursor_slice={})
+_A_LOG_MESSAGE = AirbyteMessage(
+    type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log from the partition")
+)
+
+
+class _Partition(Partition):
+    def __init__(
+        self,
+        records: List[Mapping[str, Any]],
+        stream_name: str = _STREAM_NAME,
+        stream_slice: Optional[Mapping[str, Any]] = _SLICE,
+        message_repository: Optional[MessageRepository] = None,
+        exception: Optional[Exception] = None,
+        exit_process: bool = False,
+        log: Optional[str] = None,
+    ) -> None:
+        self._records = records
+        self._stream_name = stream_name
+        self._stream_slice = stream_slice
+        self._message_repository = message_repository
+        self._exception = exception
+        self._exit_process = exit_process
+        self._log = log
+
+    def read(self) -> Iterable[Record]:
+        if self._message_repository:
+            self._message_repository.emit_message(_A_LOG_MESSAGE)
+        if self._log:
+            logging.getLogger("airbyte").warning(self._log)
+        for data in self._records:
+            yield Record(data=data, stream_name=self._stream_name, associated_slice=_SLICE)
+        if self._exit_process:
+            os._exit(1)
+        if self._exception:
+            raise self._exception
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return self._stream_slice
+
+    def stream_name(self) -> str:
+        return self._stream_name
+
+    def __hash__(self) -> int:
+        return hash(self._stream_name)
+
+
+class _PartitionFactory(ProcessPartitionFactory):
+    """
+    Creates, in the worker processes, partitions reading the given records. Defined at the module level so that the worker
+    processes can unpickle it.
+    """
+
+    def __init__(
+        self,
+        records: List[Mapping[str, Any]],
+        emit_message: bool = False,
+        exception: Optional[Exception] = None,
+        exit_process: bool = False,
+        log: Optional[str] = None,
+    ) -> None:
+        self._records = records
+        self._emit_message = emit_message
+        self._exception = exception
+        self._exit_process = exit_process
+        self._log = log
+        self._message_repository = InMemoryMessageRepository()
+
+    @property
+    def message_repository(self) -> MessageRepository:
+        return self._message_repository
+
+    def create(self, stream_name: str, stream_slice: Optional[Mapping[str, Any]]) -> Partition:
+        records = [
+            {**data, "stream_name": stream_name, "stream_slice": dict(stream_slice or {})}
+            for data in self._records
+        ]
+        return _Partition(
+            records,
+            stream_name,
+            stream_slice,
+            self._message_repository if self._emit_message else None,
+            self._exception,
+            self._exit_process,
+            self._log,
+        )
+
+
+def _with_partition(
+    records: List[Mapping[str, Any]],
+) -> List[Mapping[str, Any]]:
+    return [{**data, "stream_name": _STREAM_NAME, "stream_slice": dict(_SLICE)} for data in records]
+
+
+def _process_partition(
+    queue: Queue[QueueItem],
+    partition_factory: ProcessPartitionFactory,
+    cursor: Optional[Cursor] = None,
+    message_repository: Optional[MessageRepository] = None,
+    batch_size: int = ProcessPartitionReader.DEFAULT_BATCH_SIZE,
+) -> Partition:
+    partition = _Partition([])
+    if cursor is None:
+        cursor = Mock(spec=Cursor)
+        cursor.extract_cursor_value.return_value = None
+    partition_reader = ProcessPartitionReader(
+        queue,
+        message_repository or InMemoryMessageRepository(),
+        partition_factory,
+        max_workers=1,
+        batch_size=batch_size,
+    )
+    try:
+        partition_reader.process_partition(partition, cursor)
+    finally:
+        partition_reader.shutdown()
+    return partition
+
+
+@pytest.fixture
+def queue() -> Queue[QueueItem]:
+    return Queue()
+
+
+def test_given_records_when_process_partition_then_queue_batches_and_sentinel(queue, consume_queue):
+    records = [{"id": 1, "values": [1.5, None, "é"]}, {"id": 2}, {"id": 3}]
+
+    partition = _process_partition(queue, _PartitionFactory(records), batch_size=2)
+
+    content = consume_queue(queue)
+    assert [[record.data for record in batch] for batch in content[:-1]] == [
+        _with_partition(records[:2]),
+        _with_partition(records[2:]),
+    ]
+    assert all(record.associated_slice == _SLICE for record in content[0])
+    assert all(record.stream_name == _STREAM_NAME for record in content[0])
+    assert content[-1] == PartitionCompleteSentinel(partition)
+    assert content[-1].is_successful
+
+
+def test_given_values_not_supported_by_json_when_process_partition_then_records_are_unchanged(
+    queue, consume_queue
+):
+    records = [{"id": 1, "updated_at": datetime.datetime(2024, 1, 1), 2: "non string key"}]
+
+    _process_partition(queue, _PartitionFactory(records))
+
+    assert [record.data for record in consume_queue(queue)[0]] == _with_partition(records)
+
+
+def test_given_exception_when_process_partition_then_queue_records_exception_and_sentinel(
+    queue, consume_queue
+):
+    _process_partition(queue, _PartitionFactory([{"id": 1}], exception=ValueError("an error")))
+
+    content = consume_queue(queue)
+    assert [record.data for record in content[0]] == _with_partition([{"id": 1}])
+    assert isinstance(content[1], StreamThreadException)
+    assert isinstance(content[1].exception, ValueError)
+    assert str(content[1].exception) == "an error"
+    assert not content[2].is_successful
+
+
+def test_given_process_exits_unexpectedly_when_process_partition_then_queue_exception(
+    queue, consume_queue
+):
+    _process_partition(queue, _PartitionFactory([], exit_process=True))
+
+    content = consume_queue(queue)
+    assert isinstance(content[0], StreamThreadException)
+    assert not content[1].is_successful
+
+
+def test_given_messages_emitted_in_process_when_process_partition_then_emit_them_in_main_process(
+    queue, consume_queue
+):
+    message_repository = InMemoryMessageRepository()
+
+    _process_partition(
+        queue,
+        _PartitionFactory([{"id": 1}], emit_message=True),
+        message_repository=message_repository,
+    )
+
+    consume_queue(queue)
+    assert list(message_repository.consume_queue()) == [_A_LOG_MESSAGE]
+
+
+def test_given_logs_in_process_when_process_partition_then_emit_them_in_main_process_instead_of_printing_them(
+    queue, consume_queue, capfd
+):
+    message_repository = InMemoryMessageRepository()
+
+    _process_partition(
+        queue,
+        _PartitionFactory([{"id": 1}], log="a log from the worker process"),
+        message_repository=message_repository,
+    )
+
+    consume_queue(queue)
+    assert list(message_repository.consume_queue()) == [
+        AirbyteMessage(
+            type=Type.LOG,
+            log=AirbyteLogMessage(level=Level.WARN, message="a log from the worker process"),
+        )
+    ]
+    assert "a log from the worker process" not in capfd.readouterr().out
+
+
+def test_given_records_when_process_partition_then_sentinel_has_most_recent_record(
+    queue, consume_queue
+):
+    cursor = Mock(spec=Cursor)
+    cursor.extract_cursor_value.side_effect = lambda record: record.data["id"]
+    records = [{"id": 1}, {"id": 3}, {"id": 2}]
+
+    _process_partition(queue, _PartitionFactory(records), cursor=cursor, batch_size=2)
+
+    content = consume_queue(queue)
+    assert content[-1].most_recent_record is content[0][1]
+    assert content[-1].most_recent_record.data == _with_partition(records)[1]
+    cursor.observe.assert_not_called()
@@ -24,15 +24,11 @@ from airbyte_cdk.models import (
     SyncMode,
 )
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.concurrent_source.concurrent_read_processor import ConcurrentReadProcessor
-from airbyte_cdk.sources.concurrent_source.thread_pool_manager import ThreadPoolManager
 from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
 from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, FinalStateCursor
-from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
-from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
 from airbyte_cdk.sources.streams.core import CheckpointMixin, StreamData
 from airbyte_cdk.sources.types import Record
@@ -601,27 +597,15 @@ def test_concurrent_incremental_read_two_slices():
         internal_config,
     )
 
-    handler = ConcurrentReadProcessor(
-        [stream],
-        Mock(spec=PartitionEnqueuer),
-        Mock(spec=ThreadPoolManager),
-        logger,
-        slice_logger,
-        message_repository,
-        Mock(spec=PartitionReader),
-    )
-
     for record in expected_records:
         assert record in actual_records
 
-    # We need run on_record to update cursor with record cursor value
+    # Records are observed by the cursor when their partition is completed so we need to observe them to update cursor with record cursor value
     for record in actual_records:
-        list(
-            handler.on_record(
-                Record(
-                    data=record,
-                    stream_name="__mock_stream",
-                )
+        cursor.observe(
+            Record(
+                data=record,
+                stream_name="__mock_stream",
             )
         )
 
@@ -25,10 +25,14 @@ from airbyte_cdk.models import Type as MessageType
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
 from airbyte_cdk.sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
-from airbyte_cdk.sources.message import InMemoryMessageRepository
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
 from airbyte_cdk.sources.streams import Stream
-from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade, StreamPartition
 from airbyte_cdk.sources.streams.concurrent.cursor import FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.process_partition_reader import (
+    ProcessPartitionFactory,
+)
 from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.utils import AirbyteTracedException
 from unit_tests.sources.streams.concurrent.scenarios.thread_based_concurrent_stream_source_builder import (
@@ -91,12 +95,39 @@ class _MockSource(AbstractSource):
         return self._streams
 
 
+class _MockProcessPartitionFactory(ProcessPartitionFactory):
+    def __init__(self, stream_slice_to_partitions):
+        self._stream_slice_to_partitions = stream_slice_to_partitions
+        self._message_repository = InMemoryMessageRepository()
+
+    @property
+    def message_repository(self) -> MessageRepository:
+        return self._message_repository
+
+    def create(self, stream_name: str, stream_slice: Optional[Mapping[str, Any]]) -> Partition:
+        stream_index = int(stream_name.removeprefix("stream"))
+        return StreamPartition(
+            _MockStream(self._stream_slice_to_partitions[stream_index], stream_name),
+            stream_slice,
+            self._message_repository,
+            SyncMode.full_refresh,
+            None,
+            None,
+        )
+
+
 class _MockConcurrentSource(ConcurrentSourceAdapter):
     message_repository = InMemoryMessageRepository()
 
-    def __init__(self, logger):
+    def __init__(self, logger, record_batch_size=1, process_partition_factory=None):
         concurrent_source = ConcurrentSource.create(
-            1, 1, logger, NeverLogSliceLogger(), self.message_repository
+            1,
+            1,
+            logger,
+            NeverLogSliceLogger(),
+            self.message_repository,
+            record_batch_size=record_batch_size,
+            process_partition_factory=process_partition_factory,
         )
         super().__init__(concurrent_source)
 
@@ -345,6 +376,53 @@ def test_concurrent_source_yields_the_same_messages_as_abstract_source_when_an_e
     _assert_errors(messages_from_abstract_source, messages_from_concurrent_source)
 
 
+@freezegun.freeze_time("2020-01-01T00:00:00")
+def test_concurrent_source_with_record_batches_yields_the_same_messages_as_without_batches():
+    stream_slice_to_partition = {
+        "1": [{"id": i, "partition": "1"} for i in range(5)],
+        "2": [{"id": i, "partition": "2"} for i in range(5, 7)],
+    }
+    logger = _init_logger()
+    source = _init_source([stream_slice_to_partition], None, logger, _MockConcurrentSource(logger))
+    batched_source = _init_source(
+        [stream_slice_to_partition],
+        None,
+        logger,
+        _MockConcurrentSource(logger, record_batch_size=2),
+    )
+    catalog = _create_configured_catalog(source._streams)
+
+    messages = _read_from_source(source, logger, {}, catalog, None, None)
+    messages_with_batches = _read_from_source(batched_source, logger, {}, catalog, None, None)
+
+    assert messages_with_batches == messages
+
+
+@freezegun.freeze_time("2020-01-01T00:00:00")
+def test_concurrent_source_reading_partitions_in_processes_yields_the_same_messages_as_threads():
+    stream_slice_to_partition = {
+        "1": [{"id": i, "partition": "1"} for i in range(5)],
+        "2": [{"id": i, "partition": "2"} for i in range(5, 7)],
+    }
+    logger = _init_logger()
+    source = _init_source([stream_slice_to_partition], None, logger, _MockConcurrentSource(logger))
+    process_source = _init_source(
+        [stream_slice_to_partition],
+        None,
+        logger,
+        _MockConcurrentSource(
+            logger,
+            process_partition_factory=_MockProcessPartitionFactory([stream_slice_to_partition]),
+        ),
+    )
+    catalog = _create_configured_catalog(source._streams)
+
+    messages = _read_from_source(source, logger, {}, catalog, None, None)
+    messages_from_processes = _read_from_source(process_source, logger, {}, catalog, None, None)
+
+    assert messages_from_processes == messages
+
+
 def _assert_status_messages(messages_from_abstract_source, messages_from_concurrent_source):
     status_from_concurrent_source = [
         message
@@ -94,3 +94,19 @@ def test_state_message_to_message(test_name, data):
     schema = {}
     with pytest.raises(ValueError):
         stream_data_to_airbyte_message(STREAM_NAME, data, transformer, schema)
+
+
+@pytest.mark.parametrize(
+    "owned, data_is_emitted_as_is",
+    [
+        pytest.param(True, True, id="test_owned_data_is_not_copied"),
+        pytest.param(False, False, id="test_data_not_owned_is_copied"),
+    ],
+)
+def test_owned_data_to_airbyte_record(owned, data_is_emitted_as_is):
+    data = {"id": 0, "field_A": 1.0}
+
+    message = stream_data_to_airbyte_message(STREAM_NAME, data, owned=owned)
+
+    assert message.record.data == data
+    assert (message.record.data is data) == data_is_emitted_as_is
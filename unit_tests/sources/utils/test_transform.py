@@ -2,9 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
 
 import pytest
+from jsonschema import RefResolutionError
 
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
@@ -385,3 +387,105 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+RECURSIVE_SCHEMA = {
+    "type": "object",
+    "properties": {"root": {"$ref": "#/definitions/node"}},
+    "definitions": {
+        "node": {
+            "type": ["null", "object"],
+            "properties": {
+                "value": {"type": "integer"},
+                "children": {"type": "array", "items": {"$ref": "#/definitions/node"}},
+            },
+        }
+    },
+}
+
+
+def _transform_with_jsonschema_traversal(transformer, record, schema):
+    transformer._compile = lambda schema: None
+    transformer.transform(record, schema)
+
+
+@pytest.mark.parametrize(
+    "schema, record",
+    [
+        pytest.param(
+            RECURSIVE_SCHEMA,
+            {"root": {"value": "1", "children": [{"value": 2.0}, None, {"value": "a"}]}},
+            id="recursive_schema",
+        ),
+        pytest.param(
+            COMPLEX_SCHEMA,
+            {
+                "value": "no",
+                "int_prop": "12",
+                "nested": {"a": 1},
+                "array": [1, {"a": 1}],
+                "list_of_lists": [[1, None], "a", 1],
+                "too_many_types": 1,
+            },
+            id="complex_schema",
+        ),
+        pytest.param(
+            {
+                "type": "object",
+                "properties": {"nested": {"$id": "http://example.com/nested", "type": "string"}},
+            },
+            {"nested": 1},
+            id="unsupported_nested_id",
+        ),
+    ],
+)
+def test_compiled_schema_normalizes_and_warns_like_jsonschema_traversal(schema, record, caplog):
+    expected_record = copy.deepcopy(record)
+    _transform_with_jsonschema_traversal(
+        TypeTransformer(TransformConfig.DefaultSchemaNormalization), expected_record, schema
+    )
+    expected_warnings = [log.message for log in caplog.records]
+    caplog.clear()
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == expected_record
+    assert [log.message for log in caplog.records] == expected_warnings
+
+
+def test_given_unresolvable_reference_without_value_when_transform_then_record_is_normalized():
+    schema = {
+        "type": "object",
+        "properties": {"value": {"type": "string"}, "missing": {"$ref": "#/definitions/missing"}},
+    }
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    record = {"value": 1}
+    transformer.transform(record, schema)
+    assert record == {"value": "1"}
+
+    with pytest.raises(RefResolutionError):
+        transformer.transform({"missing": 1}, schema)
+
+
+def test_given_equal_schemas_when_transform_then_schema_is_compiled_once(mocker):
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+    compile_spy = mocker.spy(transformer, "_compile")
+
+    for _ in range(3):
+        record = {"value": 12}
+        transformer.transform(record, copy.deepcopy(SIMPLE_SCHEMA))
+        assert record == {"value": "12"}
+
+    assert compile_spy.call_count == 1
+
+
+def test_custom_transform_registered_after_schema_is_compiled():
+    transformer = TypeTransformer(TransformConfig.CustomSchemaNormalization)
+    transformer.transform({"value": 12}, SIMPLE_SCHEMA)
+
+    transformer.registerCustomTransform(lambda instance, schema: "transformed")
+    record = {"value": 12}
+    transformer.transform(record, SIMPLE_SCHEMA)
+
+    assert record == {"value": "transformed"}
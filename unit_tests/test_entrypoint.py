@@ -3,6 +3,7 @@
 #
 
 import os
+import time
 from argparse import Namespace
 from collections import defaultdict
 from copy import deepcopy
@@ -25,6 +26,7 @@ from airbyte_cdk.models import (
     AirbyteMessage,
     AirbyteMessageSerializer,
     AirbyteRecordMessage,
+    AirbyteRecordMessageFileReference,
     AirbyteStateBlob,
     AirbyteStateMessage,
     AirbyteStateStats,
@@ -791,3 +793,139 @@ def test_given_serialization_error_using_orjson_then_fallback_on_json(
     # There will be multiple messages here because the fixture `entrypoint` sets a control message. We only care about records here
     record_messages = list(filter(lambda message: "RECORD" in message, messages))
     assert len(record_messages) == 2
+
+
+def test_airbyte_message_to_bytes_matches_string_serialization():
+    record = AirbyteMessage(
+        record=AirbyteRecordMessage(stream="stream", data={"data": "é stuff"}, emitted_at=1),
+        type=Type.RECORD,
+    )
+
+    assert (
+        AirbyteEntrypoint.airbyte_message_to_bytes(record)
+        == AirbyteEntrypoint.airbyte_message_to_string(record).encode()
+    )
+
+
+def test_given_buffered_output_when_launch_then_write_bytes_and_flush_on_state(mocker):
+    record = AirbyteMessage(
+        record=AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1),
+        type=Type.RECORD,
+    )
+    state = AirbyteMessage(
+        type=Type.STATE,
+        state=AirbyteStateMessage(
+            type=AirbyteStateType.STREAM,
+            stream=AirbyteStreamState(
+                stream_descriptor=StreamDescriptor(name="stream"),
+                stream_state=AirbyteStateBlob(updated_at="2024-02-02"),
+            ),
+        ),
+    )
+    mocker.patch.object(AirbyteEntrypoint, "run_messages", return_value=[record, state, record])
+    print_buffer = mocker.patch.object(entrypoint_module, "PRINT_BUFFER")
+
+    with mock.patch.dict(os.environ, {"AIRBYTE_BUFFERED_OUTPUT": "true"}):
+        entrypoint_module.launch(MockSource(), ["spec"])
+
+    assert print_buffer.write_line.call_args_list == [
+        mock.call(AirbyteEntrypoint.airbyte_message_to_bytes(record), flush=False),
+        mock.call(AirbyteEntrypoint.airbyte_message_to_bytes(state), flush=True),
+        mock.call(AirbyteEntrypoint.airbyte_message_to_bytes(record), flush=False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        pytest.param(
+            AirbyteRecordMessage(stream="stream", data={"data": "stuff"}, emitted_at=1),
+            id="test_record_without_namespace",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream='a "quoted" stream',
+                data={"nested": {"list": [1, 2.5, None, True]}, "unicode": "é"},
+                emitted_at=1,
+                namespace="public",
+            ),
+            id="test_record_with_namespace_and_nested_data",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"null_field": None, "nested": {"null_field": None}, "field": 0},
+                emitted_at=1,
+            ),
+            id="test_record_with_top_level_null_field",
+        ),
+        pytest.param(
+            AirbyteRecordMessage(
+                stream="stream",
+                data={"data": "stuff"},
+                emitted_at=1,
+                file_reference=AirbyteRecordMessageFileReference(
+                    staging_file_url="/staging/file.csv",
+                    source_file_relative_path="file.csv",
+                    file_size_bytes=10,
+                ),
+            ),
+            id="test_record_with_file_reference_uses_serializer",
+        ),
+    ],
+)
+def test_record_serialization_is_byte_compatible_with_serializer(record):
+    message = AirbyteMessage(type=Type.RECORD, record=record)
+
+    assert AirbyteEntrypoint.airbyte_message_to_bytes(message) == orjson.dumps(
+        AirbyteMessageSerializer.dump(message)
+    )
+
+
+@pytest.mark.slow
+def test_record_serialization_benchmark():
+    """
+    Reports the records/sec of the fast path and of AirbyteMessageSerializer. Timings vary too much between machines to be
+    asserted on.
+    """
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(
+            stream="stream",
+            data={f"column_{i}": f"value_{i}" for i in range(50)},
+            emitted_at=1,
+        ),
+    )
+    number_of_records = 20_000
+
+    start = time.perf_counter()
+    for _ in range(number_of_records):
+        serializer_bytes = orjson.dumps(AirbyteMessageSerializer.dump(message))
+    serializer_records_per_second = number_of_records / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(number_of_records):
+        fast_path_bytes = AirbyteEntrypoint.airbyte_message_to_bytes(message)
+    fast_path_records_per_second = number_of_records / (time.perf_counter() - start)
+
+    print(
+        f"serializer: {serializer_records_per_second:.0f} records/s, fast path: {fast_path_records_per_second:.0f} records/s"
+    )
+    assert fast_path_bytes == serializer_bytes
+
+
+def test_given_plain_record_when_airbyte_message_to_bytes_then_serializer_is_not_used():
+    message = AirbyteMessage(
+        type=Type.RECORD,
+        record=AirbyteRecordMessage(
+            stream="stream",
+            data={f"column_{i}": f"value_{i}" for i in range(50)},
+            emitted_at=1,
+        ),
+    )
+    expected_bytes = orjson.dumps(AirbyteMessageSerializer.dump(message))
+
+    with patch.object(entrypoint_module, "AirbyteMessageSerializer") as serializer:
+        assert AirbyteEntrypoint.airbyte_message_to_bytes(message) == expected_bytes
+
+    serializer.dump.assert_not_called()
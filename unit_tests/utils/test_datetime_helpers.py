@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 import freezegun
 import pytest
+from dateutil import parser
 
 from airbyte_cdk.utils.datetime_helpers import (
     AirbyteDateTime,
@@ -172,6 +173,33 @@ def test_parse(input_value, expected_output, error_type, error_match):
         assert ab_datetime_try_parse(input_value) and ab_datetime_try_parse(input_value) == dt
 
 
+@pytest.mark.parametrize(
+    "input_value",
+    [
+        "2023-03-14T15:09:26Z",
+        "2023-03-14 15:09:26",
+        "2023-03-14T15:09:26.123Z",
+        "2023-03-14T15:09:26.123456789+00:00",
+        "2023-03-14T15:09:26-00:00",
+        "2023-03-14T15:09:26.5+05:30",
+        "2023-03-14T15:09:26-08:00",
+        "2024-02-29T23:59:59.999999Z",
+    ],
+)
+def test_rfc3339_parse_matches_dateutil(input_value):
+    """Test that RFC3339 strings parsed without dateutil give the same result as dateutil."""
+    expected = parser.parse(input_value)
+    if expected.tzinfo is None:
+        expected = expected.replace(tzinfo=timezone.utc)
+
+    dt = ab_datetime_parse(input_value)
+
+    assert dt == expected
+    assert dt.utcoffset() == expected.utcoffset()
+    assert dt.tzname() == expected.tzname()
+    assert str(dt) == str(AirbyteDateTime.from_datetime(expected))
+
+
 @pytest.mark.parametrize(
     "input_dt,expected_output",
     [
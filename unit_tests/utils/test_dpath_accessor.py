@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+import dpath
+import pytest
+
+from airbyte_cdk.utils.dpath_accessor import DpathAccessor
+
+DOCUMENT = {
+    "data": [{"id": 1, "tags": ["a", "b"]}, {"id": 2, "tags": []}, "not an object"],
+    "meta": {"page": {"next": "cursor"}, "": "empty key", "0": "zero"},
+    "list_of_lists": [[1, 2], [3]],
+}
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param(["data"], id="key"),
+        pytest.param(["meta", "page", "next"], id="nested_keys"),
+        pytest.param("meta/page/next", id="string_path"),
+        pytest.param("/meta/page", id="string_path_with_leading_separator"),
+        pytest.param(["data", "0", "id"], id="string_index"),
+        pytest.param(["data", 1, "id"], id="integer_index"),
+        pytest.param(["data", "-1"], id="negative_index"),
+        pytest.param(["data", "3"], id="index_out_of_range"),
+        pytest.param(["meta", "0"], id="numeric_key"),
+        pytest.param(["meta", ""], id="empty_key"),
+        pytest.param(["data", "2", "id"], id="key_of_leaf"),
+        pytest.param(["missing", "id"], id="missing_key"),
+        pytest.param(["data", "*", "id"], id="wildcard"),
+        pytest.param(["data", "*", "tags", "*"], id="many_wildcards"),
+        pytest.param(["list_of_lists", "*", "*"], id="wildcard_on_lists"),
+        pytest.param(["meta", "*"], id="wildcard_on_object"),
+        pytest.param(["data", "*", "missing"], id="wildcard_without_match"),
+        pytest.param(["data", "**", "id"], id="unsupported_recursive_glob"),
+        pytest.param(["me?a", "page"], id="unsupported_glob"),
+        pytest.param([], id="empty_path"),
+    ],
+)
+def test_accessor_behaves_like_dpath(path):
+    accessor = DpathAccessor(path)
+
+    assert accessor.values(DOCUMENT) == dpath.values(DOCUMENT, path)
+    assert _dpath_result(lambda: accessor.get(DOCUMENT, default="default")) == _dpath_result(
+        lambda: dpath.get(DOCUMENT, path, default="default")
+    )
+    assert _dpath_result(lambda: accessor.get(DOCUMENT)) == _dpath_result(
+        lambda: dpath.get(DOCUMENT, path)
+    )
+
+
+def _dpath_result(get):
+    try:
+        return get()
+    except (KeyError, ValueError) as exception:
+        return type(exception)
+
+
+def test_given_many_matches_when_get_then_raise_value_error():
+    with pytest.raises(ValueError):
+        DpathAccessor(["data", "*", "id"]).get(DOCUMENT, default=None)
+
+
+def test_given_no_match_and_no_default_when_get_then_raise_key_error():
+    with pytest.raises(KeyError):
+        DpathAccessor(["data", "0", "missing"]).get(DOCUMENT)
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+#
+
+import io
+import sys
+from unittest import mock
+
+import pytest
+
+from airbyte_cdk.utils import PrintBuffer
+
+
+@pytest.fixture
+def stdout():
+    binary = io.BytesIO()
+    text = io.TextIOWrapper(binary, encoding="utf-8")
+    with mock.patch.object(sys, "__stdout__", text):
+        yield binary
+
+
+def test_given_interval_not_elapsed_when_write_line_then_do_not_flush(stdout):
+    print_buffer = PrintBuffer(flush_interval=3600)
+
+    print_buffer.write_line(b'{"type":"RECORD"}')
+
+    assert stdout.getvalue() == b""
+
+
+def test_given_flush_requested_when_write_line_then_flush_everything_in_order(stdout):
+    print_buffer = PrintBuffer(flush_interval=3600)
+
+    print_buffer.write("a log\n")
+    print_buffer.write_line(b'{"type":"RECORD"}')
+    print_buffer.write_line(b'{"type":"STATE"}', flush=True)
+
+    assert stdout.getvalue() == b'a log\n{"type":"RECORD"}\n{"type":"STATE"}\n'
+
+
+def test_given_buffer_exceeds_max_size_when_write_line_then_flush(stdout):
+    print_buffer = PrintBuffer(flush_interval=3600, max_buffer_size=10)
+
+    print_buffer.write_line(b"12345")
+    assert stdout.getvalue() == b""
+
+    print_buffer.write_line(b"67890")
+    assert stdout.getvalue() == b"12345\n67890\n"
+
+
+def test_given_stdout_without_binary_buffer_when_flush_then_write_text():
+    text = io.StringIO()
+    print_buffer = PrintBuffer(flush_interval=3600)
+
+    with mock.patch.object(sys, "__stdout__", text):
+        print_buffer.write_line("é".encode())
+        print_buffer.flush()
+
+    assert text.getvalue() == "é\n"